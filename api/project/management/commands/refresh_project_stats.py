@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from api.project.services import ProjectService
+
+
+class Command(BaseCommand):
+    """
+    프로젝트의 자료 개수/마지막 활동 시각 backfill 및 복구
+
+    Example:
+        python manage.py refresh_project_stats
+        python manage.py refresh_project_stats --project-id 1 --project-id 2
+    """
+
+    help = "프로젝트의 material_count, last_activity_at을 자료 테이블 기준으로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project-id",
+            type=int,
+            action="append",
+            dest="project_ids",
+            help="갱신할 프로젝트 ID (여러 번 지정 가능, 생략하면 전체)",
+        )
+
+    def handle(self, *args, **options):
+        updated = ProjectService.refresh_activity_stats(options["project_ids"])
+        self.stdout.write(self.style.SUCCESS(f"{updated}개 프로젝트 갱신 완료"))
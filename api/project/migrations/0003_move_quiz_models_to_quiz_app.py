@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:24
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0002_quiz_quizquestions_quizanswerhistory'),
+        ('quiz', '0001_initial'),
+    ]
+
+    # Quiz 모델들은 quiz 앱으로 이동 (테이블은 그대로 유지)
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveField(
+                    model_name='quizquestions',
+                    name='quiz',
+                ),
+                migrations.RemoveField(
+                    model_name='quizanswerhistory',
+                    name='quiz_question',
+                ),
+                migrations.RemoveField(
+                    model_name='quizanswerhistory',
+                    name='user',
+                ),
+                migrations.DeleteModel(
+                    name='Quiz',
+                ),
+                migrations.DeleteModel(
+                    name='QuizQuestions',
+                ),
+                migrations.DeleteModel(
+                    name='QuizAnswerHistory',
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:45
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, IntegerField, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_activity_stats(apps, schema_editor):
+    """기존 자료로 material_count, last_activity_at 계산 (자료가 없으면 updated_at)"""
+    Project = apps.get_model("project", "Project")
+    Material = apps.get_model("project", "Material")
+
+    materials = Material.objects.filter(project=OuterRef("pk")).order_by()
+    Project.objects.update(
+        material_count=Coalesce(
+            Subquery(
+                materials.values("project").annotate(count=Count("id")).values("count"),
+                output_field=IntegerField(),
+            ),
+            0,
+        ),
+        last_activity_at=Coalesce(
+            Subquery(
+                materials.values("project").annotate(last=Max("created_at")).values("last")
+            ),
+            F("updated_at"),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0003_move_quiz_models_to_quiz_app'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='last_activity_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='Last Activity At'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='material_count',
+            field=models.IntegerField(default=0, verbose_name='Material Count'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', '-last_activity_at', '-id'], name='project_user_activity_idx'),
+        ),
+        migrations.RunPython(backfill_activity_stats, migrations.RunPython.noop),
+    ]
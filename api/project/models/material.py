@@ -42,6 +42,13 @@ class Material(models.Model):
     class Meta:
         db_table = "materials"
         ordering = ["-created_at"]
+        indexes = [
+            # 프로젝트 자료 목록 (최근 순 커서 페이지네이션, 퀴즈 목록의 자료 미리보기)
+            models.Index(
+                fields=["project", "-created_at", "-id"],
+                name="material_project_recent_idx",
+            ),
+        ]
         verbose_name = "Material"
         verbose_name_plural = "Materials"
 
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 from api.user.models import User
 
@@ -15,12 +16,24 @@ class Project(models.Model):
     color = models.CharField(
         max_length=7, default="#3B82F6", verbose_name="Color"
     )  # hex color
+    # 목록 조회용 비정규화 값 (MaterialService에서 자료 생성/삭제 시 갱신)
+    material_count = models.IntegerField(default=0, verbose_name="Material Count")
+    ## 가장 최근 자료 업로드 시각 (자료가 없으면 프로젝트 생성/수정 시각)
+    last_activity_at = models.DateTimeField(
+        default=timezone.now, verbose_name="Last Activity At"
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created At")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated At")
 
     class Meta:
         db_table = "projects"
         ordering = ["-updated_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "-last_activity_at", "-id"],
+                name="project_user_activity_idx",
+            ),
+        ]
         verbose_name = "Project"
         verbose_name_plural = "Projects"
 
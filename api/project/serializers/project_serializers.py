@@ -15,11 +15,17 @@ class ProjectSerializer(serializers.ModelSerializer):
 class ProjectListSerializer(serializers.ModelSerializer):
     """
     과목 목록 Serializer
-    자료 개수와 마지막 활동 날짜를 포함
+    자료 개수와 마지막 활동 날짜를 포함 (Project의 비정규화 컬럼 사용)
     """
 
-    material_count = serializers.SerializerMethodField(help_text="학습 자료 개수")
-    last_activity_date = serializers.SerializerMethodField(help_text="마지막 활동 날짜")
+    material_count = serializers.IntegerField(
+        read_only=True, help_text="학습 자료 개수"
+    )
+    last_activity_date = serializers.DateTimeField(
+        source="last_activity_at",
+        read_only=True,
+        help_text="마지막 활동 날짜 (가장 최근 자료 업로드 날짜)",
+    )
 
     class Meta:
         model = Project
@@ -33,15 +39,6 @@ class ProjectListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at"]
 
-    def get_material_count(self, obj):
-        """해당 과목의 학습 자료 개수 반환"""
-        return obj.materials.count()
-
-    def get_last_activity_date(self, obj):
-        """해당 과목의 마지막 활동 날짜 (가장 최근 자료 업로드 날짜) 반환"""
-        last_material = obj.materials.first()  # ordering = ['-created_at']
-        return last_material.created_at if last_material else obj.updated_at
-
 
 class ProjectCreateSerializer(serializers.ModelSerializer):
     """과목 생성 Serializer"""
@@ -1,8 +1,10 @@
-import os
+import hashlib
 import uuid
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 
 from django.db import transaction
+from django.db.models import Count, F, IntegerField, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
 from django.shortcuts import get_object_or_404
 
 from api.project.exceptions import ProjectExceptions
@@ -95,14 +97,67 @@ class ProjectService:
             user: 사용자 객체
 
         Returns:
-            프로젝트 목록 (최근 수정일 기준 정렬)
+            프로젝트 목록 (자료 개수와 마지막 활동 시각은 비정규화 컬럼 사용)
         """
-        return Project.objects.filter(user=user).prefetch_related("materials")
+        return Project.objects.filter(user=user)
+
+    @staticmethod
+    def refresh_activity_stats(project_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        프로젝트의 자료 개수/마지막 활동 시각을 자료 테이블 기준으로 다시 계산
+
+        자료 삭제 시와 backfill/복구 명령(refresh_project_stats)에서 사용하며,
+        프로젝트 목록을 UPDATE 한 번으로 갱신합니다.
+
+        Args:
+            project_ids: 갱신할 프로젝트 ID 목록 (None이면 전체)
+
+        Returns:
+            갱신된 프로젝트 수
+        """
+        materials = Material.objects.filter(project=OuterRef("pk")).order_by()
+        material_count = materials.values("project").annotate(count=Count("id"))
+        last_created_at = materials.values("project").annotate(last=Max("created_at"))
+
+        projects = Project.objects.all()
+        if project_ids is not None:
+            projects = projects.filter(id__in=list(project_ids))
+
+        return projects.update(
+            material_count=Coalesce(
+                Subquery(material_count.values("count"), output_field=IntegerField()),
+                0,
+            ),
+            last_activity_at=Coalesce(
+                Subquery(last_created_at.values("last")), F("updated_at")
+            ),
+        )
 
 
 class MaterialService:
     """학습 자료 관련 비즈니스 로직 처리"""
 
+    @staticmethod
+    def _increase_material_count(project: Project, materials: List[Material]) -> None:
+        """
+        자료 생성 후 프로젝트의 자료 개수/마지막 활동 시각 갱신
+
+        동시 업로드에서도 값이 어긋나지 않도록 F 표현식으로 DB에서 계산합니다.
+
+        Args:
+            project: 프로젝트 객체
+            materials: 생성된 자료 목록
+        """
+        if not materials:
+            return
+        Project.objects.filter(id=project.id).update(
+            material_count=F("material_count") + len(materials),
+            last_activity_at=Greatest(
+                F("last_activity_at"),
+                max(material.created_at for material in materials),
+            ),
+        )
+
     @staticmethod
     @transaction.atomic
     def create_material_single(
@@ -151,6 +206,7 @@ class MaterialService:
                 url=url,
                 thumbnail_url=thumbnail_url,
             )
+            MaterialService._increase_material_count(project, [material])
             return material
 
         elif material_type == MaterialType.FILE:
@@ -202,8 +258,10 @@ class MaterialService:
                 metadata={
                     "file_size": file_size,
                     "s3_key": s3_key,
+                    "content_hash": hashlib.sha256(file_data).hexdigest(),
                 },
             )
+            MaterialService._increase_material_count(project, [material])
             return material
 
         else:
@@ -283,6 +341,7 @@ class MaterialService:
                 )
                 created_materials.append(material)
 
+        MaterialService._increase_material_count(project, created_materials)
         return created_materials
 
     @staticmethod
@@ -320,6 +379,7 @@ class MaterialService:
             page_count=page_count,
             thumbnail_url=thumbnail_url,
         )
+        MaterialService._increase_material_count(project, [material])
 
         # 파일 타입인 경우 파일 업로드 처리
         if material_type == MaterialType.FILE and files:
@@ -401,6 +461,7 @@ class MaterialService:
         return material
 
     @staticmethod
+    @transaction.atomic
     def delete_material(material_id: int, user: User) -> None:
         """
         학습 자료 삭제
@@ -410,14 +471,66 @@ class MaterialService:
             user: 사용자 객체
         """
         material = MaterialService.get_material(material_id, user)
-
-        # 파일 삭제 (실제 파일 시스템에서도 삭제)
-        for file in material.files.all():
-            if file.file and os.path.isfile(file.file.path):
-                os.remove(file.file.path)
+        project_id = material.project_id
 
         material.delete()
 
+        # 삭제된 자료가 가장 최근 자료였을 수 있으므로 남은 자료 기준으로 다시 계산
+        ProjectService.refresh_activity_stats([project_id])
+
+    @staticmethod
+    def extract_pages(material: Material) -> List[Tuple[int, str]]:
+        """
+        학습 자료의 텍스트를 페이지 단위로 추출
+
+        Args:
+            material: 자료 객체
+
+        Returns:
+            [(페이지 번호, 페이지 텍스트), ...] 목록. 추출 실패 시 빈 목록
+        """
+        if material.material_type == MaterialType.URL:
+            text = WebUtils.extract_text(material.url)
+        elif PDFUtils.is_pdf_file(material.title):
+            text = PDFUtils.extract_text_from_url(material.url)
+        else:
+            return []
+
+        return PDFUtils.split_pages(text)
+
+    @staticmethod
+    def get_content_hash(
+        material: Material, pages: Optional[List[Tuple[int, str]]] = None
+    ) -> str:
+        """
+        학습 자료 내용 해시 조회 (퀴즈 생성 캐시 키용)
+
+        업로드한 파일은 내용이 바뀌지 않으므로 업로드 시 저장된 해시를 사용합니다.
+        URL 자료는 내용이 바뀔 수 있으므로 저장하지 않고, 이번에 가져온 페이지로 매번 계산합니다.
+
+        Args:
+            material: 자료 객체
+            pages: 이미 추출한 페이지 목록 (없으면 추출)
+
+        Returns:
+            sha256 hex 문자열
+        """
+        content_hash = material.metadata.get("content_hash")
+        if content_hash and material.material_type == MaterialType.FILE:
+            return content_hash
+
+        if pages is None:
+            pages = MaterialService.extract_pages(material)
+        content = "\n".join(text for _, text in pages)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def has_stored_content_hash(material: Material) -> bool:
+        """내용을 가져오지 않고 해시를 알 수 있는 자료(업로드한 파일)인지 여부"""
+        return material.material_type == MaterialType.FILE and bool(
+            material.metadata.get("content_hash")
+        )
+
     @staticmethod
     def get_project_materials(project_id: int, user: User) -> List[Material]:
         """
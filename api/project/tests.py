@@ -1,3 +1,106 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+
+from api.project.models import Material, Project
+from api.project.models.material import MaterialType
+from api.project.services import MaterialService, ProjectService
+from api.user.models import User
+
+
+class ProjectActivityStatsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(identifier="project-user")
+        self.project = Project.objects.create(user=self.user, name="프로젝트")
+
+    def create_material(self, title):
+        return MaterialService.create_material(
+            project=self.project,
+            title=title,
+            material_type="url",
+            url="https://example.com",
+        )
+
+    def test_create_and_delete_material_update_stats(self):
+        first = self.create_material("자료 1")
+        second = self.create_material("자료 2")
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.material_count, 2)
+        self.assertEqual(self.project.last_activity_at, second.created_at)
+
+        MaterialService.delete_material(second.id, self.user)
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.material_count, 1)
+        self.assertEqual(self.project.last_activity_at, first.created_at)
+
+    def test_refresh_command_repairs_stats(self):
+        material = Material.objects.create(project=self.project, title="자료")
+        Project.objects.filter(id=self.project.id).update(
+            material_count=5, last_activity_at=timezone.now() - timedelta(days=1)
+        )
+
+        call_command("refresh_project_stats", project_ids=[self.project.id])
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.material_count, 1)
+        self.assertEqual(self.project.last_activity_at, material.created_at)
+
+    def test_project_list_sorted_by_activity(self):
+        older = Project.objects.create(user=self.user, name="이전 프로젝트")
+        self.create_material("자료")
+
+        projects = list(
+            ProjectService.get_user_projects(self.user).order_by(
+                "-last_activity_at", "-id"
+            )
+        )
+        self.assertEqual(projects, [self.project, older])
+
+
+class MaterialContentHashTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(identifier="hash-user")
+        self.project = Project.objects.create(user=user, name="프로젝트")
+
+    def test_url_material_hash_follows_current_content(self):
+        material = Material.objects.create(
+            project=self.project,
+            title="자료",
+            material_type=MaterialType.URL,
+            url="https://example.com",
+            metadata={"content_hash": "stale"},
+        )
+
+        with mock.patch(
+            "api.project.services.project_service.WebUtils.extract_text",
+            side_effect=["이전 내용", "바뀐 내용"],
+        ):
+            first = MaterialService.get_content_hash(material)
+            second = MaterialService.get_content_hash(material)
+
+        self.assertNotEqual(first, "stale")
+        self.assertNotEqual(first, second)
+        self.assertFalse(MaterialService.has_stored_content_hash(material))
+
+    def test_fetched_pages_and_uploaded_file_hash_skip_extraction(self):
+        url_material = Material.objects.create(
+            project=self.project, title="자료", material_type=MaterialType.URL
+        )
+        file_material = Material.objects.create(
+            project=self.project, title="자료.pdf", metadata={"content_hash": "file"}
+        )
+
+        with mock.patch.object(MaterialService, "extract_pages") as extract_pages:
+            url_hash = MaterialService.get_content_hash(url_material, [(1, "내용")])
+            file_hash = MaterialService.get_content_hash(file_material)
 
-# Create your tests here.
+        extract_pages.assert_not_called()
+        self.assertEqual(
+            url_hash, MaterialService.get_content_hash(url_material, [(1, "내용")])
+        )
+        self.assertEqual(file_hash, "file")
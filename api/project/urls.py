@@ -1,6 +1,7 @@
 from django.urls import path
 
 from api.project.views import MaterialViewSet, ProjectViewSet
+from api.quiz.views.quiz_view import QuizViewSet
 
 urlpatterns = [
     # 프로젝트 관련 API
@@ -39,4 +40,16 @@ urlpatterns = [
         MaterialViewSet.as_view({"get": "list", "post": "create"}),
         name="material-list-create",
     ),
+    # 오답 노트 API
+    path(
+        "/<int:project_id>/wrong-answers",
+        QuizViewSet.as_view({"get": "wrong_answers"}),
+        name="project-wrong-answers",
+    ),
+    # 학습 통계 API
+    path(
+        "/<int:project_id>/stats",
+        QuizViewSet.as_view({"get": "learning_stats"}),
+        name="project-learning-stats",
+    ),
 ]
@@ -17,6 +17,11 @@ from api.project.serializers.project_serializers import (
     ProjectListSerializer,
 )
 from api.project.services import MaterialService, ProjectService
+from common.pagination import (
+    CreatedAtCursorPagination,
+    LastActivityCursorPagination,
+    cursor_page_serializer,
+)
 from common.swagger.schema import get_swagger_response_dict
 
 
@@ -36,6 +41,7 @@ class ProjectViewSet(
 
     permission_classes = [IsAuthenticated]
     serializer_class = ProjectSerializer
+    pagination_class = LastActivityCursorPagination
 
     def get_queryset(self):
         """현재 사용자의 프로젝트만 조회"""
@@ -47,11 +53,12 @@ class ProjectViewSet(
         현재 로그인한 사용자의 모든 프로젝트을 조회합니다.
 
         각 프로젝트의 학습 자료 개수와 마지막 활동 날짜를 포함합니다.
-        최근 수정일 기준으로 정렬됩니다.
+        마지막 활동(자료 업로드) 순으로 정렬되며 커서 기반으로 페이지를 나눕니다.
+        다음 페이지는 응답의 next URL(cursor 파라미터 포함)로 조회합니다.
         """,
         responses=get_swagger_response_dict(
             success_response={
-                200: ProjectListSerializer(many=True),
+                200: cursor_page_serializer(ProjectListSerializer),
             },
             exception_enums=[],
         ),
@@ -60,8 +67,9 @@ class ProjectViewSet(
     def list(self, request, *args, **kwargs):
         """프로젝트 목록 조회"""
         projects = ProjectService.get_user_projects(request.user)
-        serializer = ProjectListSerializer(projects, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        page = self.paginate_queryset(projects)
+        serializer = ProjectListSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @swagger_auto_schema(
         operation_summary="프로젝트 생성",
@@ -209,6 +217,7 @@ class MaterialViewSet(
 
     permission_classes = [IsAuthenticated]
     serializer_class = MaterialSerializer
+    pagination_class = CreatedAtCursorPagination
 
     def get_queryset(self):
         """현재 사용자의 자료만 조회"""
@@ -220,11 +229,12 @@ class MaterialViewSet(
         특정 프로젝트의 모든 학습 자료를 조회합니다.
 
         파일 타입과 URL 타입 자료를 모두 포함합니다.
-        최근 생성일 기준으로 정렬됩니다.
+        최근 생성일 기준으로 정렬되며 커서 기반으로 페이지를 나눕니다.
+        다음 페이지는 응답의 next URL(cursor 파라미터 포함)로 조회합니다.
         """,
         responses=get_swagger_response_dict(
             success_response={
-                200: MaterialListSerializer(many=True),
+                200: cursor_page_serializer(MaterialListSerializer),
             },
             exception_enums=[ProjectExceptions.PROJECT_NOT_FOUND],
         ),
@@ -233,8 +243,9 @@ class MaterialViewSet(
     def list(self, request, project_id: int):
         """학습 자료 목록 조회"""
         materials = MaterialService.get_project_materials(project_id, request.user)
-        serializer = MaterialListSerializer(materials, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        page = self.paginate_queryset(materials)
+        serializer = MaterialListSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @swagger_auto_schema(
         operation_summary="학습 자료 생성",
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class QuizConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api.quiz"
+
+    def ready(self):
+        from api.quiz import signals  # noqa: F401
@@ -39,3 +39,13 @@ class QuizExceptions(CustomExceptionEnum):
         "QUIZ007",
         status.HTTP_403_FORBIDDEN,
     )
+    QUIZ_NOT_CANCELLABLE = (
+        "이미 완료되었거나 취소된 퀴즈입니다",
+        "QUIZ008",
+        status.HTTP_400_BAD_REQUEST,
+    )
+    QUESTION_NOT_IN_QUIZ = (
+        "퀴즈에 속하지 않는 문제가 포함되어 있습니다",
+        "QUIZ009",
+        status.HTTP_400_BAD_REQUEST,
+    )
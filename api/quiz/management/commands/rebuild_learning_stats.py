@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from api.quiz.services.learning_stats_service import LearningStatsService
+
+
+class Command(BaseCommand):
+    """
+    학습 통계 롤업을 답안 기록으로 다시 계산
+
+    Example:
+        python manage.py rebuild_learning_stats
+        python manage.py rebuild_learning_stats --user-id 1 --user-id 2
+    """
+
+    help = "학습 통계 롤업(날짜별, 자료별)을 답안 기록 기준으로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="재계산할 사용자 ID (여러 번 지정 가능, 생략하면 전체)",
+        )
+
+    def handle(self, *args, **options):
+        daily_count, material_count = LearningStatsService.rebuild(options["user_ids"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"날짜별 롤업 {daily_count}행, 자료별 롤업 {material_count}행 생성 완료"
+            )
+        )
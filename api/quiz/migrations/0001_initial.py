@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:24
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('project', '0002_quiz_quizquestions_quizanswerhistory'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    # Quiz 모델들은 project 앱에서 옮겨온 것으로, 테이블은 project.0002에서 이미 생성됨
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='Quiz',
+                    fields=[
+                        ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                        ('question_type', models.CharField(choices=[('multiple_choice', '객관식'), ('short_answer', '서술형'), ('mixed', '혼합')], default='multiple_choice', max_length=20)),
+                        ('question_count', models.IntegerField(default=10)),
+                        ('difficulty', models.CharField(choices=[('easy', '쉬움'), ('medium', '보통'), ('hard', '어려움')], default='medium', max_length=10)),
+                        ('status', models.CharField(choices=[('pending', '대기중'), ('processing', '처리중'), ('completed', '완료'), ('failed', '실패')], default='pending', max_length=20)),
+                        ('error_message', models.TextField(blank=True, null=True)),
+                        ('progress_percentage', models.IntegerField(default=0)),
+                        ('created_at', models.DateTimeField(auto_now_add=True)),
+                        ('updated_at', models.DateTimeField(auto_now=True)),
+                        ('started_at', models.DateTimeField(blank=True, null=True)),
+                        ('completed_at', models.DateTimeField(blank=True, null=True)),
+                        ('materials', models.ManyToManyField(related_name='quizzes', to='project.material')),
+                        ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='quizzes', to='project.project')),
+                    ],
+                    options={
+                        'db_table': 'quiz_generation_tasks',
+                        'ordering': ['-created_at'],
+                    },
+                ),
+                migrations.CreateModel(
+                    name='QuizQuestions',
+                    fields=[
+                        ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                        ('question', models.TextField()),
+                        ('answers', models.JSONField(default=dict)),
+                        ('metadata', models.JSONField(default=dict)),
+                        ('created_at', models.DateTimeField(auto_now_add=True)),
+                        ('updated_at', models.DateTimeField(auto_now=True)),
+                        ('quiz', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='questions', to='quiz.quiz')),
+                    ],
+                    options={
+                        'db_table': 'quizzes',
+                        'ordering': ['-created_at'],
+                    },
+                ),
+                migrations.CreateModel(
+                    name='QuizAnswerHistory',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('answer', models.TextField()),
+                        ('is_correct', models.BooleanField(default=False)),
+                        ('created_at', models.DateTimeField(auto_now_add=True)),
+                        ('updated_at', models.DateTimeField(auto_now=True)),
+                        ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='quiz_answer_histories', to=settings.AUTH_USER_MODEL)),
+                        ('quiz_question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='answer_histories', to='quiz.quizquestions')),
+                    ],
+                    options={
+                        'db_table': 'quiz_answer_histories',
+                        'ordering': ['-created_at'],
+                    },
+                ),
+            ],
+        ),
+    ]
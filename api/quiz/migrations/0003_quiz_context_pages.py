@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0002_quizgenerationcache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quiz',
+            name='context_pages',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:29
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0003_quiz_context_pages'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='quizquestions',
+            options={'ordering': ['created_at']},
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:31
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0003_move_quiz_models_to_quiz_app'),
+        ('quiz', '0004_quizquestions_ordering'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuizPoolQuestion',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('question_type', models.CharField(choices=[('multiple_choice', '객관식'), ('short_answer', '서술형'), ('mixed', '혼합')], default='multiple_choice', max_length=20)),
+                ('difficulty', models.CharField(choices=[('easy', '쉬움'), ('medium', '보통'), ('hard', '어려움')], default='medium', max_length=10)),
+                ('question', models.TextField()),
+                ('answers', models.JSONField(default=dict)),
+                ('metadata', models.JSONField(default=dict)),
+                ('used_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('material', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pool_questions', to='project.material')),
+            ],
+            options={
+                'db_table': 'quiz_pool_questions',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['material', 'difficulty', 'used_at'], name='quiz_pool_lookup_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0005_quizpoolquestion'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='quiz',
+            name='status',
+            field=models.CharField(choices=[('pending', '대기중'), ('processing', '처리중'), ('completed', '완료'), ('failed', '실패'), ('cancelled', '취소됨')], default='pending', max_length=20),
+        ),
+    ]
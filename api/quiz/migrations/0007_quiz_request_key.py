@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0006_quiz_status_cancelled'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quiz',
+            name='request_key',
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def remove_duplicate_answers(apps, schema_editor):
+    """(user, quiz_question)별로 가장 최근 답안만 남기고 삭제"""
+    QuizAnswerHistory = apps.get_model("quiz", "QuizAnswerHistory")
+
+    seen = set()
+    duplicate_ids = []
+    for history in QuizAnswerHistory.objects.order_by(
+        "user_id", "quiz_question_id", "-updated_at", "-id"
+    ).values("id", "user_id", "quiz_question_id"):
+        key = (history["user_id"], history["quiz_question_id"])
+        if key in seen:
+            duplicate_ids.append(history["id"])
+        else:
+            seen.add(key)
+
+    QuizAnswerHistory.objects.filter(id__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0007_quiz_request_key'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_answers, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='quizanswerhistory',
+            constraint=models.UniqueConstraint(fields=('user', 'quiz_question'), name='unique_quiz_answer_per_user'),
+        ),
+    ]
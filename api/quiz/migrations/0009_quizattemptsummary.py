@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_attempt_summaries(apps, schema_editor):
+    """기존 답안 기록으로 (user, quiz)별 풀이 요약 생성"""
+    QuizAnswerHistory = apps.get_model("quiz", "QuizAnswerHistory")
+    QuizQuestions = apps.get_model("quiz", "QuizQuestions")
+    QuizAttemptSummary = apps.get_model("quiz", "QuizAttemptSummary")
+
+    rows = (
+        QuizAnswerHistory.objects.values("user_id", "quiz_question__quiz_id")
+        .annotate(answered=Count("id"), correct=Count("id", filter=Q(is_correct=True)))
+        .order_by()
+    )
+    totals = dict(
+        QuizQuestions.objects.values("quiz_id")
+        .annotate(total=Count("id"))
+        .values_list("quiz_id", "total")
+        .order_by()
+    )
+
+    summaries = []
+    for row in rows:
+        quiz_id = row["quiz_question__quiz_id"]
+        total = totals.get(quiz_id, 0)
+        score = row["correct"] / total * 100 if total else 0
+        summaries.append(
+            QuizAttemptSummary(
+                user_id=row["user_id"],
+                quiz_id=quiz_id,
+                total_questions=total,
+                answered_count=row["answered"],
+                correct_count=row["correct"],
+                score=round(score, 2),
+            )
+        )
+    QuizAttemptSummary.objects.bulk_create(summaries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0008_unique_quiz_answer_per_user'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuizAttemptSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_questions', models.IntegerField(default=0)),
+                ('answered_count', models.IntegerField(default=0)),
+                ('correct_count', models.IntegerField(default=0)),
+                ('score', models.FloatField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('quiz', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attempt_summaries', to='quiz.quiz')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='quiz_attempt_summaries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'quiz_attempt_summaries',
+                'constraints': [models.UniqueConstraint(fields=('user', 'quiz'), name='unique_quiz_attempt_summary_per_user')],
+            },
+        ),
+        migrations.RunPython(backfill_attempt_summaries, migrations.RunPython.noop),
+    ]
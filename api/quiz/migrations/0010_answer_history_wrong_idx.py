@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0009_quizattemptsummary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quizanswerhistory',
+            index=models.Index(condition=models.Q(('is_correct', False)), fields=['user', '-created_at'], name='answer_history_wrong_idx'),
+        ),
+    ]
@@ -0,0 +1,108 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, Max, Q
+from django.db.models.functions import TruncDate
+
+
+def backfill_learning_stats(apps, schema_editor):
+    """기존 답안 기록으로 날짜별, 자료별 학습 통계 롤업 생성 (풀이 시간은 기록이 없어 0)"""
+    QuizAnswerHistory = apps.get_model("quiz", "QuizAnswerHistory")
+    UserProjectDailyStats = apps.get_model("quiz", "UserProjectDailyStats")
+    UserMaterialStats = apps.get_model("quiz", "UserMaterialStats")
+
+    histories = QuizAnswerHistory.objects.order_by()
+    aggregates = {
+        "attempts": Count("id"),
+        "correct": Count("id", filter=Q(is_correct=True)),
+    }
+    daily_rows = histories.values(
+        "user_id",
+        project_id=F("quiz_question__quiz__project_id"),
+        date=TruncDate("created_at"),
+    ).annotate(**aggregates)
+    UserProjectDailyStats.objects.bulk_create(
+        [
+            UserProjectDailyStats(
+                user_id=row["user_id"],
+                project_id=row["project_id"],
+                date=row["date"],
+                attempts=row["attempts"],
+                correct_count=row["correct"],
+            )
+            for row in daily_rows
+        ],
+        batch_size=1000,
+    )
+
+    material_rows = (
+        histories.filter(quiz_question__quiz__materials__isnull=False)
+        .values("user_id", material_id=F("quiz_question__quiz__materials"))
+        .annotate(**aggregates, last_answered_at=Max("updated_at"))
+    )
+    UserMaterialStats.objects.bulk_create(
+        [
+            UserMaterialStats(
+                user_id=row["user_id"],
+                material_id=row["material_id"],
+                attempts=row["attempts"],
+                correct_count=row["correct"],
+                last_answered_at=row["last_answered_at"],
+            )
+            for row in material_rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0004_project_activity_stats'),
+        ('quiz', '0010_answer_history_wrong_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quizanswerhistory',
+            name='time_spent_seconds',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='UserMaterialStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attempts', models.IntegerField(default=0)),
+                ('correct_count', models.IntegerField(default=0)),
+                ('time_spent_seconds', models.IntegerField(default=0)),
+                ('last_answered_at', models.DateTimeField(blank=True, null=True)),
+                ('material', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_stats', to='project.material')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='material_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'quiz_user_material_stats',
+                'constraints': [models.UniqueConstraint(fields=('user', 'material'), name='unique_user_material_stats')],
+            },
+        ),
+        migrations.CreateModel(
+            name='UserProjectDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('attempts', models.IntegerField(default=0)),
+                ('correct_count', models.IntegerField(default=0)),
+                ('time_spent_seconds', models.IntegerField(default=0)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='project.project')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_daily_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'quiz_user_project_daily_stats',
+                'ordering': ['date'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'project', 'date'), name='unique_user_project_daily_stats')],
+            },
+        ),
+        migrations.RunPython(backfill_learning_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0005_hot_path_indexes'),
+        ('quiz', '0011_learning_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='quiz',
+            name='request_key',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['project', 'status', '-created_at', '-id'], name='quiz_project_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(condition=models.Q(('request_key__isnull', False)), fields=['request_key', '-created_at'], name='quiz_request_key_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quizquestions',
+            index=models.Index(fields=['quiz', 'created_at'], name='quiz_question_order_idx'),
+        ),
+    ]
@@ -1,15 +1,26 @@
+from .attempt_summary import QuizAttemptSummary
+from .generation_cache import QuizGenerationCache
+from .learning_stats import UserMaterialStats, UserProjectDailyStats
+from .question_pool import QuizPoolQuestion
 from .quiz import (
     Quiz,
     QuizAnswerHistory,
     QuizDifficulty,
     QuizQuestions,
     QuizQuestionType,
+    QuizStatus,
 )
 
 __all__ = [
     "Quiz",
     "QuizAnswerHistory",
+    "QuizAttemptSummary",
     "QuizDifficulty",
+    "QuizGenerationCache",
+    "QuizPoolQuestion",
     "QuizQuestions",
     "QuizQuestionType",
+    "QuizStatus",
+    "UserMaterialStats",
+    "UserProjectDailyStats",
 ]
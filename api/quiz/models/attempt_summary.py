@@ -0,0 +1,41 @@
+from django.db import models
+
+from api.quiz.models.quiz import Quiz
+from api.user.models.user import User
+
+
+class QuizAttemptSummary(models.Model):
+    """
+    사용자별 퀴즈 풀이 요약
+
+    답안 제출과 같은 트랜잭션에서 갱신되므로,
+    결과/목록 조회 시 답안 기록을 다시 집계하지 않고 이 행만 읽습니다.
+    """
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="quiz_attempt_summaries"
+    )
+    quiz = models.ForeignKey(
+        Quiz, on_delete=models.CASCADE, related_name="attempt_summaries"
+    )
+
+    # 집계 값 (갱신 시점 기준)
+    total_questions = models.IntegerField(default=0)
+    answered_count = models.IntegerField(default=0)
+    correct_count = models.IntegerField(default=0)
+    score = models.FloatField(default=0)
+
+    # 타임스탬프
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "quiz_attempt_summaries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "quiz"],
+                name="unique_quiz_attempt_summary_per_user",
+            ),
+        ]
+
+    def __str__(self):
+        return f"QuizAttemptSummary: {self.user_id} - {self.quiz_id}"
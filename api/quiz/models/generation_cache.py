@@ -0,0 +1,27 @@
+from django.db import models
+from django.utils import timezone
+
+
+class QuizGenerationCache(models.Model):
+    """
+    퀴즈 생성 LLM 결과 캐시
+
+    프롬프트 템플릿, 자료 내용 해시, 생성 파라미터, 모델로 만든 키에
+    파싱된 문제 JSON을 저장합니다.
+    """
+
+    key = models.CharField(max_length=64, unique=True)
+    questions = models.JSONField(default=list)
+    size_bytes = models.IntegerField(default=0)
+    hit_count = models.IntegerField(default=0)
+
+    # 타임스탬프
+    last_accessed_at = models.DateTimeField(default=timezone.now, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "quiz_generation_caches"
+        ordering = ["-last_accessed_at"]
+
+    def __str__(self):
+        return f"QuizGenerationCache {self.key[:12]}"
@@ -0,0 +1,76 @@
+from django.db import models
+
+from api.project.models.material import Material
+from api.project.models.project import Project
+from api.user.models.user import User
+
+
+class UserProjectDailyStats(models.Model):
+    """
+    사용자 × 프로젝트 × 날짜별 학습 통계 (롤업)
+
+    답안 제출 시 증분 갱신되며, 답안 기록이 생성된 날짜(UTC)를 기준으로 집계합니다.
+    같은 문제를 다시 제출하면 풀이 수는 그대로, 정답 수/풀이 시간만 반영됩니다.
+    """
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="project_daily_stats"
+    )
+    project = models.ForeignKey(
+        Project, on_delete=models.CASCADE, related_name="daily_stats"
+    )
+    date = models.DateField()
+
+    # 집계 값
+    attempts = models.IntegerField(default=0)
+    correct_count = models.IntegerField(default=0)
+    time_spent_seconds = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "quiz_user_project_daily_stats"
+        ordering = ["date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "project", "date"],
+                name="unique_user_project_daily_stats",
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"UserProjectDailyStats: {self.user_id} - {self.project_id} - {self.date}"
+        )
+
+
+class UserMaterialStats(models.Model):
+    """
+    사용자 × 자료별 학습 통계 (롤업, 자료 숙련도)
+
+    문제는 퀴즈 단위로 자료와 연결되므로, 여러 자료로 만든 퀴즈의 답안은
+    사용된 모든 자료에 집계됩니다.
+    """
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="material_stats"
+    )
+    material = models.ForeignKey(
+        Material, on_delete=models.CASCADE, related_name="user_stats"
+    )
+
+    # 집계 값
+    attempts = models.IntegerField(default=0)
+    correct_count = models.IntegerField(default=0)
+    time_spent_seconds = models.IntegerField(default=0)
+    last_answered_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "quiz_user_material_stats"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "material"],
+                name="unique_user_material_stats",
+            ),
+        ]
+
+    def __str__(self):
+        return f"UserMaterialStats: {self.user_id} - {self.material_id}"
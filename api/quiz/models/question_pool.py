@@ -0,0 +1,52 @@
+import uuid
+
+from django.db import models
+
+from api.project.models.material import Material
+from api.quiz.models.quiz import QuizDifficulty, QuizQuestionType
+
+
+class QuizPoolQuestion(models.Model):
+    """
+    자료별 사전 생성 문제 (문제 풀)
+
+    자료 업로드 후 백그라운드에서 난이도/문제 유형별로 미리 생성해 두고,
+    퀴즈 생성 요청 시 사용되지 않은 문제를 바로 꺼내 씁니다.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    material = models.ForeignKey(
+        Material, on_delete=models.CASCADE, related_name="pool_questions"
+    )
+    question_type = models.CharField(
+        max_length=20,
+        choices=QuizQuestionType.choices,
+        default=QuizQuestionType.MULTIPLE_CHOICE,
+    )
+    difficulty = models.CharField(
+        max_length=10, choices=QuizDifficulty.choices, default=QuizDifficulty.MEDIUM
+    )
+
+    # QuizQuestions와 같은 형식
+    question = models.TextField()
+    answers = models.JSONField(default=dict)
+    metadata = models.JSONField(default=dict)
+
+    # 퀴즈에 사용된 시각 (null이면 미사용)
+    used_at = models.DateTimeField(null=True, blank=True)
+
+    # 타임스탬프
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "quiz_pool_questions"
+        ordering = ["created_at"]
+        indexes = [
+            models.Index(
+                fields=["material", "difficulty", "used_at"],
+                name="quiz_pool_lookup_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"QuizPoolQuestion: {self.id}"
@@ -13,6 +13,7 @@ class QuizStatus(models.TextChoices):
     PROCESSING = "processing", "처리중"
     COMPLETED = "completed", "완료"
     FAILED = "failed", "실패"
+    CANCELLED = "cancelled", "취소됨"
 
 
 class QuizQuestionType(models.TextChoices):
@@ -56,6 +57,12 @@ class Quiz(TimeStampModel):
     error_message = models.TextField(null=True, blank=True)
     progress_percentage = models.IntegerField(default=0)
 
+    # 생성에 사용된 자료 페이지 {material_id: [페이지 번호, ...]}
+    context_pages = models.JSONField(default=dict, blank=True)
+
+    # 중복 생성 요청 판별 키 (사용자, 프로젝트, 자료, 생성 조건)
+    request_key = models.CharField(max_length=64, null=True, blank=True)
+
     # 타임스탬프
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -65,6 +72,19 @@ class Quiz(TimeStampModel):
     class Meta:
         db_table = "quiz_generation_tasks"
         ordering = ["-created_at"]
+        indexes = [
+            # 프로젝트의 퀴즈 목록 (상태별, 최근 순 커서 페이지네이션)
+            models.Index(
+                fields=["project", "status", "-created_at", "-id"],
+                name="quiz_project_status_idx",
+            ),
+            # 중복 생성 요청 조회 (키가 있는 퀴즈만, 최근 순)
+            models.Index(
+                fields=["request_key", "-created_at"],
+                condition=models.Q(request_key__isnull=False),
+                name="quiz_request_key_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Quiz {self.id} - {self.status}"
@@ -92,7 +112,11 @@ class QuizQuestions(TimeStampModel):
 
     class Meta:
         db_table = "quizzes"
-        ordering = ["-created_at"]
+        # 문제는 생성(저장)된 순서대로 조회
+        ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["quiz", "created_at"], name="quiz_question_order_idx"),
+        ]
 
     def __str__(self):
         return f"Quiz: {self.id}"
@@ -112,9 +136,25 @@ class QuizAnswerHistory(TimeStampModel):
     ## 객관식인 경우 integer 형태, 서술형인 경우 text
     answer = models.TextField()
     is_correct = models.BooleanField(default=False)
+    ## 풀이에 사용한 시간 (초, 다시 제출하면 누적)
+    time_spent_seconds = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "quiz_answer_histories"
         ordering = ["-created_at"]
+        indexes = [
+            # 오답 노트 조회 (사용자의 오답만 최근 순으로)
+            models.Index(
+                fields=["user", "-created_at"],
+                condition=models.Q(is_correct=False),
+                name="answer_history_wrong_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "quiz_question"],
+                name="unique_quiz_answer_per_user",
+            ),
+        ]
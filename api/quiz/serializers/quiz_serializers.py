@@ -1,7 +1,13 @@
 from rest_framework import serializers
 
 from api.project.models.material import Material
-from api.quiz.models import Quiz, QuizAnswerHistory, QuizQuestions
+from api.quiz.models import (
+    Quiz,
+    QuizAnswerHistory,
+    QuizQuestions,
+    UserMaterialStats,
+    UserProjectDailyStats,
+)
 from api.quiz.models.quiz import QuizDifficulty, QuizQuestionType
 
 
@@ -27,6 +33,10 @@ class QuizCreateSerializer(serializers.Serializer):
         default=QuizDifficulty.MEDIUM,
         help_text="난이도 (easy: 쉬움, medium: 보통, hard: 어려움)",
     )
+    use_cache = serializers.BooleanField(
+        default=True,
+        help_text="같은 조건으로 생성된 퀴즈 결과 재사용 여부 (false면 새로 생성)",
+    )
 
     def validate_material_ids(self, value):
         """Material ID 유효성 검증"""
@@ -45,6 +55,15 @@ class QuizCreateSerializer(serializers.Serializer):
         return value
 
 
+class QuizCancelSerializer(serializers.Serializer):
+    """퀴즈 생성 취소 요청 Serializer"""
+
+    keep_partial = serializers.BooleanField(
+        default=False,
+        help_text="취소 전까지 생성된 문제 유지 여부 (false면 삭제)",
+    )
+
+
 class QuizStatusSerializer(serializers.ModelSerializer):
     """퀴즈 생성 상태 Serializer (Polling용)"""
 
@@ -95,7 +114,12 @@ class QuizStatusSerializer(serializers.ModelSerializer):
 class QuizQuestionSerializer(serializers.ModelSerializer):
     """퀴즈 문제 Serializer (문제 조회용)"""
 
-    question_type = serializers.SerializerMethodField(help_text="문제 유형")
+    question_type = serializers.CharField(
+        source="metadata.question_type",
+        default=QuizQuestionType.MULTIPLE_CHOICE,
+        read_only=True,
+        help_text="문제 유형",
+    )
     choices = serializers.SerializerMethodField(
         help_text="객관식 선택지 (객관식인 경우만)"
     )
@@ -111,14 +135,10 @@ class QuizQuestionSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "metadata"]
 
-    def get_question_type(self, obj):
-        """문제 유형 반환"""
-        # metadata에서 question_type 추출
-        return obj.metadata.get("question_type", "multiple_choice")
-
     def get_choices(self, obj):
         """객관식 선택지 반환 (answers에서 answer 키 제외)"""
-        if self.get_question_type(obj) == "multiple_choice":
+        question_type = obj.metadata.get("question_type", "multiple_choice")
+        if question_type == "multiple_choice":
             # answers에서 answer 키를 제외하고 선택지만 반환
             return {k: v for k, v in obj.answers.items() if k != "answer"}
         return None
@@ -185,11 +205,13 @@ class QuizSerializer(serializers.ModelSerializer):
             "project",
             "material_ids",
             "material_titles",
+            "context_pages",
             "question_type",
             "difficulty",
             "total_questions",
             "questions",
             "status",
+            "progress_percentage",
             "created_at",
             "updated_at",
         ]
@@ -204,18 +226,31 @@ class QuizSerializer(serializers.ModelSerializer):
         return [material.title for material in obj.materials.all()]
 
     def get_total_questions(self, obj):
-        """전체 문제 개수 반환"""
-        return obj.questions.count()
+        """전체 문제 개수 반환 (questions를 prefetch한 경우 추가 쿼리 없음)"""
+        return len(obj.questions.all())
 
 
 class QuizListSerializer(serializers.ModelSerializer):
-    """퀴즈 목록 Serializer"""
+    """
+    퀴즈 목록 Serializer
+    QuizService.get_project_quizzes의 annotate/prefetch 결과를 사용
+    """
 
-    material_count = serializers.SerializerMethodField(help_text="사용된 Material 개수")
+    material_count = serializers.IntegerField(
+        read_only=True, help_text="사용된 Material 개수"
+    )
     material_titles = serializers.SerializerMethodField(
         help_text="사용된 Material 제목 목록 (최대 3개)"
     )
-    total_questions = serializers.SerializerMethodField(help_text="전체 문제 개수")
+    total_questions = serializers.IntegerField(
+        read_only=True, help_text="전체 문제 개수"
+    )
+    answered_count = serializers.SerializerMethodField(
+        help_text="사용자가 답안을 제출한 문제 개수"
+    )
+    score = serializers.SerializerMethodField(
+        help_text="사용자 점수 (정답률 %, 제출한 답안이 없으면 null)"
+    )
 
     class Meta:
         model = Quiz
@@ -226,26 +261,34 @@ class QuizListSerializer(serializers.ModelSerializer):
             "question_type",
             "difficulty",
             "total_questions",
+            "answered_count",
+            "score",
             "status",
             "created_at",
         ]
         read_only_fields = ["id", "created_at"]
 
-    def get_material_count(self, obj):
-        """사용된 Material 개수 반환"""
-        return obj.materials.count()
-
     def get_material_titles(self, obj):
         """사용된 Material 제목 목록 반환 (최대 3개)"""
-        materials = obj.materials.all()[:3]
-        titles = [material.title for material in materials]
-        if obj.materials.count() > 3:
+        titles = [material.title for material in obj.preview_materials]
+        if obj.material_count > 3:
             titles.append("...")
         return titles
 
-    def get_total_questions(self, obj):
-        """전체 문제 개수 반환"""
-        return obj.questions.count()
+    def _get_attempt_summary(self, obj):
+        """사용자 풀이 요약 반환 (QuizService.get_project_quizzes에서 prefetch)"""
+        summaries = getattr(obj, "user_attempt_summaries", None)
+        return summaries[0] if summaries else None
+
+    def get_answered_count(self, obj):
+        """답안을 제출한 문제 개수 반환"""
+        summary = self._get_attempt_summary(obj)
+        return summary.answered_count if summary else 0
+
+    def get_score(self, obj):
+        """사용자 점수 반환"""
+        summary = self._get_attempt_summary(obj)
+        return summary.score if summary else None
 
 
 # ============ 퀴즈 풀이 관련 Serializers ============
@@ -258,6 +301,9 @@ class QuizAnswerSubmitSerializer(serializers.Serializer):
     answer = serializers.CharField(
         required=True, help_text="답안 (객관식: 선택지 번호, 서술형: 텍스트)"
     )
+    time_spent_seconds = serializers.IntegerField(
+        default=0, min_value=0, help_text="풀이에 사용한 시간 (초)"
+    )
 
 
 class QuizAnswerBatchSubmitSerializer(serializers.Serializer):
@@ -289,6 +335,17 @@ class QuizAnswerHistorySerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "is_correct", "created_at"]
 
 
+class QuizWrongAnswerSerializer(QuizAnswerHistorySerializer):
+    """오답 노트 Serializer (문제, 정답, 해설, 제출한 답안 포함)"""
+
+    quiz_id = serializers.UUIDField(
+        source="quiz_question.quiz_id", read_only=True, help_text="퀴즈 ID"
+    )
+
+    class Meta(QuizAnswerHistorySerializer.Meta):
+        fields = ["id", "quiz_id", "question", "user_answer", "created_at"]
+
+
 class QuizResultSerializer(serializers.Serializer):
     """퀴즈 결과 Serializer"""
 
@@ -298,3 +355,85 @@ class QuizResultSerializer(serializers.Serializer):
     wrong_count = serializers.IntegerField(help_text="오답 개수")
     score = serializers.FloatField(help_text="점수 (정답률 %)")
     answers = QuizAnswerHistorySerializer(many=True, help_text="문제별 결과")
+
+
+# ============ 학습 통계 관련 Serializers ============
+
+
+def _accuracy(correct_count, attempts):
+    """정답률 (%, 풀이가 없으면 null)"""
+    return round(correct_count / attempts * 100, 2) if attempts else None
+
+
+class LearningStatsQuerySerializer(serializers.Serializer):
+    """학습 통계 조회 Serializer"""
+
+    days = serializers.IntegerField(
+        default=30,
+        min_value=1,
+        max_value=365,
+        help_text="날짜별 통계를 조회할 최근 일수 (1-365)",
+    )
+
+
+class LearningStatsTotalsSerializer(serializers.Serializer):
+    """프로젝트 전체 학습 통계 Serializer"""
+
+    attempts = serializers.IntegerField(help_text="푼 문제 수")
+    correct_count = serializers.IntegerField(help_text="정답 수")
+    accuracy = serializers.SerializerMethodField(help_text="정답률 (%)")
+    time_spent_seconds = serializers.IntegerField(help_text="풀이 시간 (초)")
+
+    def get_accuracy(self, obj):
+        return _accuracy(obj["correct_count"], obj["attempts"])
+
+
+class DailyLearningStatsSerializer(serializers.ModelSerializer):
+    """날짜별 학습 통계 Serializer"""
+
+    accuracy = serializers.SerializerMethodField(help_text="정답률 (%)")
+
+    class Meta:
+        model = UserProjectDailyStats
+        fields = [
+            "date",
+            "attempts",
+            "correct_count",
+            "accuracy",
+            "time_spent_seconds",
+        ]
+
+    def get_accuracy(self, obj):
+        return _accuracy(obj.correct_count, obj.attempts)
+
+
+class MaterialLearningStatsSerializer(serializers.ModelSerializer):
+    """자료별 학습 통계 (숙련도) Serializer"""
+
+    material_title = serializers.CharField(
+        source="material.title", read_only=True, help_text="자료 제목"
+    )
+    accuracy = serializers.SerializerMethodField(help_text="정답률 (%)")
+
+    class Meta:
+        model = UserMaterialStats
+        fields = [
+            "material_id",
+            "material_title",
+            "attempts",
+            "correct_count",
+            "accuracy",
+            "time_spent_seconds",
+            "last_answered_at",
+        ]
+
+    def get_accuracy(self, obj):
+        return _accuracy(obj.correct_count, obj.attempts)
+
+
+class ProjectLearningStatsSerializer(serializers.Serializer):
+    """프로젝트 학습 통계 Serializer"""
+
+    totals = LearningStatsTotalsSerializer(help_text="전체 통계")
+    daily = DailyLearningStatsSerializer(many=True, help_text="날짜별 통계")
+    materials = MaterialLearningStatsSerializer(many=True, help_text="자료별 통계")
@@ -0,0 +1,178 @@
+import hashlib
+import json
+import threading
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from api.quiz.models import QuizGenerationCache
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class QuizGenerationCacheService:
+    """
+    퀴즈 생성 LLM 결과 캐시 서비스
+
+    같은 자료, 같은 생성 파라미터, 같은 프롬프트/모델 요청은 LLM을 다시 호출하지 않고
+    저장된 문제 JSON을 재사용합니다. 개수/용량 한도를 넘으면 가장 오래 사용되지 않은
+    항목부터 제거합니다 (LRU).
+    """
+
+    _metrics = {"hits": 0, "misses": 0, "bypasses": 0, "evictions": 0}
+    _metrics_lock = threading.Lock()
+
+    @staticmethod
+    def build_key(
+        prompt_template: str,
+        material_hashes: List[str],
+        question_type: str,
+        question_count: int,
+        difficulty: str,
+        model_name: str,
+    ) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            prompt_template: 프롬프트 템플릿 원문 (템플릿이 바뀌면 키도 바뀜)
+            material_hashes: Material 내용 해시 목록 (순서 무관)
+            question_type: 문제 유형
+            question_count: 문제 개수
+            difficulty: 난이도
+            model_name: LLM 모델 이름
+
+        Returns:
+            str: sha256 hex 키
+        """
+        payload = json.dumps(
+            {
+                "prompt": _sha256(prompt_template),
+                "materials": sorted(material_hashes),
+                "question_type": str(question_type),
+                "question_count": int(question_count),
+                "difficulty": str(difficulty),
+                "model": model_name,
+            },
+            sort_keys=True,
+        )
+        return _sha256(payload)
+
+    @staticmethod
+    def get(key: str) -> Optional[List[dict]]:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[List[dict]]: 저장된 문제 목록. 없으면 None
+        """
+        entry = (
+            QuizGenerationCache.objects.filter(key=key).only("id", "questions").first()
+        )
+
+        if entry is None:
+            QuizGenerationCacheService.record("misses")
+            return None
+
+        QuizGenerationCache.objects.filter(id=entry.id).update(
+            hit_count=F("hit_count") + 1, last_accessed_at=timezone.now()
+        )
+        QuizGenerationCacheService.record("hits")
+        return entry.questions
+
+    @staticmethod
+    def set(key: str, questions: List[dict]) -> None:
+        """
+        캐시 저장 (같은 키가 있으면 덮어씀) 후 한도 초과분 제거
+
+        Args:
+            key: 캐시 키
+            questions: 파싱된 문제 목록
+        """
+        size_bytes = len(json.dumps(questions, ensure_ascii=False).encode("utf-8"))
+
+        QuizGenerationCache.objects.update_or_create(
+            key=key,
+            defaults={
+                "questions": questions,
+                "size_bytes": size_bytes,
+                "last_accessed_at": timezone.now(),
+            },
+        )
+        QuizGenerationCacheService.evict()
+
+    @staticmethod
+    def evict(
+        max_entries: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> int:
+        """
+        개수/용량 한도를 넘는 항목을 오래 사용되지 않은 순서로 제거
+
+        Args:
+            max_entries: 최대 항목 수 (기본값: settings.QUIZ_GENERATION_CACHE_MAX_ENTRIES)
+            max_bytes: 최대 총 용량 (기본값: settings.QUIZ_GENERATION_CACHE_MAX_BYTES)
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        if max_entries is None:
+            max_entries = settings.QUIZ_GENERATION_CACHE_MAX_ENTRIES
+        if max_bytes is None:
+            max_bytes = settings.QUIZ_GENERATION_CACHE_MAX_BYTES
+
+        totals = QuizGenerationCache.objects.aggregate(
+            entries=Count("id"), size_bytes=Sum("size_bytes")
+        )
+        entries = totals["entries"]
+        size_bytes = totals["size_bytes"] or 0
+
+        if entries <= max_entries and size_bytes <= max_bytes:
+            return 0
+
+        evict_ids = []
+        for entry_id, entry_size in QuizGenerationCache.objects.order_by(
+            "last_accessed_at"
+        ).values_list("id", "size_bytes"):
+            if entries <= max_entries and size_bytes <= max_bytes:
+                break
+            evict_ids.append(entry_id)
+            entries -= 1
+            size_bytes -= entry_size
+
+        QuizGenerationCache.objects.filter(id__in=evict_ids).delete()
+        QuizGenerationCacheService.record("evictions", len(evict_ids))
+        return len(evict_ids)
+
+    @classmethod
+    def record(cls, name: str, count: int = 1) -> None:
+        """캐시 지표 카운터 증가 (hits, misses, bypasses, evictions)"""
+        with cls._metrics_lock:
+            cls._metrics[name] += count
+
+    @classmethod
+    def get_metrics(cls) -> Dict:
+        """
+        캐시 지표 조회
+
+        Returns:
+            Dict: 프로세스 내 hits/misses/bypasses/evictions, hit_rate, 저장 항목 수 및 용량
+        """
+        with cls._metrics_lock:
+            metrics = dict(cls._metrics)
+
+        lookups = metrics["hits"] + metrics["misses"]
+        metrics["hit_rate"] = round(metrics["hits"] / lookups, 4) if lookups else 0.0
+
+        totals = QuizGenerationCache.objects.aggregate(
+            entries=Count("id"), size_bytes=Sum("size_bytes")
+        )
+        metrics["entries"] = totals["entries"]
+        metrics["size_bytes"] = totals["size_bytes"] or 0
+        return metrics
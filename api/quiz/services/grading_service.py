@@ -0,0 +1,190 @@
+import re
+import unicodedata
+from collections import Counter
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from loguru import logger
+
+from api.quiz.models import QuizQuestions, QuizQuestionType
+from llm.services.answer_grader import AnswerGrader, GradingItem
+
+# 문장 부호 (숫자 사이의 소수점/자릿수 쉼표는 유지) - 공백으로 접음
+# 부호(-, +), 연산자(^, *, /, =), 괄호 등은 답의 의미를 바꾸므로 지우지 않음
+_PUNCTUATION_RE = re.compile(r"(?<!\d)[.,]|[.,](?!\d)|[!?;:'\"“”‘’…]")
+_WHITESPACE_RE = re.compile(r"\s+")
+# 단어 끝 조사/서술격 조사 (두 글자 이상만, 긴 것부터)
+# 한 글자 조사(은/는/이/가/다 등)는 "바다", "고양이"처럼 단어의 일부와 구분할 수 없으므로
+# 지우지 않고 유사도/LLM 채점에 맡김. 조사를 지운 뒤에도 두 글자 이상 남아야 함
+_PARTICLE_RE = re.compile(
+    r"(?<=\w\w)(?:입니다|이에요|에서|에게|으로|이랑|까지|부터|이다|예요)$"
+)
+# 숫자/기호가 포함된 비교 키 (유사도로 채점하지 않고 정확히 같아야 정답)
+_EXACT_MATCH_RE = re.compile(r"[\d\W_]")
+# 객관식 답안의 선지 번호 ("2", "2번", "②", "1, 3" 등)
+_CHOICE_NUMBER_RE = re.compile(r"\d+")
+
+
+def normalize(text) -> str:
+    """
+    비교용 정규화
+
+    NFKC(전각/원문자 등 호환 문자 통합) → 대소문자 통합 → 문장 부호 제거 → 공백 정리
+    """
+    text = unicodedata.normalize("NFKC", str(text)).casefold()
+    text = _PUNCTUATION_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def comparable_key(text) -> str:
+    """조사와 띄어쓰기 차이를 무시하는 비교 키 ("머신 러닝입니다" → "머신러닝")"""
+    return "".join(_PARTICLE_RE.sub("", token) for token in normalize(text).split())
+
+
+def requires_exact_match(key: str) -> bool:
+    """숫자/기호가 들어 있어 글자 하나 차이로 답이 달라지는 비교 키인지 여부"""
+    return bool(_EXACT_MATCH_RE.search(key))
+
+
+def _bigrams(text: str) -> Counter:
+    if len(text) < 2:
+        return Counter([text]) if text else Counter()
+    return Counter(text[index : index + 2] for index in range(len(text) - 1))
+
+
+def similarities(pairs: List[Tuple[str, str]]) -> List[float]:
+    """
+    비교 키 쌍들의 글자 bigram Dice 계수 (0~1) 일괄 계산
+
+    같은 키의 bigram은 한 번만 만들어 재사용
+    """
+    bigrams = {key: _bigrams(key) for pair in pairs for key in pair}
+    sizes = {key: sum(counter.values()) for key, counter in bigrams.items()}
+
+    scores = []
+    for left, right in pairs:
+        total = sizes[left] + sizes[right]
+        if total == 0:
+            scores.append(0.0)
+            continue
+        shared = sum((bigrams[left] & bigrams[right]).values())
+        scores.append(2 * shared / total)
+    return scores
+
+
+class GradingService:
+    """
+    답안 일괄 채점 서비스
+
+    제출된 답안 전체를 한 번에 채점합니다.
+    1. 객관식: 선지 번호 비교
+    2. 서술형: 정규화/조사 무시 비교 키가 같으면 정답
+       (숫자/기호가 들어 있는 답은 비교 키가 같아야만 정답)
+    3. 서술형: 비교 키의 유사도가 QUIZ_GRADING_ACCEPT_SIMILARITY 이상이면 정답,
+       QUIZ_GRADING_REJECT_SIMILARITY 미만이면 오답 (유사도는 남은 답안 전체를 일괄 계산)
+    4. 그 사이의 애매한 답안만 모아 LLM 한 번으로 일괄 채점
+       (LLM 사용 안 함/실패 시 두 기준의 중간값으로 판단)
+    """
+
+    def __init__(self, answer_grader: Optional[AnswerGrader] = None):
+        """
+        Args:
+            answer_grader: LLM 채점기 (None이면 필요할 때 기본 채점기 생성, 테스트에서는 fake 모델 주입)
+        """
+        self.answer_grader = answer_grader
+
+    def grade(self, submissions: List[Tuple[QuizQuestions, str]]) -> List[bool]:
+        """
+        답안 일괄 채점
+
+        Args:
+            submissions: [(문제, 답안), ...]
+
+        Returns:
+            List[bool]: 입력 순서대로 정답 여부
+        """
+        results: List[Optional[bool]] = [None] * len(submissions)
+        fuzzy: List[Tuple[int, Tuple[str, str]]] = []
+        ambiguous = []
+
+        for index, (question, answer) in enumerate(submissions):
+            expected = question.answers.get("answer")
+            if expected is None or not normalize(answer):
+                results[index] = False
+                continue
+
+            question_type = question.metadata.get("question_type")
+            if question_type == QuizQuestionType.MULTIPLE_CHOICE:
+                results[index] = self._grade_choice(expected, answer)
+                continue
+
+            expected_key, answer_key = comparable_key(expected), comparable_key(answer)
+            if expected_key == answer_key:
+                results[index] = True
+                continue
+            if requires_exact_match(expected_key) or requires_exact_match(answer_key):
+                results[index] = False
+                continue
+
+            fuzzy.append((index, (expected_key, answer_key)))
+
+        # 정확 비교로 결정되지 않은 답안만 모아 유사도를 한 번에 계산
+        scores = similarities([pair for _, pair in fuzzy])
+        for (index, _), score in zip(fuzzy, scores):
+            if score >= settings.QUIZ_GRADING_ACCEPT_SIMILARITY:
+                results[index] = True
+            elif score < settings.QUIZ_GRADING_REJECT_SIMILARITY:
+                results[index] = False
+            else:
+                ambiguous.append((index, score))
+
+        if ambiguous:
+            for (index, _), is_correct in zip(
+                ambiguous, self._grade_ambiguous(submissions, ambiguous)
+            ):
+                results[index] = is_correct
+
+        return results
+
+    @staticmethod
+    def _grade_choice(expected, answer) -> bool:
+        """객관식 채점 (고른 선지 번호 집합 비교, 더 고르거나 덜 고르면 오답)"""
+        expected_numbers = {
+            int(number) for number in _CHOICE_NUMBER_RE.findall(normalize(expected))
+        }
+        answer_numbers = {
+            int(number) for number in _CHOICE_NUMBER_RE.findall(normalize(answer))
+        }
+        if not expected_numbers or not answer_numbers:
+            return normalize(expected) == normalize(answer)
+        return expected_numbers == answer_numbers
+
+    def _grade_ambiguous(
+        self,
+        submissions: List[Tuple[QuizQuestions, str]],
+        ambiguous: List[Tuple[int, float]],
+    ) -> List[bool]:
+        """애매한 서술형 답안을 LLM 한 번으로 채점 (실패 시 유사도 중간값 기준)"""
+        threshold = (
+            settings.QUIZ_GRADING_ACCEPT_SIMILARITY
+            + settings.QUIZ_GRADING_REJECT_SIMILARITY
+        ) / 2
+        fallback = [score >= threshold for _, score in ambiguous]
+
+        if not settings.QUIZ_GRADING_USE_LLM:
+            return fallback
+
+        items = [
+            GradingItem(
+                question=submissions[index][0].question,
+                expected=str(submissions[index][0].answers.get("answer")),
+                answer=str(submissions[index][1]),
+            )
+            for index, _ in ambiguous
+        ]
+        try:
+            grader = self.answer_grader or AnswerGrader()
+            return grader.grade(items)
+        except Exception as e:
+            logger.warning(f"LLM answer grading failed, using similarity: {e}")
+            return fallback
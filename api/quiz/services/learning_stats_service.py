@@ -0,0 +1,203 @@
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F, Max, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from api.project.models import Project
+from api.quiz.models import (
+    Quiz,
+    QuizAnswerHistory,
+    UserMaterialStats,
+    UserProjectDailyStats,
+)
+from api.user.models import User
+
+# 답안 변경 내역 (이전 답안 기록 또는 None, 새 정답 여부, 이번 풀이 시간(초))
+AnswerChange = Tuple[Optional[QuizAnswerHistory], bool, int]
+
+
+class LearningStatsService:
+    """
+    학습 통계 롤업 서비스
+
+    답안 제출 트랜잭션 안에서 사용자 × 프로젝트 × 날짜, 사용자 × 자료 롤업을 증분 갱신하고,
+    통계 조회는 롤업 테이블만 읽습니다. 롤업이 어긋나면 rebuild_learning_stats 명령으로
+    답안 기록에서 다시 계산합니다.
+    """
+
+    @staticmethod
+    def record(user: User, quiz_id: str, changes: List[AnswerChange]) -> None:
+        """
+        답안 제출 내역을 롤업에 반영
+
+        새로 푼 문제는 풀이 수 +1, 다시 제출한 문제는 정답 여부 변화만 반영하며,
+        다시 제출한 답안은 처음 제출한 날짜의 롤업에 반영합니다.
+
+        Args:
+            user: 사용자
+            quiz_id: Quiz ID
+            changes: [(이전 답안 기록 또는 None, 새 정답 여부, 풀이 시간), ...]
+        """
+        today = timezone.now().date()
+        daily: Dict = defaultdict(lambda: [0, 0, 0])
+        for previous, is_correct, time_spent in changes:
+            date = previous.created_at.date() if previous else today
+            deltas = daily[date]
+            deltas[0] += 0 if previous else 1
+            deltas[1] += int(is_correct) - int(bool(previous and previous.is_correct))
+            deltas[2] += time_spent
+
+        project_id = Quiz.objects.values_list("project_id", flat=True).get(id=quiz_id)
+        for date, deltas in daily.items():
+            LearningStatsService._increment(
+                UserProjectDailyStats,
+                [{"user": user, "project_id": project_id, "date": date}],
+                *deltas,
+            )
+
+        material_ids = Quiz.materials.through.objects.filter(
+            quiz_id=quiz_id
+        ).values_list("material_id", flat=True)
+        totals = [sum(deltas[index] for deltas in daily.values()) for index in range(3)]
+        LearningStatsService._increment(
+            UserMaterialStats,
+            [
+                {"user": user, "material_id": material_id}
+                for material_id in material_ids
+            ],
+            *totals,
+            last_answered_at=timezone.now(),
+        )
+
+    @staticmethod
+    def _increment(
+        model, keys: List[dict], attempts: int, correct: int, time_spent: int, **values
+    ) -> None:
+        """
+        롤업 행 증분 갱신
+
+        빈 행을 먼저 만들고 (이미 있으면 무시) F 표현식으로 더하므로,
+        동시 제출에서도 증분이 유실되지 않습니다.
+        """
+        if not keys:
+            return
+        model.objects.bulk_create([model(**key) for key in keys], ignore_conflicts=True)
+        condition = Q()
+        for key in keys:
+            condition |= Q(**key)
+        model.objects.filter(condition).update(
+            attempts=F("attempts") + attempts,
+            correct_count=F("correct_count") + correct,
+            time_spent_seconds=F("time_spent_seconds") + time_spent,
+            **values,
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(user_ids: Optional[Iterable[int]] = None) -> Tuple[int, int]:
+        """
+        답안 기록으로 롤업 전체 재계산
+
+        Args:
+            user_ids: 재계산할 사용자 ID 목록 (None이면 전체)
+
+        Returns:
+            (날짜별 롤업 행 수, 자료별 롤업 행 수)
+        """
+        histories = QuizAnswerHistory.objects.order_by()
+        daily_stats = UserProjectDailyStats.objects.all()
+        material_stats = UserMaterialStats.objects.all()
+        if user_ids is not None:
+            user_ids = list(user_ids)
+            histories = histories.filter(user_id__in=user_ids)
+            daily_stats = daily_stats.filter(user_id__in=user_ids)
+            material_stats = material_stats.filter(user_id__in=user_ids)
+
+        daily_stats.delete()
+        material_stats.delete()
+
+        aggregates = {
+            "attempts": Count("id"),
+            "correct": Count("id", filter=Q(is_correct=True)),
+            "time_spent": Coalesce(Sum("time_spent_seconds"), 0),
+        }
+        daily_rows = histories.values(
+            "user_id",
+            project_id=F("quiz_question__quiz__project_id"),
+            date=TruncDate("created_at"),
+        ).annotate(**aggregates)
+        material_rows = (
+            histories.filter(quiz_question__quiz__materials__isnull=False)
+            .values("user_id", material_id=F("quiz_question__quiz__materials"))
+            .annotate(**aggregates, last_answered_at=Max("updated_at"))
+        )
+
+        created_daily = UserProjectDailyStats.objects.bulk_create(
+            [
+                UserProjectDailyStats(
+                    user_id=row["user_id"],
+                    project_id=row["project_id"],
+                    date=row["date"],
+                    attempts=row["attempts"],
+                    correct_count=row["correct"],
+                    time_spent_seconds=row["time_spent"],
+                )
+                for row in daily_rows
+            ],
+            batch_size=1000,
+        )
+        created_material = UserMaterialStats.objects.bulk_create(
+            [
+                UserMaterialStats(
+                    user_id=row["user_id"],
+                    material_id=row["material_id"],
+                    attempts=row["attempts"],
+                    correct_count=row["correct"],
+                    time_spent_seconds=row["time_spent"],
+                    last_answered_at=row["last_answered_at"],
+                )
+                for row in material_rows
+            ],
+            batch_size=1000,
+        )
+        return len(created_daily), len(created_material)
+
+    @staticmethod
+    def get_project_stats(project_id: int, user: User, days: int) -> dict:
+        """
+        프로젝트 학습 통계 조회 (롤업 테이블만 사용)
+
+        Args:
+            project_id: 프로젝트 ID
+            user: 사용자
+            days: 최근 며칠간의 날짜별 통계를 반환할지
+
+        Returns:
+            dict: {"totals": {...}, "daily": [...], "materials": [...]}
+
+        Raises:
+            Project.DoesNotExist: 프로젝트를 찾을 수 없음
+        """
+        project = Project.objects.only("id").get(id=project_id, user=user)
+
+        project_daily = UserProjectDailyStats.objects.filter(user=user, project=project)
+        totals = project_daily.aggregate(
+            attempts=Coalesce(Sum("attempts"), 0),
+            correct_count=Coalesce(Sum("correct_count"), 0),
+            time_spent_seconds=Coalesce(Sum("time_spent_seconds"), 0),
+        )
+        since = timezone.now().date() - timedelta(days=days - 1)
+
+        return {
+            "totals": totals,
+            "daily": project_daily.filter(date__gte=since).order_by("date"),
+            "materials": UserMaterialStats.objects.filter(
+                user=user, material__project=project
+            )
+            .select_related("material")
+            .order_by("-last_answered_at"),
+        }
@@ -0,0 +1,185 @@
+import queue
+import threading
+from itertools import product
+from typing import List
+
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from loguru import logger
+
+from api.project.models import Material
+from api.quiz.models import QuizDifficulty, QuizPoolQuestion, QuizQuestionType
+from llm.llm_settings import QUIZ_POOL_MAX_CONCURRENCY, QUIZ_POOL_SIZE_PER_DIFFICULTY
+from llm.services.context_packer import ContextPacker
+from llm.services.quiz_generator import QuizGenerator
+
+# 문제 풀에 미리 생성해 두는 문제 유형 (mixed 요청은 두 유형에서 섞어 꺼냄)
+POOL_QUESTION_TYPES = [QuizQuestionType.MULTIPLE_CHOICE, QuizQuestionType.SHORT_ANSWER]
+
+
+class QuestionPoolService:
+    """
+    자료별 사전 생성 문제 풀 서비스
+
+    QUIZ_POOL_SIZE_PER_DIFFICULTY(llm_settings)로 켜면, 자료가 등록될 때 낮은 우선순위의
+    백그라운드 워커(단일 스레드, 낮은 LLM 동시 호출 수)가 난이도/문제 유형별로 문제를 미리
+    생성해 둡니다. 퀴즈 생성 시 미사용 문제를 바로 꺼내 쓰고,
+    꺼낸 만큼은 다시 비동기로 채웁니다.
+    """
+
+    _queue: queue.Queue = queue.Queue()
+    _pending = set()
+    _lock = threading.Lock()
+    _worker = None
+
+    @classmethod
+    def enqueue(cls, material_id) -> None:
+        """
+        자료의 문제 풀 채우기 작업 예약 (이미 대기 중이면 무시)
+
+        Args:
+            material_id: Material ID
+        """
+        if QUIZ_POOL_SIZE_PER_DIFFICULTY <= 0:
+            return
+
+        material_id = str(material_id)
+        with cls._lock:
+            if material_id in cls._pending:
+                return
+            cls._pending.add(material_id)
+            cls._queue.put(material_id)
+
+            if cls._worker is None or not cls._worker.is_alive():
+                cls._worker = threading.Thread(target=cls._run_worker, daemon=True)
+                cls._worker.start()
+
+    @classmethod
+    def _run_worker(cls) -> None:
+        """대기열의 자료를 하나씩 처리하는 워커 루프"""
+        while True:
+            material_id = cls._queue.get()
+            with cls._lock:
+                cls._pending.discard(material_id)
+
+            try:
+                cls.refill(material_id)
+            except Exception as e:
+                logger.error(f"Question pool refill failed ({material_id}): {e}")
+            finally:
+                close_old_connections()
+
+    @staticmethod
+    def refill(material_id) -> int:
+        """
+        자료의 난이도/문제 유형별 미사용 문제를 목표 개수까지 생성
+
+        Args:
+            material_id: Material ID
+
+        Returns:
+            int: 새로 생성한 문제 수
+        """
+        # quiz_service가 이 모듈을 import하므로 순환 import를 피하기 위해 지연 import
+        from api.quiz.services.quiz_service import QuizService
+
+        material = Material.objects.filter(id=material_id).first()
+        if material is None:
+            return 0
+
+        target = QUIZ_POOL_SIZE_PER_DIFFICULTY
+        generator = QuizGenerator(max_concurrency=QUIZ_POOL_MAX_CONCURRENCY)
+        pages = None
+        created = 0
+
+        for difficulty, question_type in product(
+            QuizDifficulty.values, POOL_QUESTION_TYPES
+        ):
+            shortage = (
+                target
+                - QuizPoolQuestion.objects.filter(
+                    material=material,
+                    difficulty=difficulty,
+                    question_type=question_type,
+                    used_at__isnull=True,
+                ).count()
+            )
+            if shortage <= 0:
+                continue
+
+            if pages is None:
+                pages = ContextPacker().pack(
+                    QuizService.load_material_pages([material])
+                )
+
+            questions = [
+                QuizService.to_question_data(item, difficulty)
+                for item in generator.generate(
+                    pages, shortage, question_type, difficulty
+                )
+            ]
+            QuizPoolQuestion.objects.bulk_create(
+                [
+                    QuizPoolQuestion(
+                        material=material,
+                        question_type=question_data["metadata"]["question_type"],
+                        difficulty=difficulty,
+                        question=question_data["question"],
+                        answers=question_data["answers"],
+                        metadata=question_data["metadata"],
+                    )
+                    for question_data in questions
+                ]
+            )
+            created += len(questions)
+
+        return created
+
+    @staticmethod
+    @transaction.atomic
+    def take(
+        materials: List[Material],
+        question_type: str,
+        difficulty: str,
+        count: int,
+    ) -> List[QuizPoolQuestion]:
+        """
+        미사용 문제를 꺼내 사용 처리
+
+        여러 자료가 선택된 경우 자료별로 번갈아 꺼내 고르게 섞습니다.
+        동시 요청이 같은 문제를 가져가지 않도록 행 잠금(skip locked)을 사용합니다.
+
+        Args:
+            materials: Material 목록
+            question_type: 문제 유형 (mixed면 유형 무관)
+            difficulty: 난이도
+            count: 최대 개수
+
+        Returns:
+            List[QuizPoolQuestion]: 꺼낸 문제 목록 (count보다 적을 수 있음)
+        """
+        candidates = QuizPoolQuestion.objects.filter(
+            difficulty=difficulty, used_at__isnull=True
+        )
+        if question_type != QuizQuestionType.MIXED:
+            candidates = candidates.filter(question_type=question_type)
+
+        per_material = [
+            list(
+                candidates.filter(material=material)
+                .select_for_update(skip_locked=True)
+                .order_by("created_at")[:count]
+            )
+            for material in materials
+        ]
+
+        taken = []
+        for index in range(count):
+            for questions in per_material:
+                if index < len(questions) and len(taken) < count:
+                    taken.append(questions[index])
+
+        QuizPoolQuestion.objects.filter(
+            id__in=[question.id for question in taken]
+        ).update(used_at=timezone.now())
+        return taken
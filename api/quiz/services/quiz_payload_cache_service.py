@@ -0,0 +1,78 @@
+import hashlib
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from api.quiz.models import Quiz, QuizStatus
+
+# 퀴즈 상세 응답 형식(QuizSerializer)이 바뀌면 올려서 이전 캐시를 무효화
+PAYLOAD_SCHEMA_VERSION = 1
+
+
+class QuizPayloadCacheService:
+    """
+    완료된 퀴즈 상세 응답 캐시 서비스
+
+    캐시 키에 Quiz.updated_at을 버전으로 포함하므로, 문제/자료가 바뀌면
+    invalidate()로 updated_at만 올려도 이전 키는 더 이상 조회되지 않습니다.
+    (여러 프로세스가 각자 캐시를 가지고 있어도 DB의 버전을 기준으로 판단)
+    같은 버전에서 ETag도 같으므로 If-None-Match 요청은 직렬화 없이 304로 응답할 수 있습니다.
+    """
+
+    @staticmethod
+    def is_cacheable(quiz: Quiz) -> bool:
+        """완료된 퀴즈만 캐시 (생성 중/취소된 퀴즈는 문제가 바뀔 수 있음)"""
+        return quiz.status == QuizStatus.COMPLETED
+
+    @staticmethod
+    def build_key(quiz: Quiz) -> str:
+        """버전 포함 캐시 키 생성"""
+        version = int(quiz.updated_at.timestamp() * 1_000_000)
+        return f"quiz-payload:v{PAYLOAD_SCHEMA_VERSION}:{quiz.id}:{version}"
+
+    @staticmethod
+    def get_etag(quiz: Quiz) -> str:
+        """캐시 키 기반 ETag (따옴표 포함)"""
+        key = QuizPayloadCacheService.build_key(quiz)
+        return '"' + hashlib.sha256(key.encode("utf-8")).hexdigest()[:32] + '"'
+
+    @staticmethod
+    def get_or_render(quiz: Quiz, render: Callable[[Quiz], dict]) -> dict:
+        """
+        캐시된 응답 반환 (없으면 render 결과를 저장 후 반환)
+
+        Args:
+            quiz: Quiz 객체
+            render: 응답 데이터 생성 함수 (Quiz -> dict)
+
+        Returns:
+            dict: 응답 데이터
+        """
+        if not QuizPayloadCacheService.is_cacheable(quiz):
+            return render(quiz)
+
+        key = QuizPayloadCacheService.build_key(quiz)
+        data = cache.get(key)
+        if data is None:
+            data = render(quiz)
+            cache.set(key, data, settings.QUIZ_PAYLOAD_CACHE_TIMEOUT_SECONDS)
+        return data
+
+    @staticmethod
+    def invalidate(quizzes) -> int:
+        """
+        퀴즈 캐시 무효화 (updated_at을 올려 캐시 키 버전 변경)
+
+        캐시 대상인 완료된 퀴즈만 갱신하므로, 생성 중 문제 저장에서는 행을 쓰지 않습니다.
+
+        Args:
+            quizzes: 무효화할 Quiz QuerySet
+
+        Returns:
+            int: 갱신된 퀴즈 수
+        """
+        return quizzes.filter(status=QuizStatus.COMPLETED).update(
+            updated_at=timezone.now()
+        )
@@ -1,50 +1,100 @@
+import hashlib
+import json
 import threading
-import time
-from typing import Dict, List
+from datetime import timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from django.db import transaction
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Count, Prefetch, Q, QuerySet
 from django.utils import timezone
 
 from api.project.models import Material, Project
+from api.project.services import MaterialService
 from api.quiz.models import (
     Quiz,
     QuizAnswerHistory,
+    QuizAttemptSummary,
     QuizDifficulty,
     QuizQuestions,
     QuizQuestionType,
+    QuizStatus,
 )
+from api.quiz.services.generation_cache_service import QuizGenerationCacheService
+from api.quiz.services.grading_service import GradingService
+from api.quiz.services.learning_stats_service import LearningStatsService
+from api.quiz.services.question_pool_service import QuestionPoolService
+from api.quiz.services.quiz_payload_cache_service import QuizPayloadCacheService
 from api.user.models import User
+from llm.services.context_packer import ContextPacker
+from llm.services.quiz_generator import (
+    GenerationCancelled,
+    MaterialPage,
+    QuizGenerator,
+)
 
 
 class QuizService:
     """퀴즈 생성 및 관리 서비스"""
 
+    # 생성 스레드별 취소 이벤트 {quiz_id: Event}
+    _cancel_events: Dict[str, threading.Event] = {}
+    _cancel_events_lock = threading.Lock()
+
     @staticmethod
     @transaction.atomic
     def create_quiz(
+        user: User,
         project_id: int,
         material_ids: List[str],
         question_type: QuizQuestionType,
         question_count: int,
         difficulty: QuizDifficulty,
+        use_cache: bool = True,
     ) -> Quiz:
         """
         퀴즈 생성 작업 생성 및 백그라운드에서 실행
 
+        자료별 사전 생성 문제 풀에서 먼저 채우고, 모자란 문제만 백그라운드에서 생성합니다.
+        문제 풀만으로 채워지면 바로 완료 상태로 반환합니다.
+        같은 사용자/프로젝트/자료/생성 조건의 요청이 QUIZ_REQUEST_COALESCE_WINDOW_SECONDS 안에
+        다시 들어오면 (더블 탭, 클라이언트 재시도) 새로 생성하지 않고 기존 퀴즈를 반환합니다.
+
         Args:
-            project: 프로젝트
+            user: 사용자 (권한 검증용)
+            project_id: 프로젝트 ID
             material_ids: Material ID 목록
             question_type: 문제 유형
             question_count: 문제 개수
             difficulty: 난이도
+            use_cache: 생성 결과 캐시 사용 여부 (False면 항상 LLM 호출)
 
         Returns:
-            Quiz: 생성된 퀴즈 객체
+            Quiz: 생성된 (또는 진행 중인 같은 요청의) 퀴즈 객체
+
+        Raises:
+            Project.DoesNotExist: 프로젝트를 찾을 수 없음
+            ValueError: 잘못된 Material 선택
         """
-        project = Project.objects.get(id=project_id)
+        # 같은 프로젝트의 동시 생성 요청은 프로젝트 행 잠금으로 순서대로 처리
+        project = Project.objects.select_for_update().get(id=project_id, user=user)
+
+        # 0. 중복 요청이면 기존 퀴즈 반환
+        request_key = QuizService.build_request_key(
+            user_id=user.id,
+            project_id=project.id,
+            material_ids=material_ids,
+            question_type=question_type,
+            question_count=question_count,
+            difficulty=difficulty,
+            use_cache=use_cache,
+        )
+        existing = QuizService.get_coalescible_quizzes(request_key).first()
+        if existing is not None:
+            return existing
 
         # 1. Material 조회 및 검증
-        materials = Material.objects.filter(id__in=material_ids)
+        materials = Material.objects.filter(id__in=material_ids, project=project)
 
         if materials.count() != len(material_ids):
             raise ValueError(
@@ -58,128 +108,430 @@ class QuizService:
             question_count=question_count,
             difficulty=difficulty,
             status="pending",
+            request_key=request_key,
         )
 
         # 3. ManyToMany 관계 설정
         quiz.materials.set(materials)
 
-        # 4. 백그라운드에서 퀴즈 생성 시작
-        thread = threading.Thread(
-            target=QuizService._generate_quiz_background, args=(quiz.id,)
+        # 4. 사전 생성 문제 풀에서 먼저 채움 (캐시 미사용 요청은 새로 생성)
+        pooled = []
+        if use_cache:
+            pooled = QuestionPoolService.take(
+                list(materials), question_type, difficulty, question_count
+            )
+        for number, pool_question in enumerate(pooled, start=1):
+            QuizQuestions.objects.create(
+                quiz=quiz,
+                question=pool_question.question,
+                answers=pool_question.answers,
+                metadata={**pool_question.metadata, "question_number": number},
+            )
+
+        if pooled:
+            # 꺼낸 만큼 문제 풀을 비동기로 다시 채움
+            for material in materials:
+                transaction.on_commit(
+                    lambda material_id=material.id: QuestionPoolService.enqueue(
+                        material_id
+                    )
+                )
+
+        if len(pooled) == question_count:
+            quiz.status = "completed"
+            quiz.started_at = quiz.completed_at = timezone.now()
+            quiz.progress_percentage = 100
+            quiz.save()
+            return quiz
+
+        quiz.progress_percentage = len(pooled) * 100 // question_count
+        quiz.save(update_fields=["progress_percentage", "updated_at"])
+
+        # 5. 부족한 문제는 백그라운드에서 생성 (커밋 후 시작해야 스레드에서 조회 가능)
+        transaction.on_commit(
+            lambda: threading.Thread(
+                target=QuizService._generate_quiz_background,
+                args=(quiz.id, use_cache),
+                daemon=True,
+            ).start()
         )
-        thread.daemon = True
-        thread.start()
 
         return quiz
 
     @staticmethod
-    def _generate_quiz_background(quiz_id: str):
+    def build_request_key(
+        user_id: int,
+        project_id: int,
+        material_ids: List[str],
+        question_type: str,
+        question_count: int,
+        difficulty: str,
+        use_cache: bool,
+    ) -> str:
+        """중복 요청 판별용 키 (Material 순서 무관)"""
+        payload = json.dumps(
+            {
+                "user": user_id,
+                "project": project_id,
+                "materials": sorted(str(material_id) for material_id in material_ids),
+                "question_type": str(question_type),
+                "question_count": int(question_count),
+                "difficulty": str(difficulty),
+                "use_cache": bool(use_cache),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_coalescible_quizzes(request_key: str) -> QuerySet:
+        """
+        같은 요청 키로 QUIZ_REQUEST_COALESCE_WINDOW_SECONDS 안에 만들어진 진행 중/완료 퀴즈 조회
+
+        Args:
+            request_key: build_request_key로 만든 요청 키
+
+        Returns:
+            QuerySet: 최근 순 퀴즈 (request_key 부분 인덱스 범위 조회)
+        """
+        return Quiz.objects.filter(
+            request_key=request_key,
+            created_at__gte=timezone.now()
+            - timedelta(seconds=settings.QUIZ_REQUEST_COALESCE_WINDOW_SECONDS),
+        ).exclude(status__in=[QuizStatus.FAILED, QuizStatus.CANCELLED])
+
+    @staticmethod
+    def _generate_quiz_background(quiz_id: str, use_cache: bool = True):
         """
-        백그라운드에서 퀴즈 생성 (별도 스레드)
+        백그라운드에서 퀴즈 생성 (별도 스레드에서만 호출, 끝나면 스레드의 DB 연결을 닫음)
+
+        문제를 하나 저장할 때마다 퀴즈 행을 잠그고 상태를 확인하여,
+        다른 요청(다른 프로세스 포함)에서 취소되었으면 생성을 중단합니다.
 
         Args:
             quiz_id: Quiz ID
+            use_cache: 생성 결과 캐시 사용 여부
         """
+        cancel_event = QuizService._register_cancel_event(quiz_id)
         try:
-            # Quiz 조회
+            # 상태를 processing으로 변경 (대기 중 취소된 경우 시작하지 않음)
+            started = Quiz.objects.filter(id=quiz_id, status=QuizStatus.PENDING).update(
+                status=QuizStatus.PROCESSING,
+                started_at=timezone.now(),
+                updated_at=timezone.now(),
+            )
+            if not started:
+                return
             quiz = Quiz.objects.get(id=quiz_id)
 
-            # 상태를 processing으로 변경
-            quiz.status = "processing"
-            quiz.started_at = timezone.now()
-            quiz.progress_percentage = 0
-            quiz.save()
-
-            # Mock AI 퀴즈 생성 함수 호출
-            questions = QuizService._mock_generate_quiz_with_langgraph(quiz)
+            # 문제 풀에서 채운 문제를 제외한 나머지를 LLM으로 생성
+            # 문제가 완성되는 즉시 저장하여 클라이언트가 먼저 풀 수 있게 함
+            saved = quiz.questions.count()
+            remaining = quiz.question_count - saved
+            for question_data in QuizService._generate_questions(
+                quiz, remaining, use_cache, cancel_event
+            ):
+                with transaction.atomic():
+                    if not QuizService._lock_processing_quiz(quiz_id):
+                        # 취소됨 - 반복을 중단하면 남은 LLM 호출도 취소됨
+                        cancel_event.set()
+                        break
 
-            # QuizQuestions 객체 생성
-            with transaction.atomic():
-                for question_data in questions:
+                    saved += 1
                     QuizQuestions.objects.create(
                         quiz=quiz,
                         question=question_data["question"],
                         answers=question_data["answers"],
-                        metadata=question_data["metadata"],
+                        metadata={
+                            **question_data["metadata"],
+                            "question_number": saved,
+                        },
+                    )
+                    quiz.progress_percentage = min(
+                        99, saved * 100 // quiz.question_count
                     )
+                    quiz.save(update_fields=["progress_percentage", "updated_at"])
+
+            if cancel_event.is_set():
+                return
+
+            if saved == 0:
+                raise ValueError("생성된 문제가 없습니다.")
+
+            # Quiz 상태 업데이트 (그 사이 취소되었으면 변경하지 않음)
+            Quiz.objects.filter(id=quiz_id, status=QuizStatus.PROCESSING).update(
+                status=QuizStatus.COMPLETED,
+                completed_at=timezone.now(),
+                progress_percentage=100,
+                updated_at=timezone.now(),
+            )
+            QuizService._refresh_quiz_summaries(quiz_id)
 
-                # Quiz 상태 업데이트
-                quiz.status = "completed"
-                quiz.completed_at = timezone.now()
-                quiz.progress_percentage = 100
-                quiz.save()
+        except GenerationCancelled:
+            pass  # 취소 요청에서 이미 상태를 변경함
 
         except Exception as e:
             # 에러 발생 시 상태 업데이트
             try:
-                quiz = Quiz.objects.get(id=quiz_id)
-                quiz.status = "failed"
-                quiz.error_message = str(e)
-                quiz.completed_at = timezone.now()
-                quiz.save()
+                Quiz.objects.filter(
+                    id=quiz_id,
+                    status__in=[QuizStatus.PENDING, QuizStatus.PROCESSING],
+                ).update(
+                    status=QuizStatus.FAILED,
+                    error_message=str(e),
+                    completed_at=timezone.now(),
+                    updated_at=timezone.now(),
+                )
+                # 실패 전까지 저장된 문제를 먼저 푼 사용자의 요약도 문제 수를 맞춤
+                QuizService._refresh_quiz_summaries(quiz_id)
             except Exception:
                 pass  # Quiz 조회 실패 시 무시
 
+        finally:
+            QuizService._unregister_cancel_event(quiz_id)
+            # 스레드에서 연 DB 연결 반환 (커넥션 풀 사용 시 풀로 돌려줌)
+            connections.close_all()
+
     @staticmethod
-    def _mock_generate_quiz_with_langgraph(quiz: Quiz) -> List[dict]:
+    def _lock_processing_quiz(quiz_id: str) -> bool:
+        """퀴즈 행을 잠그고 아직 생성 중인지 확인 (transaction 안에서 호출)"""
+        return (
+            Quiz.objects.select_for_update()
+            .filter(id=quiz_id, status=QuizStatus.PROCESSING)
+            .exists()
+        )
+
+    @classmethod
+    def _register_cancel_event(cls, quiz_id: str) -> threading.Event:
+        """생성 스레드의 취소 이벤트 등록"""
+        with cls._cancel_events_lock:
+            return cls._cancel_events.setdefault(str(quiz_id), threading.Event())
+
+    @classmethod
+    def _unregister_cancel_event(cls, quiz_id: str) -> None:
+        with cls._cancel_events_lock:
+            cls._cancel_events.pop(str(quiz_id), None)
+
+    @staticmethod
+    def cancel_quiz(quiz_id: str, user: User, keep_partial: bool = False) -> Quiz:
         """
-        Mock AI 퀴즈 생성 함수 (LangGraph 대체용)
-        실제로는 여기에 LangGraph를 사용한 AI 로직이 들어갑니다.
+        진행 중인 퀴즈 생성 취소
+
+        같은 프로세스의 생성 스레드에는 취소 이벤트로 바로 알리고 (진행 중인 LLM 호출 취소),
+        다른 프로세스의 생성 스레드는 문제 저장 전 상태 확인에서 중단됩니다.
 
         Args:
-            quiz: Quiz 객체
+            quiz_id: Quiz ID
+            user: 사용자 (권한 검증용)
+            keep_partial: 취소 전까지 생성된 문제 유지 여부 (False면 삭제)
 
         Returns:
-            List[dict]: 생성된 문제 목록
+            Quiz: 취소된 퀴즈 객체
+
+        Raises:
+            Quiz.DoesNotExist: 퀴즈를 찾을 수 없음
+            PermissionError: 권한 없음
+            ValueError: 이미 완료/실패/취소된 퀴즈
         """
-        questions = []
+        with transaction.atomic():
+            quiz = (
+                Quiz.objects.select_for_update(of=("self",))
+                .select_related("project")
+                .get(id=quiz_id)
+            )
 
-        # 문제 생성 시뮬레이션 (각 문제마다 2초 소요)
-        for i in range(quiz.question_count):
-            # Progress 업데이트
-            quiz.progress_percentage = int(((i + 1) / quiz.question_count) * 100)
-            quiz.save()
+            if quiz.project.user_id != user.id:
+                raise PermissionError("해당 퀴즈에 접근할 권한이 없습니다.")
 
-            # 문제 생성 시간 시뮬레이션
-            time.sleep(2)
+            if quiz.status not in (QuizStatus.PENDING, QuizStatus.PROCESSING):
+                raise ValueError("이미 완료되었거나 취소된 퀴즈입니다.")
 
-            # Mock 문제 생성
-            if quiz.question_type == "multiple_choice" or (
-                quiz.question_type == "mixed" and i % 2 == 0
-            ):
-                question = {
-                    "question": f"Mock 문제 {i + 1}: 이것은 객관식 문제입니다. ({quiz.difficulty} 난이도)",
-                    "answers": {
-                        "1": "선택지 1",
-                        "2": "선택지 2 (정답)",
-                        "3": "선택지 3",
-                        "4": "선택지 4",
-                        "answer": "2",  # 정답은 2번
-                    },
-                    "metadata": {
-                        "question_type": "multiple_choice",
-                        "difficulty": quiz.difficulty,
-                        "explanation": "이 문제의 정답은 '선택지 2'입니다. Mock 생성된 해설입니다.",
-                        "question_number": i + 1,
-                    },
-                }
+            quiz.status = QuizStatus.CANCELLED
+            quiz.completed_at = timezone.now()
+            quiz.save()
+
+            if not keep_partial:
+                # 생성 중에 먼저 풀어 본 답안이 있으면 함께 삭제되므로 해당 사용자의 롤업을 다시 계산
+                answered_user_ids = list(
+                    QuizAnswerHistory.objects.filter(quiz_question__quiz=quiz)
+                    .order_by()
+                    .values_list("user_id", flat=True)
+                    .distinct()
+                )
+                # 일괄 삭제는 문제별 무효화 신호를 건너뛰므로 아래에서 퀴즈 단위로 한 번 무효화
+                quiz.questions.all().delete()
+                # 문제와 함께 답안 기록도 삭제되므로 풀이 요약도 제거
+                QuizAttemptSummary.objects.filter(quiz=quiz).delete()
+                if answered_user_ids:
+                    LearningStatsService.rebuild(answered_user_ids)
+                QuizPayloadCacheService.invalidate(Quiz.objects.filter(id=quiz.id))
             else:
-                question = {
-                    "question": f"Mock 문제 {i + 1}: 이것은 서술형 문제입니다. ({quiz.difficulty} 난이도)",
-                    "answers": {
-                        "answer": "Mock 정답입니다.",
-                    },
-                    "metadata": {
-                        "question_type": "short_answer",
-                        "difficulty": quiz.difficulty,
-                        "explanation": "서술형 문제의 모범 답안입니다. Mock 생성된 해설입니다.",
-                        "question_number": i + 1,
-                    },
-                }
-
-            questions.append(question)
-
-        return questions
+                QuizService._refresh_quiz_summaries(quiz.id)
+
+        with QuizService._cancel_events_lock:
+            cancel_event = QuizService._cancel_events.get(str(quiz_id))
+        if cancel_event is not None:
+            cancel_event.set()
+
+        return quiz
+
+    @staticmethod
+    def _generate_questions(
+        quiz: Quiz,
+        question_count: int,
+        use_cache: bool = True,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Iterator[dict]:
+        """
+        선택된 Material의 페이지 텍스트로 LLM 퀴즈 생성
+
+        토큰 예산에 맞게 페이지를 고른 뒤 (ContextPacker),
+        청크로 나누어 병렬 스트리밍 생성합니다 (QuizGenerator).
+        문제는 완성되는 순서대로 하나씩 반환됩니다.
+        같은 자료/파라미터/프롬프트/모델의 결과가 캐시에 있으면 LLM을 호출하지 않습니다.
+
+        Args:
+            quiz: Quiz 객체
+            question_count: 생성할 문제 수
+            use_cache: 캐시 조회 여부 (False여도 새 결과는 캐시에 저장)
+            cancel_event: 설정되면 진행 중인 LLM 호출 취소
+
+        Yields:
+            dict: QuizQuestions 생성용 문제 데이터
+        """
+        materials = list(quiz.materials.all())
+        generator = QuizGenerator()
+
+        # 해시가 저장되지 않은 자료(URL 등)는 지금 내용을 가져와 해시하고, 생성에도 그대로 사용
+        fetched_pages = {
+            str(material.id): MaterialService.extract_pages(material)
+            for material in materials
+            if not MaterialService.has_stored_content_hash(material)
+        }
+        cache_key = QuizGenerationCacheService.build_key(
+            prompt_template=generator.prompt_builder.system_prompt,
+            material_hashes=[
+                MaterialService.get_content_hash(
+                    material, fetched_pages.get(str(material.id))
+                )
+                for material in materials
+            ],
+            question_type=quiz.question_type,
+            question_count=question_count,
+            difficulty=quiz.difficulty,
+            # 모델은 요청마다 라우팅되므로 라우팅 설정 식별자를 키에 사용
+            model_name=generator.router.signature,
+        )
+
+        cached = None
+        if use_cache:
+            cached = QuizGenerationCacheService.get(cache_key)
+        else:
+            QuizGenerationCacheService.record("bypasses")
+
+        if cached is not None:
+            for item in cached:
+                yield QuizService.to_question_data(item, quiz.difficulty)
+            return
+
+        # 토큰 예산 안에서 문서 전체를 고르게 커버하는 페이지만 사용
+        pages = ContextPacker().pack(
+            QuizService.load_material_pages(materials, fetched_pages)
+        )
+        quiz.context_pages = ContextPacker.used_pages(pages)
+        quiz.save(update_fields=["context_pages", "updated_at"])
+
+        generated = []
+        for item in generator.iter_questions(
+            pages,
+            question_count,
+            quiz.question_type,
+            quiz.difficulty,
+            cancel_event=cancel_event,
+        ):
+            generated.append(item)
+            yield QuizService.to_question_data(item, quiz.difficulty)
+
+        # 문제 수가 모자란 결과는 캐시하지 않음
+        if len(generated) == question_count:
+            QuizGenerationCacheService.set(cache_key, generated)
+
+    @staticmethod
+    def load_material_pages(
+        materials: List[Material],
+        fetched_pages: Optional[Dict[str, List[Tuple[int, str]]]] = None,
+    ) -> List[MaterialPage]:
+        """
+        Material 목록의 텍스트를 페이지 단위로 추출
+
+        Args:
+            materials: Material 목록
+            fetched_pages: 이미 추출한 자료별 페이지 (해당 자료는 다시 가져오지 않음)
+
+        Raises:
+            ValueError: 추출된 텍스트가 없음
+        """
+        fetched_pages = fetched_pages or {}
+        pages = []
+        for material in materials:
+            material_pages = fetched_pages.get(str(material.id))
+            if material_pages is None:
+                material_pages = MaterialService.extract_pages(material)
+            for page_number, text in material_pages:
+                pages.append(
+                    MaterialPage(
+                        material_id=str(material.id),
+                        page_number=page_number,
+                        text=text,
+                        material_title=material.title,
+                    )
+                )
+
+        if not pages:
+            raise ValueError("선택된 Material에서 텍스트를 추출할 수 없습니다.")
+
+        return pages
+
+    @staticmethod
+    def to_question_data(generated: dict, difficulty: str) -> dict:
+        """
+        LLM 출력 JSON(create_quizzes.prompt.txt 형식)을 QuizQuestions 데이터로 변환
+
+        Args:
+            generated: {"questionNumber", "question", "answerOptions": [...]} 형식의 문제
+            difficulty: 난이도
+
+        Returns:
+            dict: {"question", "answers", "metadata"}
+        """
+        options = generated.get("answerOptions")
+
+        if options:
+            # 객관식: {"1": "선택지 1", ..., "answer": "정답 번호"}
+            answers = {}
+            explanation = ""
+            for number, option in enumerate(options, start=1):
+                answers[str(number)] = option.get("text", "")
+                if option.get("isCorrect"):
+                    answers["answer"] = str(number)
+                    explanation = option.get("rationale", "")
+            question_type = QuizQuestionType.MULTIPLE_CHOICE
+        else:
+            # 서술형: {"answer": "정답"}
+            answers = {"answer": generated.get("answer", "")}
+            explanation = generated.get("rationale", "")
+            question_type = QuizQuestionType.SHORT_ANSWER
+
+        return {
+            "question": generated.get("question", ""),
+            "answers": answers,
+            "metadata": {
+                "question_type": question_type.value,
+                "difficulty": difficulty,
+                "explanation": explanation,
+                "question_number": generated.get("questionNumber"),
+            },
+        }
 
     @staticmethod
     def get_quiz_status(quiz_id: str, user: User) -> Quiz:
@@ -197,9 +549,10 @@ class QuizService:
             Quiz.DoesNotExist: 퀴즈를 찾을 수 없음
             PermissionError: 권한 없음
         """
-        quiz = Quiz.objects.get(id=quiz_id)
+        # 주기적으로 호출(polling)되므로 권한 확인까지 한 번에 조회
+        quiz = Quiz.objects.select_related("project").get(id=quiz_id)
 
-        if quiz.project.user != user:
+        if quiz.project.user_id != user.id:
             raise PermissionError("해당 퀴즈에 접근할 권한이 없습니다.")
 
         return quiz
@@ -220,12 +573,17 @@ class QuizService:
             Quiz.DoesNotExist: 퀴즈를 찾을 수 없음
             PermissionError: 권한 없음
         """
-        quiz = Quiz.objects.get(id=quiz_id)
+        quiz = Quiz.objects.select_related("project").get(id=quiz_id)
 
-        if quiz.project.user != user:
+        if quiz.project.user_id != user.id:
             raise PermissionError("해당 퀴즈에 접근할 권한이 없습니다.")
 
-        if quiz.status != "completed":
+        # 생성 중(processing)이거나 취소된 퀴즈는 지금까지 저장된 문제만 반환
+        if quiz.status not in (
+            QuizStatus.PROCESSING,
+            QuizStatus.COMPLETED,
+            QuizStatus.CANCELLED,
+        ):
             raise ValueError("퀴즈 생성이 아직 완료되지 않았습니다.")
 
         return quiz
@@ -235,6 +593,9 @@ class QuizService:
         """
         프로젝트의 모든 퀴즈 조회
 
+        목록 페이지 크기와 무관하게 쿼리 수가 일정하도록
+        자료/문제 개수는 annotate로, 자료 제목(최대 3개)과 사용자 풀이 요약은 prefetch로 가져옵니다.
+
         Args:
             project_id: 프로젝트 ID
             user: 사용자 (권한 검증용)
@@ -243,22 +604,39 @@ class QuizService:
             List[Quiz]: 퀴즈 목록
 
         Raises:
-            PermissionError: 권한 없음
+            Project.DoesNotExist: 프로젝트를 찾을 수 없음
         """
         project = Project.objects.get(id=project_id, user=user)
 
-        if project.user != user:
-            raise PermissionError("해당 프로젝트에 접근할 권한이 없습니다.")
-
-        return Quiz.objects.filter(project=project, status="completed").order_by(
-            "-created_at"
+        return (
+            Quiz.objects.filter(project=project, status=QuizStatus.COMPLETED)
+            .annotate(
+                material_count=Count("materials", distinct=True),
+                total_questions=Count("questions", distinct=True),
+            )
+            .prefetch_related(
+                Prefetch(
+                    "materials",
+                    queryset=Material.objects.only("id", "title").order_by(
+                        "-created_at"
+                    )[:3],
+                    to_attr="preview_materials",
+                ),
+                Prefetch(
+                    "attempt_summaries",
+                    queryset=QuizAttemptSummary.objects.filter(user=user),
+                    to_attr="user_attempt_summaries",
+                ),
+            )
+            .order_by("-created_at")
         )
 
     # ============ 퀴즈 풀이 관련 서비스 ============
 
     @staticmethod
-    @transaction.atomic
-    def submit_answer(user: User, question_id: str, answer: str) -> QuizAnswerHistory:
+    def submit_answer(
+        user: User, question_id: str, answer: str, time_spent_seconds: int = 0
+    ) -> QuizAnswerHistory:
         """
         퀴즈 답안 제출 (단일 문제)
 
@@ -266,6 +644,7 @@ class QuizService:
             user: 사용자
             question_id: 문제 ID
             answer: 답안
+            time_spent_seconds: 풀이에 사용한 시간 (초)
 
         Returns:
             QuizAnswerHistory: 답안 기록
@@ -274,50 +653,215 @@ class QuizService:
             QuizQuestions.DoesNotExist: 문제를 찾을 수 없음
         """
         question = QuizQuestions.objects.get(id=question_id)
+        # LLM 채점이 필요할 수 있으므로 트랜잭션 밖에서 채점
+        grades = GradingService().grade([(question, answer)])
 
-        # 정답 확인
-        correct_answer = question.answers.get("answer")
-        is_correct = str(answer).strip() == str(correct_answer).strip()
-
-        # 기존 답안이 있으면 업데이트, 없으면 생성
-        answer_history, created = QuizAnswerHistory.objects.update_or_create(
-            user=user,
-            quiz_question=question,
-            defaults={
-                "answer": answer,
-                "is_correct": is_correct,
-            },
+        (answer_history,) = QuizService._save_answers(
+            user, question.quiz_id, [(question, answer, time_spent_seconds)], grades
         )
-
         return answer_history
 
     @staticmethod
-    @transaction.atomic
     def submit_answers_batch(
-        user: User, answers: List[Dict[str, str]]
+        user: User, quiz_id: str, answers: List[Dict[str, str]]
     ) -> List[QuizAnswerHistory]:
         """
         퀴즈 답안 일괄 제출
 
+        참조된 문제를 한 번에 조회하여 GradingService로 한 번에 채점하고,
+        (user, quiz_question) 유니크 제약을 이용한 bulk upsert 한 번으로 저장합니다.
+        같은 문제가 여러 번 포함되면 마지막 답안을 사용합니다.
+
         Args:
             user: 사용자
-            answers: 답안 목록 [{"question_id": "...", "answer": "..."}, ...]
+            quiz_id: Quiz ID
+            answers: 답안 목록 [{"question_id": "...", "answer": "...", "time_spent_seconds": 0}, ...]
 
         Returns:
             List[QuizAnswerHistory]: 답안 기록 목록
+
+        Raises:
+            ValueError: 퀴즈에 속하지 않는 문제가 포함됨
         """
-        answer_histories = []
+        latest_answers = {
+            str(answer_data["question_id"]): answer_data for answer_data in answers
+        }
+        questions = {
+            str(question.id): question
+            for question in QuizQuestions.objects.filter(
+                id__in=latest_answers.keys(), quiz_id=quiz_id
+            ).only("id", "question", "answers", "metadata")
+        }
+
+        if len(questions) != len(latest_answers):
+            raise ValueError("퀴즈에 속하지 않는 문제가 포함되어 있습니다.")
+
+        submissions = [
+            (
+                questions[question_id],
+                answer_data["answer"],
+                answer_data.get("time_spent_seconds", 0),
+            )
+            for question_id, answer_data in latest_answers.items()
+        ]
+        # LLM 채점이 필요할 수 있으므로 트랜잭션 밖에서 채점
+        grades = GradingService().grade(
+            [(question, answer) for question, answer, _ in submissions]
+        )
+
+        return QuizService._save_answers(user, quiz_id, submissions, grades)
+
+    @staticmethod
+    @transaction.atomic
+    def _save_answers(
+        user: User,
+        quiz_id: str,
+        submissions: List[Tuple[QuizQuestions, str, int]],
+        grades: List[bool],
+    ) -> List[QuizAnswerHistory]:
+        """
+        채점된 답안 저장 및 풀이 요약/학습 통계 갱신
+
+        풀이 요약 행을 잠근 뒤 이전 답안을 조회하여 풀이 시간을 누적하고 학습 통계 증분을 계산한 뒤,
+        (user, quiz_question) 유니크 제약을 이용한 bulk upsert 한 번으로 저장합니다.
+
+        Args:
+            user: 사용자
+            quiz_id: Quiz ID
+            submissions: [(문제, 답안, 풀이 시간(초)), ...]
+            grades: submissions 순서대로 정답 여부
 
-        for answer_data in answers:
-            answer_history = QuizService.submit_answer(
+        Returns:
+            List[QuizAnswerHistory]: 답안 기록 목록
+        """
+        # 같은 (사용자, 퀴즈)의 동시 제출은 풀이 요약 행을 잠가 순서대로 처리
+        # 잠근 뒤에 이전 답안을 조회해야, 동시에 들어온 첫 제출이 둘 다 첫 풀이로 집계되지 않음
+        # (아직 답안이 없으면 잠글 답안 행이 없으므로 요약 행을 먼저 만들어 잠금)
+        QuizAttemptSummary.objects.bulk_create(
+            [QuizAttemptSummary(user=user, quiz_id=quiz_id)], ignore_conflicts=True
+        )
+        QuizAttemptSummary.objects.select_for_update().filter(
+            user=user, quiz_id=quiz_id
+        ).exists()
+
+        previous_histories = {
+            history.quiz_question_id: history
+            for history in QuizAnswerHistory.objects.select_for_update()
+            .filter(
                 user=user,
-                question_id=answer_data["question_id"],
-                answer=answer_data["answer"],
+                quiz_question_id__in=[question.id for question, _, _ in submissions],
             )
-            answer_histories.append(answer_history)
+            .only("quiz_question_id", "is_correct", "time_spent_seconds", "created_at")
+        }
+
+        answer_histories = []
+        changes = []
+        for (question, answer, time_spent), is_correct in zip(submissions, grades):
+            previous = previous_histories.get(question.id)
+            answer_histories.append(
+                QuizAnswerHistory(
+                    user=user,
+                    quiz_question=question,
+                    answer=answer,
+                    is_correct=is_correct,
+                    time_spent_seconds=(previous.time_spent_seconds if previous else 0)
+                    + time_spent,
+                )
+            )
+            changes.append((previous, is_correct, time_spent))
+
+        answer_histories = QuizAnswerHistory.objects.bulk_create(
+            answer_histories,
+            update_conflicts=True,
+            unique_fields=["user", "quiz_question"],
+            update_fields=["answer", "is_correct", "time_spent_seconds", "updated_at"],
+        )
+        QuizService._refresh_attempt_summary(user, quiz_id)
+        LearningStatsService.record(user, quiz_id, changes)
 
         return answer_histories
 
+    @staticmethod
+    def _refresh_attempt_summary(user: User, quiz_id: str) -> QuizAttemptSummary:
+        """
+        사용자의 퀴즈 풀이 요약 갱신
+
+        답안 제출 트랜잭션 안에서 호출되며, 집계 쿼리 한 번과 bulk upsert 한 번으로
+        (user, quiz) 요약 행을 최신 상태로 맞춥니다.
+        재제출로 정답 여부가 바뀌는 경우도 그대로 반영하기 위해
+        증감 대신 해당 퀴즈 범위의 답안만 다시 집계합니다.
+
+        Args:
+            user: 사용자
+            quiz_id: Quiz ID
+
+        Returns:
+            QuizAttemptSummary: 갱신된 풀이 요약
+        """
+        counts = QuizQuestions.objects.filter(quiz_id=quiz_id).aggregate(
+            total=Count("id", distinct=True),
+            answered=Count("answer_histories", filter=Q(answer_histories__user=user)),
+            correct=Count(
+                "answer_histories",
+                filter=Q(
+                    answer_histories__user=user, answer_histories__is_correct=True
+                ),
+            ),
+        )
+        score = counts["correct"] / counts["total"] * 100 if counts["total"] else 0
+
+        (summary,) = QuizAttemptSummary.objects.bulk_create(
+            [
+                QuizAttemptSummary(
+                    user=user,
+                    quiz_id=quiz_id,
+                    total_questions=counts["total"],
+                    answered_count=counts["answered"],
+                    correct_count=counts["correct"],
+                    score=round(score, 2),
+                )
+            ],
+            update_conflicts=True,
+            unique_fields=["user", "quiz"],
+            update_fields=[
+                "total_questions",
+                "answered_count",
+                "correct_count",
+                "score",
+                "updated_at",
+            ],
+        )
+        return summary
+
+    @staticmethod
+    def _refresh_quiz_summaries(quiz_id: str) -> int:
+        """
+        퀴즈의 모든 풀이 요약의 문제 수/점수 갱신
+
+        생성 중(processing)에 먼저 푼 사용자의 요약은 그때까지 저장된 문제 수로 집계되므로,
+        생성이 끝나거나(완료/실패) 생성된 문제를 남기고 취소되면 최종 문제 수로 다시 맞춥니다.
+
+        Args:
+            quiz_id: Quiz ID
+
+        Returns:
+            int: 갱신된 요약 수
+        """
+        summaries = list(QuizAttemptSummary.objects.filter(quiz_id=quiz_id))
+        if not summaries:
+            return 0
+
+        total = QuizQuestions.objects.filter(quiz_id=quiz_id).count()
+        now = timezone.now()
+        for summary in summaries:
+            score = summary.correct_count / total * 100 if total else 0
+            summary.total_questions = total
+            summary.score = round(score, 2)
+            summary.updated_at = now
+        return QuizAttemptSummary.objects.bulk_update(
+            summaries, ["total_questions", "score", "updated_at"]
+        )
+
     @staticmethod
     def get_quiz_result(user: User, quiz_id: str) -> Dict:
         """
@@ -343,29 +887,53 @@ class QuizService:
         """
         quiz = Quiz.objects.get(id=quiz_id)
 
-        # 퀴즈의 모든 문제 조회
-        questions = quiz.questions.all()
-        total_questions = questions.count()
+        # 답안 제출 시 갱신된 요약을 읽고, 아직 제출한 답안이 없으면 문제 수만 계산
+        summary = QuizAttemptSummary.objects.filter(user=user, quiz=quiz).first()
+        if summary is None:
+            summary = QuizAttemptSummary(total_questions=quiz.questions.count())
 
         # 사용자의 답안 기록 조회
         answer_histories = QuizAnswerHistory.objects.filter(
             user=user, quiz_question__quiz=quiz
         ).select_related("quiz_question")
 
-        # 정답/오답 개수 계산
-        correct_count = answer_histories.filter(is_correct=True).count()
-        wrong_count = total_questions - correct_count
-        score = (correct_count / total_questions * 100) if total_questions > 0 else 0
-
         return {
             "quiz_id": str(quiz.id),
-            "total_questions": total_questions,
-            "correct_count": correct_count,
-            "wrong_count": wrong_count,
-            "score": round(score, 2),
+            "total_questions": summary.total_questions,
+            "correct_count": summary.correct_count,
+            "wrong_count": summary.total_questions - summary.correct_count,
+            "score": summary.score,
             "answers": answer_histories,
         }
 
+    @staticmethod
+    def get_wrong_answers(project_id: int, user: User) -> List[QuizAnswerHistory]:
+        """
+        프로젝트의 오답 목록 조회 (오답 노트)
+
+        오답만 담은 (user, created_at) 부분 인덱스를 최근 순으로 읽으면서
+        문제 → 퀴즈 → 프로젝트 경로로 해당 프로젝트의 답안만 남깁니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            user: 사용자
+
+        Returns:
+            List[QuizAnswerHistory]: 오답 기록 목록 (문제 포함)
+
+        Raises:
+            Project.DoesNotExist: 프로젝트를 찾을 수 없음
+        """
+        project = Project.objects.only("id").get(id=project_id, user=user)
+
+        return (
+            QuizAnswerHistory.objects.filter(
+                user=user, is_correct=False, quiz_question__quiz__project=project
+            )
+            .select_related("quiz_question")
+            .order_by("-created_at")
+        )
+
     @staticmethod
     def get_user_answer_history(user: User, quiz_id: str) -> List[QuizAnswerHistory]:
         """
@@ -0,0 +1,44 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from api.project.models import Material
+from api.quiz.models import Quiz, QuizQuestions
+from api.quiz.services.question_pool_service import QuestionPoolService
+from api.quiz.services.quiz_payload_cache_service import QuizPayloadCacheService
+
+
+@receiver(post_save, sender=Material)
+def fill_question_pool(sender, instance, created, **kwargs):
+    """자료 등록이 커밋되면 문제 풀 채우기 작업 예약"""
+    if created:
+        transaction.on_commit(lambda: QuestionPoolService.enqueue(instance.id))
+
+
+def _is_bulk_delete(instance, kwargs) -> bool:
+    """
+    객체 하나가 아니라 쿼리셋 삭제나 상위 객체(퀴즈, 프로젝트, 사용자) 삭제로 함께 지워지는지 여부
+
+    이 경우 행마다 무효화하면 삭제 건수만큼 쿼리가 늘어나므로, 상위 객체와 함께 지워지면
+    (퀴즈도 삭제됨) 무시하고, 쿼리셋으로 일괄 삭제하는 쪽에서 필요하면 한 번에 무효화합니다.
+    """
+    origin = kwargs.get("origin")
+    return origin is not None and origin is not instance
+
+
+@receiver(post_save, sender=QuizQuestions)
+@receiver(post_delete, sender=QuizQuestions)
+def invalidate_quiz_payload_on_question_change(sender, instance, **kwargs):
+    """문제가 추가/수정/삭제되면 퀴즈 상세 응답 캐시 무효화"""
+    if _is_bulk_delete(instance, kwargs):
+        return
+    QuizPayloadCacheService.invalidate(Quiz.objects.filter(id=instance.quiz_id))
+
+
+@receiver(post_save, sender=Material)
+@receiver(pre_delete, sender=Material)
+def invalidate_quiz_payload_on_material_change(sender, instance, **kwargs):
+    """자료 제목이 바뀌거나 삭제되면 해당 자료를 사용한 퀴즈 상세 응답 캐시 무효화"""
+    if kwargs.get("created") or _is_bulk_delete(instance, kwargs):
+        return
+    QuizPayloadCacheService.invalidate(Quiz.objects.filter(materials=instance))
@@ -1,3 +1,852 @@
-from django.test import TestCase
+import re
+import threading
+import time
+from datetime import timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from rest_framework.test import APIClient
+
+from api.project.models import Material, Project
+from api.project.services import MaterialService
+from api.quiz.models import (
+    Quiz,
+    QuizAnswerHistory,
+    QuizAttemptSummary,
+    QuizGenerationCache,
+    QuizPoolQuestion,
+    QuizQuestions,
+    QuizStatus,
+    UserMaterialStats,
+    UserProjectDailyStats,
+)
+from api.quiz.services.generation_cache_service import QuizGenerationCacheService
+from api.quiz.services.learning_stats_service import LearningStatsService
+from api.quiz.services.grading_service import (
+    GradingService,
+    comparable_key,
+    similarities,
+)
+from api.quiz.services.question_pool_service import QuestionPoolService
+from api.quiz.services.quiz_service import QuizService
+from api.user.models import User
+from llm.services.answer_grader import AnswerGrader
+
+
+class QuizGenerationCacheServiceTest(TestCase):
+    def build_key(self, **overrides):
+        params = {
+            "prompt_template": "template",
+            "material_hashes": ["a", "b"],
+            "question_type": "multiple_choice",
+            "question_count": 10,
+            "difficulty": "medium",
+            "model_name": "openai:gpt-5-mini",
+        }
+        params.update(overrides)
+        return QuizGenerationCacheService.build_key(**params)
+
+    def test_build_key_is_deterministic(self):
+        self.assertEqual(self.build_key(), self.build_key(material_hashes=["b", "a"]))
+        self.assertNotEqual(self.build_key(), self.build_key(difficulty="hard"))
+        self.assertNotEqual(self.build_key(), self.build_key(prompt_template="v2"))
+
+    def test_get_and_set(self):
+        key = self.build_key()
+        metrics = QuizGenerationCacheService.get_metrics()
+
+        self.assertIsNone(QuizGenerationCacheService.get(key))
+        QuizGenerationCacheService.set(key, [{"question": "문제"}])
+        self.assertEqual(QuizGenerationCacheService.get(key), [{"question": "문제"}])
+
+        updated = QuizGenerationCacheService.get_metrics()
+        self.assertEqual(updated["hits"], metrics["hits"] + 1)
+        self.assertEqual(updated["misses"], metrics["misses"] + 1)
+        self.assertEqual(QuizGenerationCache.objects.get(key=key).hit_count, 1)
+
+    def test_evict_least_recently_used(self):
+        now = timezone.now()
+        for index in range(3):
+            QuizGenerationCache.objects.create(
+                key=f"key-{index}",
+                size_bytes=10,
+                last_accessed_at=now - timedelta(minutes=index),
+            )
+
+        evicted = QuizGenerationCacheService.evict(max_entries=2, max_bytes=1000)
+
+        self.assertEqual(evicted, 1)
+        self.assertFalse(QuizGenerationCache.objects.filter(key="key-2").exists())
+
+        QuizGenerationCacheService.evict(max_entries=10, max_bytes=10)
+        self.assertEqual(
+            list(QuizGenerationCache.objects.values_list("key", flat=True)), ["key-0"]
+        )
+
+
+class QuestionPoolServiceTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(identifier="pool-user")
+        project = Project.objects.create(user=user, name="프로젝트")
+        self.materials = [
+            Material.objects.create(project=project, title=f"자료{index}")
+            for index in range(2)
+        ]
+
+    def add_questions(self, material, count, question_type="multiple_choice"):
+        for index in range(count):
+            QuizPoolQuestion.objects.create(
+                material=material,
+                question_type=question_type,
+                difficulty="medium",
+                question=f"{material.title} 문제 {index}",
+            )
+
+    def test_take_interleaves_materials_and_marks_used(self):
+        self.add_questions(self.materials[0], 3)
+        self.add_questions(self.materials[1], 1)
+
+        taken = QuestionPoolService.take(self.materials, "multiple_choice", "medium", 3)
+
+        self.assertEqual(
+            [question.question for question in taken],
+            ["자료0 문제 0", "자료1 문제 0", "자료0 문제 1"],
+        )
+        self.assertEqual(
+            QuizPoolQuestion.objects.filter(used_at__isnull=True).count(), 1
+        )
+
+    def test_take_filters_type_and_returns_shortfall(self):
+        self.add_questions(self.materials[0], 2, question_type="short_answer")
+
+        self.assertEqual(
+            QuestionPoolService.take(self.materials, "multiple_choice", "medium", 5),
+            [],
+        )
+        self.assertEqual(
+            len(QuestionPoolService.take(self.materials, "mixed", "medium", 5)), 2
+        )
+
+
+class QuizCancelTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(identifier="cancel-user")
+        project = Project.objects.create(user=self.user, name="프로젝트")
+        self.quiz = Quiz.objects.create(
+            project=project, question_count=5, status=QuizStatus.PROCESSING
+        )
+        QuizQuestions.objects.create(quiz=self.quiz, question="문제")
+
+    def test_cancel_discards_partial_questions(self):
+        quiz = QuizService.cancel_quiz(self.quiz.id, self.user)
+
+        self.assertEqual(quiz.status, QuizStatus.CANCELLED)
+        self.assertFalse(QuizQuestions.objects.filter(quiz=self.quiz).exists())
+        with self.assertRaises(ValueError):
+            QuizService.cancel_quiz(self.quiz.id, self.user)
+
+    def test_cancel_removes_answers_from_learning_stats(self):
+        material = Material.objects.create(project=self.quiz.project, title="자료")
+        self.quiz.materials.add(material)
+        question = self.quiz.questions.get()
+        question.answers = {"answer": "정답"}
+        question.save()
+        QuizService.submit_answer(self.user, question.id, "정답", 10)
+        self.assertTrue(UserProjectDailyStats.objects.filter(user=self.user).exists())
+
+        QuizService.cancel_quiz(self.quiz.id, self.user)
+
+        self.assertFalse(QuizAnswerHistory.objects.filter(user=self.user).exists())
+        self.assertFalse(UserProjectDailyStats.objects.filter(user=self.user).exists())
+        self.assertFalse(UserMaterialStats.objects.filter(user=self.user).exists())
+
+    def test_cancel_keeps_partial_questions(self):
+        QuizService.cancel_quiz(self.quiz.id, self.user, keep_partial=True)
+
+        self.assertEqual(QuizQuestions.objects.filter(quiz=self.quiz).count(), 1)
+
+    def test_cancel_sets_in_process_event(self):
+        event = QuizService._register_cancel_event(self.quiz.id)
+        try:
+            QuizService.cancel_quiz(self.quiz.id, self.user)
+            self.assertTrue(event.is_set())
+        finally:
+            QuizService._unregister_cancel_event(self.quiz.id)
+
+    def test_cancel_requires_owner(self):
+        other = User.objects.create_user(identifier="other-user")
+
+        with self.assertRaises(PermissionError):
+            QuizService.cancel_quiz(self.quiz.id, other)
+
+
+class QuizRequestCoalescingTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(identifier="coalesce-user")
+        self.project = Project.objects.create(user=self.user, name="프로젝트")
+        self.materials = [
+            Material.objects.create(project=self.project, title=f"자료{index}")
+            for index in range(2)
+        ]
+
+    def create_quiz(self, material_ids, **overrides):
+        params = {
+            "user": self.user,
+            "project_id": self.project.id,
+            "material_ids": material_ids,
+            "question_type": "multiple_choice",
+            "question_count": 5,
+            "difficulty": "medium",
+        }
+        params.update(overrides)
+        return QuizService.create_quiz(**params)
+
+    def test_duplicate_request_returns_same_quiz(self):
+        ids = [str(material.id) for material in self.materials]
+
+        first = self.create_quiz(ids)
+        second = self.create_quiz(list(reversed(ids)))
+
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(Quiz.objects.count(), 1)
+
+    def test_different_parameters_or_cancelled_start_new_quiz(self):
+        ids = [str(material.id) for material in self.materials]
+
+        first = self.create_quiz(ids)
+        harder = self.create_quiz(ids, difficulty="hard")
+        QuizService.cancel_quiz(first.id, self.user)
+        retried = self.create_quiz(ids)
+
+        self.assertNotEqual(first.id, harder.id)
+        self.assertNotEqual(first.id, retried.id)
+
+    def test_request_outside_window_starts_new_quiz(self):
+        ids = [str(self.materials[0].id)]
+        first = self.create_quiz(ids)
+        Quiz.objects.filter(id=first.id).update(
+            created_at=timezone.now() - timedelta(minutes=10)
+        )
+
+        self.assertNotEqual(first.id, self.create_quiz(ids).id)
+
+    def test_other_users_project_is_rejected(self):
+        other = User.objects.create_user(identifier="other-coalesce-user")
+
+        with self.assertRaises(Project.DoesNotExist):
+            self.create_quiz([str(self.materials[0].id)], user=other)
+
+
+class QuizAnswerBatchSubmitTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(identifier="batch-user")
+        project = Project.objects.create(user=self.user, name="프로젝트")
+        self.quiz = Quiz.objects.create(project=project, question_count=3)
+        self.questions = [
+            QuizQuestions.objects.create(
+                quiz=self.quiz, question=f"문제 {index}", answers={"answer": "1"}
+            )
+            for index in range(3)
+        ]
+
+    def submit(self, answers, quiz_id=None):
+        return QuizService.submit_answers_batch(
+            user=self.user,
+            quiz_id=quiz_id or self.quiz.id,
+            answers=[
+                {"question_id": question.id, "answer": answer}
+                for question, answer in answers
+            ],
+        )
+
+    def test_batch_grades_and_upserts(self):
+        # 문제 조회 + 풀이 요약 행 생성/잠금 + 이전 답안 잠금 + 답안 upsert + 풀이 요약 집계/upsert
+        # + 학습 통계 롤업 (프로젝트/자료 조회, 날짜별 생성/증분) (+ savepoint 2개)
+        with self.assertNumQueries(13):
+            self.submit([(question, "1") for question in self.questions])
+        self.submit([(self.questions[0], "2")])
+
+        histories = QuizAnswerHistory.objects.filter(user=self.user)
+        self.assertEqual(histories.count(), 3)
+        self.assertEqual(histories.filter(is_correct=True).count(), 2)
+        self.assertEqual(histories.get(quiz_question=self.questions[0]).answer, "2")
+
+    def test_rejects_questions_from_other_quiz(self):
+        other_quiz = Quiz.objects.create(project=self.quiz.project)
+        other_question = QuizQuestions.objects.create(
+            quiz=other_quiz, question="다른 문제", answers={"answer": "1"}
+        )
+
+        with self.assertRaises(ValueError):
+            self.submit([(self.questions[0], "1"), (other_question, "1")])
+        self.assertFalse(QuizAnswerHistory.objects.exists())
+
+
+class QuizAttemptSummaryTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(identifier="summary-user")
+        project = Project.objects.create(user=self.user, name="프로젝트")
+        self.project = project
+        self.quiz = Quiz.objects.create(
+            project=project, question_count=4, status=QuizStatus.COMPLETED
+        )
+        self.questions = [
+            QuizQuestions.objects.create(
+                quiz=self.quiz, question=f"문제 {index}", answers={"answer": "1"}
+            )
+            for index in range(4)
+        ]
+
+    def test_summary_follows_submissions(self):
+        QuizService.submit_answers_batch(
+            user=self.user,
+            quiz_id=self.quiz.id,
+            answers=[
+                {"question_id": question.id, "answer": "1"}
+                for question in self.questions[:3]
+            ],
+        )
+        QuizService.submit_answer(self.user, self.questions[0].id, "2")
+
+        summary = QuizAttemptSummary.objects.get(user=self.user, quiz=self.quiz)
+        self.assertEqual(summary.total_questions, 4)
+        self.assertEqual(summary.answered_count, 3)
+        self.assertEqual(summary.correct_count, 2)
+        self.assertEqual(summary.score, 50.0)
+
+    def test_result_reads_summary(self):
+        QuizService.submit_answer(self.user, self.questions[0].id, "1")
+
+        result = QuizService.get_quiz_result(self.user, self.quiz.id)
+        self.assertEqual(result["total_questions"], 4)
+        self.assertEqual(result["correct_count"], 1)
+        self.assertEqual(result["wrong_count"], 3)
+        self.assertEqual(result["score"], 25.0)
+
+    def test_result_without_answers(self):
+        result = QuizService.get_quiz_result(self.user, self.quiz.id)
+        self.assertEqual(result["total_questions"], 4)
+        self.assertEqual(result["correct_count"], 0)
+        self.assertEqual(result["score"], 0)
+
+    def test_answers_during_generation_are_rescored_on_completion(self):
+        quiz = Quiz.objects.create(
+            project=self.project, question_count=2, status=QuizStatus.PENDING
+        )
+
+        def generate_questions(quiz, question_count, use_cache, cancel_event):
+            yield {"question": "문제 1", "answers": {"answer": "1"}, "metadata": {}}
+            # 첫 문제가 저장된 뒤 생성 중(processing)에 먼저 풀이
+            question = quiz.questions.get()
+            QuizService.submit_answer(self.user, question.id, "1")
+            yield {"question": "문제 2", "answers": {"answer": "1"}, "metadata": {}}
+
+        with (
+            mock.patch.object(QuizService, "_generate_questions", generate_questions),
+            mock.patch("api.quiz.services.quiz_service.connections.close_all"),
+        ):
+            QuizService._generate_quiz_background(quiz.id)
+
+        quiz.refresh_from_db()
+        self.assertEqual(quiz.status, QuizStatus.COMPLETED)
+        result = QuizService.get_quiz_result(self.user, quiz.id)
+        self.assertEqual(result["total_questions"], 2)
+        self.assertEqual(result["correct_count"], 1)
+        self.assertEqual(result["wrong_count"], 1)
+        self.assertEqual(result["score"], 50.0)
+
+    def test_project_quizzes_prefetch_user_summary(self):
+        other_user = User.objects.create_user(identifier="summary-other")
+        QuizService.submit_answer(other_user, self.questions[0].id, "1")
+        QuizService.submit_answer(self.user, self.questions[1].id, "2")
+
+        quizzes = list(QuizService.get_project_quizzes(self.project.id, self.user))
+        summaries = quizzes[0].user_attempt_summaries
+        self.assertEqual(len(summaries), 1)
+        self.assertEqual(summaries[0].answered_count, 1)
+        self.assertEqual(summaries[0].correct_count, 0)
+
+
+class QuizListPaginationTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(identifier="list-user")
+        self.project = Project.objects.create(user=self.user, name="프로젝트")
+        self.materials = [
+            Material.objects.create(project=self.project, title=f"자료 {index}")
+            for index in range(4)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def add_quizzes(self, count):
+        for _ in range(count):
+            quiz = Quiz.objects.create(
+                project=self.project, status=QuizStatus.COMPLETED
+            )
+            quiz.materials.set(self.materials)
+            QuizQuestions.objects.create(quiz=quiz, question="문제", answers={})
+
+    def list_quizzes(self, **params):
+        return self.client.get("/quizzes", {"project_id": self.project.id, **params})
+
+    def test_query_count_is_constant(self):
+        self.add_quizzes(2)
+        with self.assertNumQueries(4) as small:
+            self.list_quizzes()
+        self.add_quizzes(8)
+        with self.assertNumQueries(len(small.captured_queries)):
+            response = self.list_quizzes()
+
+        first = response.json()["results"][0]
+        self.assertEqual(first["material_count"], 4)
+        self.assertEqual(first["total_questions"], 1)
+        self.assertEqual(len(first["material_titles"]), 4)
+        self.assertEqual(first["material_titles"][-1], "...")
+
+    def test_cursor_walks_all_pages(self):
+        self.add_quizzes(5)
+
+        seen = []
+        response = self.list_quizzes(page_size=2)
+        while True:
+            body = response.json()
+            seen += [quiz["id"] for quiz in body["results"]]
+            if body["next"] is None:
+                break
+            response = self.client.get(body["next"])
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
+
+
+class QuizPayloadCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(identifier="payload-user")
+        project = Project.objects.create(user=self.user, name="프로젝트")
+        self.material = Material.objects.create(project=project, title="자료")
+        self.quiz = Quiz.objects.create(project=project, status=QuizStatus.COMPLETED)
+        self.quiz.materials.set([self.material])
+        self.question = QuizQuestions.objects.create(
+            quiz=self.quiz,
+            question="문제",
+            answers={"1": "가", "2": "나", "answer": "1"},
+            metadata={"question_type": "multiple_choice"},
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def retrieve(self, **headers):
+        return self.client.get(f"/quizzes/{self.quiz.id}", headers=headers)
+
+    def test_cached_payload_and_not_modified(self):
+        first = self.retrieve()
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(
+            first.json()["questions"][0]["choices"], {"1": "가", "2": "나"}
+        )
+
+        # 권한 확인용 퀴즈 조회 한 번만 실행
+        with self.assertNumQueries(1):
+            second = self.retrieve()
+        self.assertEqual(second.json(), first.json())
+
+        not_modified = self.retrieve(if_none_match=first["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_question_change_invalidates(self):
+        first = self.retrieve()
+
+        self.question.question = "수정된 문제"
+        self.question.save()
+
+        response = self.retrieve(if_none_match=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(response.json()["questions"][0]["question"], "수정된 문제")
+
+    def test_material_change_invalidates(self):
+        first = self.retrieve()
+
+        self.material.title = "새 제목"
+        self.material.save()
+
+        response = self.retrieve()
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(response.json()["material_titles"], ["새 제목"])
+
+    def test_processing_quiz_is_not_cached(self):
+        Quiz.objects.filter(id=self.quiz.id).update(status=QuizStatus.PROCESSING)
+
+        response = self.retrieve()
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+
+
+class GradingServiceTest(TestCase):
+    def make_question(self, answer, question_type="short_answer"):
+        return QuizQuestions(
+            question="문제",
+            answers={"answer": answer},
+            metadata={"question_type": question_type},
+        )
+
+    def test_comparable_key_folds_width_punctuation_and_particles(self):
+        self.assertEqual(comparable_key("머신 러닝입니다!"), comparable_key("머신러닝"))
+        self.assertEqual(comparable_key("ＤＮＡ"), comparable_key("dna"))
+        self.assertEqual(comparable_key("3.14."), comparable_key("3.14"))
+
+    def test_comparable_key_keeps_signs_operators_and_word_endings(self):
+        pairs = [
+            ("-3", "3"),
+            ("C++", "C"),
+            ("3.14", "314"),
+            ("O(n^2)", "O(n2)"),
+            ("바다", "바"),
+            ("고양이", "고양"),
+        ]
+        for first, second in pairs:
+            with self.subTest(first=first, second=second):
+                self.assertNotEqual(comparable_key(first), comparable_key(second))
+
+    def test_similarities_scores_pairs_in_one_batch(self):
+        scores = similarities(
+            [
+                ("광합성", "광합성"),
+                ("세포호흡", "세포호흡과정"),
+                ("광합성", "엽록체"),
+                ("", ""),
+            ]
+        )
+
+        self.assertEqual(scores, [1.0, 0.75, 0.0, 0.0])
+
+    @override_settings(QUIZ_GRADING_USE_LLM=False)
+    def test_rejects_answers_differing_in_sign_operator_or_syllable(self):
+        submissions = [
+            (self.make_question("-3"), "3"),
+            (self.make_question("C++"), "C"),
+            (self.make_question("3.14"), "314"),
+            (self.make_question("O(n^2)"), "O(n2)"),
+            (self.make_question("바다"), "바"),
+            (self.make_question("1", "multiple_choice"), "1, 3"),
+        ]
+
+        self.assertEqual(GradingService().grade(submissions), [False] * 6)
+
+    @override_settings(QUIZ_GRADING_USE_LLM=False)
+    def test_grades_without_llm(self):
+        submissions = [
+            (self.make_question("2", "multiple_choice"), "②번"),
+            (self.make_question("3", "multiple_choice"), "1"),
+            (self.make_question("광합성"), " 광합성이다. "),
+            (self.make_question("세포 호흡"), "세포호흡과정"),
+            (self.make_question("미토콘드리아"), "엽록체"),
+            (self.make_question("정답"), ""),
+            (self.make_question("1, 3", "multiple_choice"), "3번, 1번"),
+            (self.make_question("머신러닝"), "머신 러닝은"),
+        ]
+
+        self.assertEqual(
+            GradingService().grade(submissions),
+            [True, False, True, True, False, False, True, True],
+        )
+
+    def test_ambiguous_answers_use_single_llm_call(self):
+        model = FakeListChatModel(
+            responses=[
+                '[{"id": 1, "isCorrect": true}, {"id": 2, "isCorrect": false}]',
+                "두 번째 호출",
+            ]
+        )
+        service = GradingService(
+            answer_grader=AnswerGrader(model=model, system_prompt="채점")
+        )
+        submissions = [
+            (self.make_question("세포 호흡"), "세포호흡과정"),
+            (self.make_question("고양이"), "고양"),
+            (self.make_question("광합성"), "광합성"),
+        ]
+
+        self.assertEqual(service.grade(submissions), [True, False, True])
+        self.assertEqual(model.i, 1)
+
+
+class WrongAnswerReviewTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(identifier="review-user")
+        self.project = Project.objects.create(user=self.user, name="프로젝트")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def answer(self, project, count, is_correct=False):
+        quiz = Quiz.objects.create(project=project, status=QuizStatus.COMPLETED)
+        for index in range(count):
+            question = QuizQuestions.objects.create(
+                quiz=quiz,
+                question=f"문제 {index}",
+                answers={"answer": "정답"},
+                metadata={"explanation": "해설"},
+            )
+            QuizAnswerHistory.objects.create(
+                user=self.user,
+                quiz_question=question,
+                answer="오답",
+                is_correct=is_correct,
+            )
+
+    def list_wrong_answers(self, project_id=None, **params):
+        return self.client.get(
+            f"/projects/{project_id or self.project.id}/wrong-answers", params
+        )
+
+    def test_lists_only_wrong_answers_of_project(self):
+        self.answer(self.project, 3)
+        self.answer(self.project, 2, is_correct=True)
+        self.answer(Project.objects.create(user=self.user, name="다른 프로젝트"), 2)
+
+        seen = []
+        # 프로젝트 확인 + 페이지 조회
+        with self.assertNumQueries(2):
+            response = self.list_wrong_answers(page_size=2)
+        while True:
+            body = response.json()
+            seen += body["results"]
+            if body["next"] is None:
+                break
+            response = self.client.get(body["next"])
+
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(seen[0]["user_answer"], "오답")
+        self.assertEqual(seen[0]["question"]["correct_answer"], "정답")
+        self.assertEqual(seen[0]["question"]["explanation"], "해설")
+
+    def test_other_users_project_is_not_found(self):
+        other = User.objects.create_user(identifier="review-other")
+        project = Project.objects.create(user=other, name="남의 프로젝트")
+
+        response = self.list_wrong_answers(project.id)
+        self.assertEqual(response.status_code, 404)
+
+
+class LearningStatsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(identifier="stats-user")
+        self.project = Project.objects.create(user=self.user, name="프로젝트")
+        self.material = Material.objects.create(project=self.project, title="자료")
+        self.quiz = Quiz.objects.create(
+            project=self.project, status=QuizStatus.COMPLETED
+        )
+        self.quiz.materials.add(self.material)
+        self.questions = [
+            QuizQuestions.objects.create(
+                quiz=self.quiz, question=f"문제 {index}", answers={"answer": "1"}
+            )
+            for index in range(3)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def submit(self, answers):
+        QuizService.submit_answers_batch(
+            user=self.user,
+            quiz_id=self.quiz.id,
+            answers=[
+                {"question_id": question.id, "answer": answer, "time_spent_seconds": 10}
+                for question, answer in answers
+            ],
+        )
+
+    def snapshot(self):
+        daily = list(
+            UserProjectDailyStats.objects.values_list(
+                "project_id", "date", "attempts", "correct_count", "time_spent_seconds"
+            )
+        )
+        materials = list(
+            UserMaterialStats.objects.values_list(
+                "material_id", "attempts", "correct_count", "time_spent_seconds"
+            )
+        )
+        return daily, materials
+
+    def test_resubmission_updates_correct_count_only(self):
+        self.submit([(question, "1") for question in self.questions[:2]])
+        self.submit([(self.questions[0], "2"), (self.questions[2], "1")])
+
+        stats = UserProjectDailyStats.objects.get(user=self.user, project=self.project)
+        self.assertEqual(stats.attempts, 3)
+        self.assertEqual(stats.correct_count, 2)
+        self.assertEqual(stats.time_spent_seconds, 40)
+        material_stats = UserMaterialStats.objects.get(user=self.user)
+        self.assertEqual(
+            (material_stats.attempts, material_stats.correct_count), (3, 2)
+        )
+
+    def test_rebuild_matches_incremental_rollups(self):
+        self.submit([(question, "1") for question in self.questions])
+        self.submit([(self.questions[1], "2")])
+        incremental = self.snapshot()
+
+        call_command("rebuild_learning_stats", user_ids=[self.user.id])
+
+        self.assertEqual(self.snapshot(), incremental)
+
+    def test_stats_endpoint(self):
+        self.submit([(self.questions[0], "1"), (self.questions[1], "2")])
+
+        response = self.client.get(f"/projects/{self.project.id}/stats", {"days": 7})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["totals"]["attempts"], 2)
+        self.assertEqual(body["totals"]["accuracy"], 50.0)
+        self.assertEqual(len(body["daily"]), 1)
+        self.assertEqual(body["materials"][0]["material_title"], "자료")
+
+        other = User.objects.create_user(identifier="stats-other")
+        project = Project.objects.create(user=other, name="남의 프로젝트")
+        response = self.client.get(f"/projects/{project.id}/stats")
+        self.assertEqual(response.status_code, 404)
+
+
+@skipUnless(
+    connection.vendor == "postgresql",
+    "행 잠금(select_for_update)은 PostgreSQL에서만 동작",
+)
+class LearningStatsConcurrencyTest(TransactionTestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(identifier="concurrent-user")
+        project = Project.objects.create(user=self.user, name="프로젝트")
+        self.quiz = Quiz.objects.create(project=project, status=QuizStatus.COMPLETED)
+        self.question = QuizQuestions.objects.create(
+            quiz=self.quiz, question="문제", answers={"answer": "1"}
+        )
+
+    def test_concurrent_first_submissions_count_one_attempt(self):
+        record = LearningStatsService.record
+
+        def slow_record(*args, **kwargs):
+            # 첫 제출의 트랜잭션이 열려 있는 동안 두 번째 제출이 이전 답안을 조회하도록 지연
+            time.sleep(0.3)
+            record(*args, **kwargs)
+
+        def submit():
+            try:
+                QuizService.submit_answer(self.user, self.question.id, "1", 10)
+            finally:
+                connection.close()
+
+        with mock.patch.object(LearningStatsService, "record", slow_record):
+            threads = [threading.Thread(target=submit) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        stats = UserProjectDailyStats.objects.get(user=self.user)
+        self.assertEqual(stats.attempts, 1)
+        self.assertEqual(stats.correct_count, 1)
+        self.assertEqual(stats.time_spent_seconds, 20)
+
+
+# 테이블 전체를 읽는 실행 계획 (SQLite: "SCAN 테이블", PostgreSQL: "Seq Scan on 테이블")
+# (서브쿼리 별칭 "qualify" 등은 실제 테이블이 아니므로 제외)
+_FULL_SCAN_RE = re.compile(r"\b(?:SCAN|Seq Scan on) \"?(\w+)")
+
+
+class QueryPlanTest(TestCase):
+    """주요 조회 쿼리가 테이블 전체를 읽지 않고 인덱스를 타는지 EXPLAIN으로 확인"""
+
+    def setUp(self):
+        # 다른 사용자/프로젝트 데이터가 섞여 있어야 인덱스 선택 여부가 드러남
+        for index in range(3):
+            user = User.objects.create_user(identifier=f"plan-user-{index}")
+            project = Project.objects.create(user=user, name=f"프로젝트 {index}")
+            material = Material.objects.create(project=project, title="자료")
+            for status in [QuizStatus.COMPLETED, QuizStatus.FAILED]:
+                quiz = Quiz.objects.create(
+                    project=project, status=status, request_key=f"key-{index}"
+                )
+                quiz.materials.add(material)
+                for number in range(3):
+                    question = QuizQuestions.objects.create(
+                        quiz=quiz, question=f"문제 {number}", answers={"answer": "1"}
+                    )
+                    QuizAnswerHistory.objects.create(
+                        user=user,
+                        quiz_question=question,
+                        answer="2",
+                        is_correct=number == 0,
+                    )
+        self.user, self.project, self.quiz = user, project, quiz
+        LearningStatsService.rebuild()
+
+    def assertNoFullScan(self, evaluate):
+        """evaluate 실행 중 발생한 모든 쿼리(prefetch 포함)의 실행 계획 확인"""
+        with CaptureQueriesContext(connection) as context:
+            evaluate()
+
+        tables = set(connection.introspection.table_names())
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                # 시드 데이터가 작아도 인덱스가 있으면 인덱스를 쓰도록
+                cursor.execute("SET enable_seqscan = off")
+            for query in context.captured_queries:
+                cursor.execute(
+                    f"{connection.ops.explain_query_prefix()} {query['sql']}"
+                )
+                plan = "\n".join(str(row[-1]) for row in cursor.fetchall())
+                scanned = set(_FULL_SCAN_RE.findall(plan)) & tables
+                self.assertFalse(scanned, f"{query['sql']}\n{plan}")
+
+    def test_material_list(self):
+        self.assertNoFullScan(
+            lambda: list(
+                MaterialService.get_project_materials(
+                    self.project.id, self.user
+                ).order_by("-created_at", "-id")[:20]
+            )
+        )
+
+    def test_quiz_list(self):
+        self.assertNoFullScan(
+            lambda: list(
+                QuizService.get_project_quizzes(self.project.id, self.user).order_by(
+                    "-created_at", "-id"
+                )[:20]
+            )
+        )
+
+    def test_quiz_questions_and_result(self):
+        self.assertNoFullScan(lambda: list(self.quiz.questions.all()))
+        self.assertNoFullScan(
+            lambda: list(
+                QuizService.get_quiz_result(self.user, self.quiz.id)["answers"]
+            )
+        )
+
+    def test_wrong_answers(self):
+        self.assertNoFullScan(
+            lambda: list(QuizService.get_wrong_answers(self.project.id, self.user)[:20])
+        )
+
+    def test_request_coalescing_lookup(self):
+        self.assertNoFullScan(
+            lambda: QuizService.get_coalescible_quizzes("key-0").first()
+        )
+
+    def test_learning_stats(self):
+        def evaluate():
+            stats = LearningStatsService.get_project_stats(
+                self.project.id, self.user, 30
+            )
+            list(stats["daily"])
+            list(stats["materials"])
+
+        self.assertNoFullScan(evaluate)
@@ -19,6 +19,11 @@ urlpatterns = [
         QuizViewSet.as_view({"get": "get_generation_status"}),
         name="quiz-generation-status",
     ),
+    path(
+        "/<str:pk>/cancel",
+        QuizViewSet.as_view({"post": "cancel_generation"}),
+        name="quiz-cancel",
+    ),
     # 퀴즈 풀이 관련 API
     path(
         "/<str:pk>/submit-answer",
@@ -1,3 +1,5 @@
+from django.db.models import prefetch_related_objects
+from django.utils.http import parse_etags
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, status
@@ -7,20 +9,28 @@ from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 from api.project.exceptions import ProjectExceptions
+from api.project.models import Project
 from api.project.serializers.project_serializers import ProjectIdQuerySerializer
 from api.quiz.exceptions import QuizExceptions
 from api.quiz.models import Quiz, QuizQuestions
 from api.quiz.serializers.quiz_serializers import (
+    LearningStatsQuerySerializer,
+    ProjectLearningStatsSerializer,
     QuizAnswerBatchSubmitSerializer,
     QuizAnswerSubmitSerializer,
+    QuizCancelSerializer,
     QuizCreateSerializer,
     QuizListSerializer,
     QuizResultSerializer,
     QuizSerializer,
     QuizStatusSerializer,
+    QuizWrongAnswerSerializer,
 )
+from api.quiz.services.learning_stats_service import LearningStatsService
+from api.quiz.services.quiz_payload_cache_service import QuizPayloadCacheService
 from api.quiz.services.quiz_service import QuizService
 from common.exceptions.custom_exceptions import CustomException
+from common.pagination import CreatedAtCursorPagination, cursor_page_serializer
 from common.swagger.schema import get_swagger_response_dict
 
 
@@ -36,6 +46,8 @@ class QuizViewSet(
     퀴즈 생성은 백그라운드에서 처리되며, polling을 통해 상태를 확인할 수 있습니다.
     """
 
+    pagination_class = CreatedAtCursorPagination
+
     permission_classes = [IsAuthenticated]
 
     @swagger_auto_schema(
@@ -44,27 +56,33 @@ class QuizViewSet(
         특정 프로젝트의 모든 퀴즈를 조회합니다.
 
         프로젝트 ID를 쿼리 파라미터로 받아 해당 프로젝트의 완료된 퀴즈 목록을 반환합니다.
-        최근 생성일 기준으로 정렬됩니다.
+        최근 생성일 기준으로 정렬되며 커서 기반으로 페이지를 나눕니다.
+        다음 페이지는 응답의 next URL(cursor 파라미터 포함)로 조회합니다.
+        각 퀴즈에는 요청한 사용자의 풀이 현황(answered_count, score)이 포함됩니다.
         """,
         query_serializer=ProjectIdQuerySerializer,
         responses=get_swagger_response_dict(
             success_response={
-                200: QuizListSerializer(many=True),
+                200: cursor_page_serializer(QuizListSerializer),
             },
             exception_enums=[ProjectExceptions.PROJECT_NOT_FOUND],
         ),
         tags=["퀴즈"],
     )
     def list(self, request):
-        project_id = (
-            ProjectIdQuerySerializer(data=request.query_params)
-            .is_valid(raise_exception=True)
-            .validated_data.get("project_id")
-        )
         """프로젝트의 퀴즈 목록 조회"""
-        quizzes = QuizService.get_project_quizzes(project_id, request.user)
-        serializer = QuizListSerializer(quizzes, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        query_serializer = ProjectIdQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        project_id = query_serializer.validated_data["project_id"]
+
+        try:
+            quizzes = QuizService.get_project_quizzes(project_id, request.user)
+        except Project.DoesNotExist:
+            raise CustomException(ProjectExceptions.PROJECT_NOT_FOUND)
+
+        page = self.paginate_queryset(quizzes)
+        serializer = QuizListSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @swagger_auto_schema(
         operation_summary="퀴즈 상세 조회",
@@ -73,10 +91,16 @@ class QuizViewSet(
 
         퀴즈 ID를 통해 퀴즈의 모든 문제를 반환합니다.
         문제의 정답은 포함되지 않습니다 (풀이용).
+        생성 중(processing)이거나 취소된(cancelled) 퀴즈는 지금까지 생성된 문제만 반환하며,
+        progress_percentage로 진행률을 확인할 수 있습니다.
+
+        완료된 퀴즈는 ETag 헤더를 함께 반환합니다.
+        If-None-Match 헤더에 같은 ETag를 보내면 본문 없이 304를 반환합니다.
         """,
         responses=get_swagger_response_dict(
             success_response={
                 200: QuizSerializer,
+                304: "변경 없음 (If-None-Match의 ETag와 일치)",
             },
             exception_enums=[
                 QuizExceptions.QUIZ_NOT_FOUND,
@@ -99,8 +123,19 @@ class QuizViewSet(
         except ValueError:
             raise CustomException(QuizExceptions.QUIZ_GENERATION_NOT_COMPLETED)
 
-        serializer = QuizSerializer(quiz)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        headers = {}
+        if QuizPayloadCacheService.is_cacheable(quiz):
+            headers["ETag"] = QuizPayloadCacheService.get_etag(quiz)
+            if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+            if headers["ETag"] in if_none_match:
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        def render(quiz):
+            prefetch_related_objects([quiz], "materials", "questions")
+            return QuizSerializer(quiz).data
+
+        data = QuizPayloadCacheService.get_or_render(quiz, render)
+        return Response(data, status=status.HTTP_200_OK, headers=headers)
 
     @swagger_auto_schema(
         operation_summary="퀴즈 생성 요청",
@@ -109,11 +144,15 @@ class QuizViewSet(
 
         프로젝트의 여러 Material을 선택하여 퀴즈를 생성할 수 있습니다.
         퀴즈 생성은 백그라운드에서 처리되며, 반환된 quiz_id로 생성 상태를 확인할 수 있습니다.
+        자료별로 미리 생성해 둔 문제로 모두 채워지면 바로 completed 상태로 반환됩니다.
+        같은 조건의 요청이 짧은 시간 안에 다시 들어오면 (더블 탭, 재시도) 새로 생성하지 않고
+        진행 중인 퀴즈를 그대로 반환합니다.
 
         - material_ids: 퀴즈를 생성할 Material ID 목록 (최소 1개)
         - question_type: 문제 유형 (multiple_choice, short_answer, mixed)
         - question_count: 문제 개수 (1-50)
         - difficulty: 난이도 (easy, medium, hard)
+        - use_cache: 같은 조건의 생성 결과 및 사전 생성 문제 재사용 여부 (기본값 true)
         """,
         request_body=QuizCreateSerializer,
         manual_parameters=[
@@ -138,8 +177,12 @@ class QuizViewSet(
         tags=["퀴즈"],
     )
     @action(detail=False, methods=["post"], url_path="generate")
-    def generate_quiz(self, request, project_id: int):
+    def generate_quiz(self, request):
         """퀴즈 생성 요청"""
+        query_serializer = ProjectIdQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        project_id = query_serializer.validated_data["project_id"]
+
         # 요청 데이터 검증
         serializer = QuizCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -147,9 +190,12 @@ class QuizViewSet(
         # 퀴즈 생성 작업 시작
         try:
             quiz = QuizService.create_quiz(
+                user=request.user,
                 project_id=project_id,
                 **serializer.validated_data,
             )
+        except Project.DoesNotExist:
+            raise CustomException(ProjectExceptions.PROJECT_NOT_FOUND)
         except ValueError:
             raise CustomException(QuizExceptions.INVALID_MATERIAL_SELECTION)
 
@@ -168,6 +214,7 @@ class QuizViewSet(
         - processing: 처리중 (progress_percentage로 진행률 확인 가능)
         - completed: 완료 (이 경우 퀴즈 조회 가능)
         - failed: 실패 (error_message 확인)
+        - cancelled: 취소됨
         """,
         responses=get_swagger_response_dict(
             success_response={
@@ -195,6 +242,49 @@ class QuizViewSet(
         serializer = QuizStatusSerializer(quiz)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @swagger_auto_schema(
+        operation_summary="퀴즈 생성 취소",
+        operation_description="""
+        진행 중인 퀴즈 생성 작업을 취소합니다.
+
+        대기중(pending) 또는 처리중(processing)인 퀴즈만 취소할 수 있으며,
+        진행 중인 LLM 호출도 함께 중단됩니다.
+
+        - keep_partial: 취소 전까지 생성된 문제 유지 여부 (기본값 false - 삭제)
+        """,
+        request_body=QuizCancelSerializer,
+        responses=get_swagger_response_dict(
+            success_response={
+                200: QuizStatusSerializer,
+            },
+            exception_enums=[
+                QuizExceptions.QUIZ_NOT_FOUND,
+                QuizExceptions.PERMISSION_DENIED,
+                QuizExceptions.QUIZ_NOT_CANCELLABLE,
+            ],
+        ),
+        tags=["퀴즈"],
+    )
+    @action(detail=True, methods=["post"], url_path="cancel")
+    def cancel_generation(self, request, pk=None):
+        """퀴즈 생성 취소"""
+        serializer = QuizCancelSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            quiz = QuizService.cancel_quiz(
+                pk, request.user, **serializer.validated_data
+            )
+        except Quiz.DoesNotExist:
+            raise CustomException(QuizExceptions.QUIZ_NOT_FOUND)
+        except PermissionError:
+            raise CustomException(QuizExceptions.PERMISSION_DENIED)
+        except ValueError:
+            raise CustomException(QuizExceptions.QUIZ_NOT_CANCELLABLE)
+
+        response_serializer = QuizStatusSerializer(quiz)
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
     # ============ 퀴즈 풀이 관련 엔드포인트 ============
 
     @swagger_auto_schema(
@@ -241,6 +331,7 @@ class QuizViewSet(
                 user=request.user,
                 question_id=serializer.validated_data["question_id"],
                 answer=serializer.validated_data["answer"],
+                time_spent_seconds=serializer.validated_data["time_spent_seconds"],
             )
         except QuizQuestions.DoesNotExist:
             raise CustomException(QuizExceptions.QUIZ_NOT_FOUND)
@@ -263,6 +354,7 @@ class QuizViewSet(
           - answer: 답안
 
         제출 후 자동으로 채점되어 결과를 확인할 수 있습니다.
+        모든 문제는 URL의 퀴즈에 속해야 하며, 하나라도 아니면 아무 답안도 저장되지 않습니다.
         """,
         request_body=QuizAnswerBatchSubmitSerializer,
         responses=get_swagger_response_dict(
@@ -283,7 +375,7 @@ class QuizViewSet(
                     ),
                 ),
             },
-            exception_enums=[QuizExceptions.QUIZ_NOT_FOUND],
+            exception_enums=[QuizExceptions.QUESTION_NOT_IN_QUIZ],
         ),
         tags=["퀴즈 풀이"],
     )
@@ -295,10 +387,12 @@ class QuizViewSet(
 
         try:
             answer_histories = QuizService.submit_answers_batch(
-                user=request.user, answers=serializer.validated_data["answers"]
+                user=request.user,
+                quiz_id=pk,
+                answers=serializer.validated_data["answers"],
             )
-        except QuizQuestions.DoesNotExist:
-            raise CustomException(QuizExceptions.QUIZ_NOT_FOUND)
+        except ValueError:
+            raise CustomException(QuizExceptions.QUESTION_NOT_IN_QUIZ)
 
         return Response(
             {
@@ -336,3 +430,66 @@ class QuizViewSet(
 
         serializer = QuizResultSerializer(result)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_summary="프로젝트 오답 노트 조회",
+        operation_description="""
+        프로젝트의 모든 퀴즈에서 틀린 문제를 조회합니다.
+
+        최근 답안 제출 순으로 정렬되며 커서 기반으로 페이지를 나눕니다.
+        다음 페이지는 응답의 next URL(cursor 파라미터 포함)로 조회합니다.
+        각 항목에는 문제, 정답, 해설과 제출한 답안이 포함됩니다.
+        """,
+        responses=get_swagger_response_dict(
+            success_response={
+                200: cursor_page_serializer(QuizWrongAnswerSerializer),
+            },
+            exception_enums=[ProjectExceptions.PROJECT_NOT_FOUND],
+        ),
+        tags=["퀴즈 풀이"],
+    )
+    def wrong_answers(self, request, project_id: int):
+        """프로젝트 오답 노트 조회"""
+        try:
+            wrong_answers = QuizService.get_wrong_answers(project_id, request.user)
+        except Project.DoesNotExist:
+            raise CustomException(ProjectExceptions.PROJECT_NOT_FOUND)
+
+        page = self.paginate_queryset(wrong_answers)
+        serializer = QuizWrongAnswerSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @swagger_auto_schema(
+        operation_summary="프로젝트 학습 통계 조회",
+        operation_description="""
+        프로젝트의 학습 통계를 조회합니다.
+
+        - totals: 전체 풀이 수, 정답 수, 정답률, 풀이 시간
+        - daily: 최근 days일 동안의 날짜별(UTC) 통계 (풀이가 있는 날짜만)
+        - materials: 자료별 통계 (숙련도), 최근 풀이 순
+
+        같은 문제를 다시 제출하면 풀이 수는 그대로이고 마지막 답안의 정답 여부가 반영됩니다.
+        """,
+        query_serializer=LearningStatsQuerySerializer,
+        responses=get_swagger_response_dict(
+            success_response={
+                200: ProjectLearningStatsSerializer,
+            },
+            exception_enums=[ProjectExceptions.PROJECT_NOT_FOUND],
+        ),
+        tags=["퀴즈 풀이"],
+    )
+    def learning_stats(self, request, project_id: int):
+        """프로젝트 학습 통계 조회"""
+        query_serializer = LearningStatsQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        try:
+            stats = LearningStatsService.get_project_stats(
+                project_id, request.user, query_serializer.validated_data["days"]
+            )
+        except Project.DoesNotExist:
+            raise CustomException(ProjectExceptions.PROJECT_NOT_FOUND)
+
+        serializer = ProjectLearningStatsSerializer(stats)
+        return Response(serializer.data, status=status.HTTP_200_OK)
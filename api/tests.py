@@ -0,0 +1,425 @@
+import json
+import os
+import subprocess
+import sys
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from api.project.models import Material, Project
+from api.quiz.models import Quiz, QuizQuestions, QuizStatus
+from api.quiz.services.learning_stats_service import LearningStatsService
+from api.quiz.services.quiz_service import QuizService
+from api.user.models import User
+from common.db import PrimaryReplicaRouter, ReplicaReadMiddleware, replica_reads
+
+# API 라우트별 최대 쿼리 수 {(라우트 이름, HTTP 메서드): 최대 쿼리 수}
+# 데이터 양과 무관해야 하므로, 목록/상세 응답에서 N+1이 생기면 이 값을 넘거나
+# 데이터 규모에 따라 쿼리 수가 달라져 실패합니다.
+QUERY_BUDGETS = {
+    ("token_refresh", "post"): 0,
+    ("withdraw", "delete"): 23,
+    ("project-list-create", "get"): 1,
+    ("project-list-create", "post"): 1,
+    ("project-detail", "get"): 1,
+    ("project-detail", "put"): 2,
+    ("project-detail", "patch"): 2,
+    ("project-detail", "delete"): 15,
+    ("material-detail", "get"): 1,
+    ("material-detail", "put"): 6,
+    ("material-detail", "patch"): 5,
+    ("material-detail", "delete"): 9,
+    ("material-list-create", "get"): 2,
+    ("material-list-create", "post"): 5,
+    ("project-wrong-answers", "get"): 2,
+    ("project-learning-stats", "get"): 4,
+    ("quiz-list", "get"): 4,
+    ("quiz-list", "post"): 15,
+    ("quiz-detail", "get"): 3,
+    ("quiz-generation-status", "get"): 2,
+    ("quiz-cancel", "post"): 11,
+    ("quiz-submit-answer", "post"): 15,
+    ("quiz-submit-answers", "post"): 15,
+    ("quiz-result", "get"): 3,
+}
+
+# 외부 서비스 없이는 호출할 수 없어 제외하는 라우트 {(라우트 이름, HTTP 메서드): 사유}
+UNBUDGETED_ROUTES = {
+    ("social-login", "post"): "Firebase ID 토큰 검증 필요",
+}
+
+# 쿼리 수 예산을 확인할 API 경로 (admin, swagger 제외)
+BUDGETED_PREFIXES = ("users", "projects", "quizzes")
+
+
+def iter_api_routes():
+    """api/urls.py의 API 라우트를 (라우트 이름, HTTP 메서드)로 나열"""
+
+    def walk(patterns, prefix=""):
+        for pattern in patterns:
+            route = prefix + str(pattern.pattern)
+            if isinstance(pattern, URLResolver):
+                yield from walk(pattern.url_patterns, route)
+            elif isinstance(pattern, URLPattern) and route.startswith(
+                BUDGETED_PREFIXES
+            ):
+                for method in getattr(pattern.callback, "actions", {}):
+                    # HEAD는 DRF가 GET 액션에 자동으로 연결
+                    if method != "head":
+                        yield pattern.name, method
+
+    return set(walk(get_resolver().url_patterns))
+
+
+class EndpointQueryBudgetTest(TestCase):
+    """모든 API 라우트의 쿼리 수가 예산 이하이고 데이터 규모와 무관한지 확인"""
+
+    def seed(self, scale: int) -> User:
+        """
+        사용자 한 명의 학습 데이터 생성
+
+        프로젝트 scale개, 프로젝트마다 자료 scale개와 완료된 퀴즈 scale개,
+        퀴즈마다 문제 scale개와 모든 문제의 답안 기록 (절반은 오답)
+        """
+        user = User.objects.create_user(identifier=f"budget-user-{scale}")
+        for project_index in range(scale):
+            project = Project.objects.create(
+                user=user, name=f"프로젝트 {project_index}"
+            )
+            materials = Material.objects.bulk_create(
+                [
+                    Material(project=project, title=f"자료 {index}", url="https://a.b")
+                    for index in range(scale)
+                ]
+            )
+            for quiz_index in range(scale):
+                quiz = Quiz.objects.create(
+                    project=project,
+                    status=QuizStatus.COMPLETED,
+                    question_count=scale,
+                )
+                quiz.materials.set(materials)
+                questions = QuizQuestions.objects.bulk_create(
+                    [
+                        QuizQuestions(
+                            quiz=quiz,
+                            question=f"문제 {index}",
+                            answers={"answer": "1"},
+                            metadata={"question_type": "multiple_choice"},
+                        )
+                        for index in range(scale)
+                    ]
+                )
+                QuizService.submit_answers_batch(
+                    user=user,
+                    quiz_id=quiz.id,
+                    answers=[
+                        {"question_id": question.id, "answer": str(index % 2 + 1)}
+                        for index, question in enumerate(questions)
+                    ],
+                )
+            # 생성 중인 퀴즈 (취소 대상)
+            processing = Quiz.objects.create(
+                project=project, status=QuizStatus.PROCESSING
+            )
+            QuizQuestions.objects.bulk_create(
+                [
+                    QuizQuestions(quiz=processing, question=f"문제 {index}")
+                    for index in range(scale)
+                ]
+            )
+        LearningStatsService.rebuild([user.id])
+        return user
+
+    def build_requests(self, user: User):
+        """(라우트 이름, HTTP 메서드) → (경로, 요청 데이터)"""
+        project = Project.objects.filter(user=user).first()
+        material = project.materials.first()
+        quiz = Quiz.objects.filter(project=project, status=QuizStatus.COMPLETED).first()
+        question = quiz.questions.first()
+        processing = Quiz.objects.get(project=project, status=QuizStatus.PROCESSING)
+
+        submit = {"question_id": str(question.id), "answer": "1"}
+        project_data = {"name": "새 이름", "color": "#000000"}
+        material_data = {"title": "새 제목"}
+        return {
+            ("token_refresh", "post"): (
+                "/users/refresh",
+                {"refresh_token": str(RefreshToken.for_user(user))},
+            ),
+            ("project-list-create", "get"): ("/projects", None),
+            ("project-list-create", "post"): ("/projects", project_data),
+            ("project-detail", "get"): (f"/projects/{project.id}", None),
+            ("project-detail", "put"): (f"/projects/{project.id}", project_data),
+            ("project-detail", "patch"): (f"/projects/{project.id}", project_data),
+            ("project-detail", "delete"): (f"/projects/{project.id}", None),
+            ("material-detail", "get"): (f"/projects/materials/{material.id}", None),
+            ("material-detail", "put"): (
+                f"/projects/materials/{material.id}",
+                {**material_data, "project": project.id},
+            ),
+            ("material-detail", "patch"): (
+                f"/projects/materials/{material.id}",
+                material_data,
+            ),
+            ("material-detail", "delete"): (
+                f"/projects/materials/{material.id}",
+                None,
+            ),
+            ("material-list-create", "get"): (
+                f"/projects/{project.id}/materials",
+                None,
+            ),
+            ("material-list-create", "post"): (
+                f"/projects/{project.id}/materials",
+                {"material_type": "url", "url": "https://example.com"},
+            ),
+            ("project-wrong-answers", "get"): (
+                f"/projects/{project.id}/wrong-answers",
+                None,
+            ),
+            ("project-learning-stats", "get"): (f"/projects/{project.id}/stats", None),
+            ("quiz-list", "get"): (f"/quizzes?project_id={project.id}", None),
+            ("quiz-list", "post"): (
+                f"/quizzes?project_id={project.id}",
+                {"material_ids": [str(material.id)], "question_count": 3},
+            ),
+            ("quiz-detail", "get"): (f"/quizzes/{quiz.id}", None),
+            ("quiz-generation-status", "get"): (f"/quizzes/{quiz.id}/status", None),
+            ("quiz-cancel", "post"): (f"/quizzes/{processing.id}/cancel", {}),
+            ("quiz-submit-answer", "post"): (
+                f"/quizzes/{quiz.id}/submit-answer",
+                submit,
+            ),
+            ("quiz-submit-answers", "post"): (
+                f"/quizzes/{quiz.id}/submit-answers",
+                {"answers": [submit]},
+            ),
+            ("quiz-result", "get"): (f"/quizzes/{quiz.id}/result", None),
+            # 삭제 후에는 user.pk가 None이 되므로 마지막에 호출
+            ("withdraw", "delete"): ("/users/withdraw", None),
+        }
+
+    def measure(self, scale: int) -> dict:
+        """각 라우트를 호출해 {(라우트 이름, HTTP 메서드): 실행된 쿼리 목록} 반환"""
+        user = self.seed(scale)
+        client = APIClient()
+        client.force_authenticate(user)
+
+        captured = {}
+        for (name, method), (path, data) in self.build_requests(user).items():
+            cache.clear()
+            # 요청마다 변경 사항을 되돌려 모든 요청이 같은 데이터를 보도록
+            with transaction.atomic():
+                with CaptureQueriesContext(connection) as context:
+                    response = getattr(client, method)(path, data, format="json")
+                transaction.set_rollback(True)
+            self.assertLess(
+                response.status_code, 400, f"{method.upper()} {path}: {response.data}"
+            )
+            captured[name, method] = [
+                query["sql"] for query in context.captured_queries
+            ]
+        return captured
+
+    def test_every_route_has_budget(self):
+        routes = iter_api_routes()
+        self.assertEqual(routes - set(UNBUDGETED_ROUTES), set(QUERY_BUDGETS))
+
+    @mock.patch(
+        "api.project.services.project_service.WebUtils.get_page_info",
+        return_value=("예시 페이지", None),
+    )
+    def test_query_counts_within_budget_and_independent_of_data_size(self, _):
+        small, large = self.measure(scale=1), self.measure(scale=4)
+
+        for route, budget in QUERY_BUDGETS.items():
+            with self.subTest(route=route):
+                queries = large[route]
+                sql = "\n".join(
+                    f"{index}. {query}" for index, query in enumerate(queries, 1)
+                )
+                self.assertLessEqual(
+                    len(queries),
+                    budget,
+                    f"{route}: {len(queries)} queries (budget {budget})\n{sql}",
+                )
+                self.assertEqual(
+                    len(queries),
+                    len(small[route]),
+                    f"{route}: query count grows with data "
+                    f"({len(small[route])} -> {len(queries)})\n{sql}",
+                )
+
+
+@override_settings(DATABASE_REPLICA_ALIAS="replica")
+class ReplicaRoutingTest(SimpleTestCase):
+    """읽기 요청의 조회만 복제 DB로 보내고, 쓰기 이후에는 기본 DB로 고정하는지 확인"""
+
+    router = PrimaryReplicaRouter()
+
+    def route_reads(self, method: str, write: bool = False) -> list:
+        """요청 처리 중 쓰기 전/후 조회 DB 별칭 목록"""
+        aliases = []
+
+        def view(request):
+            aliases.append(self.router.db_for_read(Quiz))
+            if write:
+                self.router.db_for_write(Quiz)
+                aliases.append(self.router.db_for_read(Quiz))
+            return HttpResponse()
+
+        request = getattr(RequestFactory(), method)("/quizzes")
+        ReplicaReadMiddleware(view)(request)
+        return aliases
+
+    def test_reads_outside_requests_use_primary(self):
+        self.assertEqual(self.router.db_for_read(Quiz), "default")
+
+    def test_read_requests_use_replica(self):
+        self.assertEqual(self.route_reads("get"), ["replica"])
+
+    def test_write_requests_use_primary(self):
+        self.assertEqual(self.route_reads("post"), ["default"])
+
+    def test_reads_after_write_are_pinned_to_primary(self):
+        self.assertEqual(self.route_reads("get", write=True), ["replica", "default"])
+        # 고정은 요청이 끝나면 풀림
+        self.assertEqual(self.route_reads("get"), ["replica"])
+
+    def test_reads_inside_primary_transaction_use_primary(self):
+        with replica_reads():
+            with mock.patch.object(connection, "in_atomic_block", True):
+                self.assertEqual(self.router.db_for_read(Quiz), "default")
+            self.assertEqual(self.router.db_for_read(Quiz), "replica")
+
+    @override_settings(DATABASE_REPLICA_ALIAS=None)
+    def test_without_replica_reads_use_primary(self):
+        self.assertEqual(self.route_reads("get"), ["default"])
+
+
+@skipUnless(
+    "replica" in settings.DATABASES,
+    "복제 DB(DB_REPLICA_HOST) 설정이 있을 때만 실행",
+)
+@override_settings(DATABASE_REPLICA_ALIAS="replica")
+class ReplicaDatabaseTest(TransactionTestCase):
+    """
+    두 DB를 사용한 라우팅 확인
+
+    테스트 DB 사이에는 복제가 없으므로, 기본 DB에만 쓴 데이터는 복제 DB로 보낸
+    조회에서 보이지 않습니다.
+    """
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        self.user = User.objects.create_user(identifier="replica-user")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_reads_from_replica(self):
+        Project.objects.create(user=self.user, name="기본 DB에만 있는 프로젝트")
+
+        response = self.client.get("/projects")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"], [])
+
+    def test_write_request_reads_own_writes_from_primary(self):
+        response = self.client.post("/projects", {"name": "새 프로젝트"}, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Project.objects.filter(id=response.data["id"]).exists())
+        self.assertFalse(
+            Project.objects.using("replica").filter(id=response.data["id"]).exists()
+        )
+
+
+# 지연 import 정책: 아래 무거운 라이브러리는 서버/관리 명령 시작 시간을 줄이기 위해
+# 모듈 최상단이 아니라 처음 사용하는 함수/메서드 안에서 import합니다
+# (타입 힌트는 TYPE_CHECKING 블록에서만 import).
+LAZY_IMPORT_MODULES = (
+    "fitz",
+    "PIL",
+    "bs4",
+    "playwright",
+    "langchain",
+    "langchain_core",
+    "firebase_admin",
+    "boto3",
+)
+STARTUP_SCRIPT = f"""
+import json, sys
+import django
+django.setup()
+import api.urls
+lazy = {LAZY_IMPORT_MODULES!r}
+print(json.dumps(sorted({{name.split(".")[0] for name in sys.modules}} & set(lazy))))
+"""
+
+
+def run_startup() -> tuple:
+    """
+    새 프로세스에서 django.setup()과 URLconf import 실행
+
+    Returns:
+        tuple: (시작 후 sys.modules에 있는 LAZY_IMPORT_MODULES 목록,
+                누적 import 시간이 긴 모듈 상위 10개 보고 문자열)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT],
+        cwd=settings.BASE_DIR,
+        env={
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE,
+            "PYTHONPATH": os.pathsep.join(filter(None, sys.path)),
+        },
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # 형식: "import time: self [us] | cumulative | imported package" (들여쓰기 = 중첩)
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        timings.append((int(cumulative), name.strip()))
+    report = "\n".join(
+        f"{time / 1000:8.1f}ms  {name}" for time, name in sorted(timings)[::-1][:10]
+    )
+    return json.loads(result.stdout.splitlines()[-1]), report
+
+
+class StartupImportTimeTest(SimpleTestCase):
+    """
+    시작 시 무거운 라이브러리를 import하지 않는지 확인
+
+    import 시간은 머신/디스크 캐시 상태에 따라 달라지므로 제한하지 않고,
+    실패 시 원인을 찾을 수 있도록 느린 import 목록만 함께 보여 줍니다.
+    """
+
+    def test_heavy_libraries_are_imported_lazily(self):
+        imported, report = run_startup()
+
+        self.assertEqual(
+            imported,
+            [],
+            f"startup imports heavy libraries\nslowest imports:\n{report}",
+        )
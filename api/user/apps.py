@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class UserConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api.user"
+
+    def ready(self):
+        from api.user import signals  # noqa: F401
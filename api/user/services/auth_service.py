@@ -1,12 +1,14 @@
 from abc import ABC, abstractmethod
 
-from firebase_admin import auth
 from loguru import logger
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from api.user.exceptions import OAuthCustomExceptions
 from api.user.models import User
+from api.user.services.firebase_token_cache_service import FirebaseTokenCacheService
+from api.user.services.user_snapshot_service import UserSnapshotService
 from common.exceptions.custom_exceptions import CustomException
+from common.utils.firebase_utils import FirebaseUtils
 
 
 class AuthService(ABC):
@@ -25,11 +27,19 @@ class FirebaseAuthService(AuthService):
 
     def _verify_firebase_token(self, id_token: str):
         """Firebase ID Token 검증"""
+        # 같은 토큰으로 재시도한 로그인은 서명 검증 없이 이전 결과 사용
+        decoded_token = FirebaseTokenCacheService.get(id_token)
+        if decoded_token is not None:
+            return decoded_token
+
+        from firebase_admin import auth
+
         try:
             # check_revoked=False로 설정하고, clock skew tolerance 사용
-            decoded_token = auth.verify_id_token(
+            decoded_token = FirebaseUtils.verify_id_token(
                 id_token, check_revoked=False, clock_skew_seconds=10
             )
+            FirebaseTokenCacheService.set(id_token, decoded_token)
             return decoded_token
         except auth.InvalidIdTokenError as e:
             logger.error(f"Invalid Firebase ID token: {e}")
@@ -57,9 +67,9 @@ class FirebaseAuthService(AuthService):
         username = decoded_token.get("name", name or "")
         provider = decoded_token.get("firebase", {}).get("sign_in_provider", "firebase")
 
-        # 사용자 생성 또는 조회
-        user, is_created = User.objects.get_or_create(
-            identifier=user_id,
+        # 사용자 생성 또는 조회 (이미 가입한 사용자는 캐시에서 조회)
+        user = UserSnapshotService.get_or_create_by_identifier(
+            user_id,
             defaults={
                 "username": username,
                 "email": email,
@@ -0,0 +1,61 @@
+import hashlib
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+class FirebaseTokenCacheService:
+    """
+    검증된 Firebase ID 토큰 결과 캐시 서비스
+
+    네트워크가 불안정하면 클라이언트가 같은 ID 토큰으로 로그인을 재시도하므로,
+    서명 검증(RSA)을 통과한 토큰의 claims를 토큰 만료(exp)까지 저장해 두고 재사용합니다.
+    폐기 여부는 확인하지 않으므로(check_revoked=False) 만료 전까지의 결과는 항상 같습니다.
+    캐시 키에는 토큰 원문 대신 sha256 해시를 사용합니다.
+    """
+
+    @staticmethod
+    def build_key(id_token: str) -> str:
+        """캐시 키 생성"""
+        digest = hashlib.sha256(id_token.encode("utf-8")).hexdigest()
+        return f"firebase-token:{digest}"
+
+    @staticmethod
+    def get(id_token: str) -> Optional[dict]:
+        """
+        캐시된 검증 결과 조회
+
+        Args:
+            id_token: Firebase ID 토큰
+
+        Returns:
+            Optional[dict]: 검증된 토큰 claims. 없거나 만료되었으면 None
+        """
+        if not settings.AUTH_FIREBASE_TOKEN_CACHE_ENABLED:
+            return None
+
+        decoded_token = cache.get(FirebaseTokenCacheService.build_key(id_token))
+        # 캐시 백엔드의 만료 시각 오차와 무관하게 exp가 지난 결과는 사용하지 않음
+        if decoded_token is None or decoded_token.get("exp", 0) <= time.time():
+            return None
+        return decoded_token
+
+    @staticmethod
+    def set(id_token: str, decoded_token: dict) -> None:
+        """
+        검증 결과 저장 (토큰 만료 시각까지)
+
+        Args:
+            id_token: Firebase ID 토큰
+            decoded_token: auth.verify_id_token 결과
+        """
+        if not settings.AUTH_FIREBASE_TOKEN_CACHE_ENABLED:
+            return
+
+        timeout = int(decoded_token.get("exp", 0) - time.time())
+        if timeout > 0:
+            cache.set(
+                FirebaseTokenCacheService.build_key(id_token), decoded_token, timeout
+            )
@@ -0,0 +1,184 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from api.user.models import User
+
+# 인증에 필요한 최소 사용자 정보 (나머지 필드는 접근할 때 DB에서 지연 로딩)
+SNAPSHOT_FIELDS = (
+    "id",
+    "identifier",
+    "username",
+    "email",
+    "provider",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+)
+# 스냅샷 필드가 바뀌면 올려서 공유 캐시의 이전 값을 무효화
+SNAPSHOT_SCHEMA_VERSION = 1
+
+
+class UserSnapshotService:
+    """
+    JWT 인증 사용자 스냅샷 캐시 서비스
+
+    인증할 때마다 users 테이블을 조회하지 않도록, user_id별 최소 사용자 정보를
+    프로세스 로컬 LRU에 짧게(AUTH_USER_CACHE_TIMEOUT_SECONDS) 보관합니다.
+    AUTH_USER_CACHE_USE_SHARED가 켜져 있으면 공유 캐시(CACHES["default"])에도 저장하여
+    다른 프로세스도 DB 조회 없이 사용합니다.
+
+    사용자 수정/비활성화/탈퇴 시 invalidate()로 현재 프로세스와 공유 캐시에서 지우고,
+    다른 프로세스의 로컬 LRU에 남은 값은 유지 시간이 지나면 사라집니다.
+    """
+
+    _entries: "OrderedDict[int, Tuple[float, dict]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def build_key(user_id) -> str:
+        """공유 캐시 키"""
+        return f"auth-user:v{SNAPSHOT_SCHEMA_VERSION}:{user_id}"
+
+    @classmethod
+    def get_user(cls, user_id) -> User:
+        """
+        캐시된 스냅샷으로 사용자 객체 생성 (없으면 DB에서 조회 후 저장)
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            User: 스냅샷 필드만 채워진 사용자 (요청마다 새 객체)
+
+        Raises:
+            User.DoesNotExist: 사용자가 없는 경우
+        """
+        timeout = settings.AUTH_USER_CACHE_TIMEOUT_SECONDS
+        if timeout <= 0:
+            return User.objects.get(pk=user_id)
+
+        user_id = int(user_id)
+        snapshot = cls._get_local(user_id)
+        if snapshot is None and settings.AUTH_USER_CACHE_USE_SHARED:
+            snapshot = cache.get(cls.build_key(user_id))
+            if snapshot is not None:
+                cls._set_local(user_id, snapshot)
+
+        if snapshot is None:
+            snapshot = User.objects.filter(pk=user_id).values(*SNAPSHOT_FIELDS).first()
+            if snapshot is None:
+                raise User.DoesNotExist(f"User {user_id} does not exist")
+            cls._store(user_id, snapshot)
+
+        return cls._build_user(snapshot)
+
+    @staticmethod
+    def build_identifier_key(identifier: str) -> str:
+        """identifier → user_id 캐시 키"""
+        digest = hashlib.sha256(identifier.encode("utf-8")).hexdigest()
+        return f"auth-identifier:{digest}"
+
+    @classmethod
+    def get_or_create_by_identifier(cls, identifier: str, defaults: dict) -> User:
+        """
+        identifier로 사용자 조회 (없으면 생성)
+
+        identifier → user_id 매핑을 캐시하고 사용자는 스냅샷으로 만들어, 이미 가입한
+        사용자의 로그인은 DB를 조회하지 않습니다. 매핑된 사용자가 탈퇴했으면 다시 조회합니다.
+
+        Args:
+            identifier: User.identifier (Firebase uid 등)
+            defaults: 새로 생성할 때 사용할 필드 값
+
+        Returns:
+            User: 사용자
+        """
+        key = cls.build_identifier_key(identifier)
+        user_id = cache.get(key)
+        if user_id is not None:
+            try:
+                return cls.get_user(user_id)
+            except User.DoesNotExist:
+                cache.delete(key)
+
+        user, _ = User.objects.get_or_create(identifier=identifier, defaults=defaults)
+        cache.set(key, user.id, settings.AUTH_IDENTIFIER_CACHE_TIMEOUT_SECONDS)
+        # 로그인 직후 요청의 인증도 DB 조회 없이 처리되도록 스냅샷 저장
+        if settings.AUTH_USER_CACHE_TIMEOUT_SECONDS > 0:
+            cls._store(user.id, {name: getattr(user, name) for name in SNAPSHOT_FIELDS})
+        return user
+
+    @classmethod
+    def invalidate(cls, user_id, identifier: Optional[str] = None) -> None:
+        """
+        사용자 스냅샷 삭제 (현재 프로세스 + 공유 캐시)
+
+        Args:
+            user_id: User ID
+            identifier: 함께 지울 identifier → user_id 매핑 (탈퇴 시)
+        """
+        with cls._lock:
+            cls._entries.pop(int(user_id), None)
+        if settings.AUTH_USER_CACHE_USE_SHARED:
+            cache.delete(cls.build_key(user_id))
+        if identifier:
+            cache.delete(cls.build_identifier_key(identifier))
+
+    @classmethod
+    def clear(cls) -> None:
+        """현재 프로세스의 스냅샷 전체 삭제"""
+        with cls._lock:
+            cls._entries.clear()
+
+    @classmethod
+    def _store(cls, user_id: int, snapshot: dict) -> None:
+        """스냅샷 저장 (현재 프로세스 + 공유 캐시)"""
+        cls._set_local(user_id, snapshot)
+        if settings.AUTH_USER_CACHE_USE_SHARED:
+            cache.set(
+                cls.build_key(user_id),
+                snapshot,
+                settings.AUTH_USER_CACHE_TIMEOUT_SECONDS,
+            )
+
+    @classmethod
+    def _get_local(cls, user_id: int) -> Optional[dict]:
+        with cls._lock:
+            entry = cls._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, snapshot = entry
+            if expires_at <= time.monotonic():
+                del cls._entries[user_id]
+                return None
+            cls._entries.move_to_end(user_id)
+            return snapshot
+
+    @classmethod
+    def _set_local(cls, user_id: int, snapshot: dict) -> None:
+        expires_at = time.monotonic() + settings.AUTH_USER_CACHE_TIMEOUT_SECONDS
+        with cls._lock:
+            cls._entries[user_id] = (expires_at, snapshot)
+            cls._entries.move_to_end(user_id)
+            # 가장 오래 사용되지 않은 항목부터 제거
+            while len(cls._entries) > settings.AUTH_USER_CACHE_MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+
+    @staticmethod
+    def _build_user(snapshot: dict) -> User:
+        """스냅샷으로 DB에서 읽은 것과 같은 상태의 사용자 객체 생성 (나머지 필드는 지연 로딩)"""
+        field_names = [
+            field.attname
+            for field in User._meta.concrete_fields
+            if field.attname in snapshot
+        ]
+        return User.from_db(
+            DEFAULT_DB_ALIAS, field_names, [snapshot[name] for name in field_names]
+        )
@@ -0,0 +1,24 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.user.models import User
+from api.user.services.user_snapshot_service import UserSnapshotService
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_snapshot_on_update(sender, instance, created, **kwargs):
+    """사용자 수정/비활성화가 커밋되면 인증 사용자 스냅샷 캐시 무효화"""
+    if created:
+        return
+    user_id = instance.pk
+    transaction.on_commit(lambda: UserSnapshotService.invalidate(user_id))
+
+
+@receiver(post_delete, sender=User)
+def invalidate_user_snapshot_on_delete(sender, instance, **kwargs):
+    """탈퇴가 커밋되면 스냅샷과 로그인 identifier 매핑 캐시 무효화"""
+    user_id, identifier = instance.pk, instance.identifier
+    transaction.on_commit(
+        lambda: UserSnapshotService.invalidate(user_id, identifier=identifier)
+    )
@@ -1,3 +1,146 @@
-from django.test import TestCase
+import time
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from api.user.models import User
+from api.user.services.auth_service import FirebaseAuthService
+from api.user.services.user_snapshot_service import UserSnapshotService
+
+
+class UserSnapshotCacheTest(TestCase):
+    def setUp(self):
+        UserSnapshotService.clear()
+        self.addCleanup(UserSnapshotService.clear)
+        self.user = User.objects.create_user(identifier="snapshot-user")
+        token = RefreshToken.for_user(self.user).access_token
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def get_projects(self):
+        return self.client.get("/projects")
+
+    def test_authentication_uses_cached_user(self):
+        with self.assertNumQueries(2):  # 사용자 + 프로젝트 목록
+            self.assertEqual(self.get_projects().status_code, 200)
+        with self.assertNumQueries(1):  # 프로젝트 목록
+            self.assertEqual(self.get_projects().status_code, 200)
+
+    def test_cached_user_loads_other_fields_lazily(self):
+        self.user.phone_number = "010-0000-0000"
+        self.user.save()
+        UserSnapshotService.get_user(self.user.id)
+
+        user = UserSnapshotService.get_user(self.user.id)
+
+        self.assertEqual(user.identifier, "snapshot-user")
+        with self.assertNumQueries(1):
+            self.assertEqual(user.phone_number, "010-0000-0000")
+
+    def test_deactivation_invalidates_snapshot(self):
+        self.assertEqual(self.get_projects().status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        self.assertEqual(self.get_projects().status_code, 401)
+
+    def test_withdraw_invalidates_snapshot(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.client.delete("/users/withdraw").status_code, 200)
+
+        self.assertEqual(self.get_projects().status_code, 401)
+
+    def test_revoked_token_is_rejected(self):
+        with mock.patch.object(api_settings, "CHECK_REVOKE_TOKEN", True):
+            token = RefreshToken.for_user(self.user).access_token
+            self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+            self.assertEqual(self.get_projects().status_code, 200)
+
+            # 스냅샷이 남아 있어도 비밀번호가 바뀌면 이전 토큰은 거부
+            User.objects.filter(id=self.user.id).update(password="changed")
+            self.assertEqual(self.get_projects().status_code, 401)
+
+    @override_settings(AUTH_USER_CACHE_MAX_ENTRIES=1)
+    def test_least_recently_used_snapshot_is_evicted(self):
+        other = User.objects.create_user(identifier="other-user")
+        UserSnapshotService.get_user(self.user.id)
+        UserSnapshotService.get_user(other.id)
+
+        with self.assertNumQueries(1):
+            UserSnapshotService.get_user(self.user.id)
+
+    @override_settings(AUTH_USER_CACHE_USE_SHARED=True)
+    def test_shared_cache_serves_other_processes(self):
+        UserSnapshotService.get_user(self.user.id)
+        # 다른 프로세스처럼 로컬 LRU가 비어 있어도 공유 캐시에서 조회
+        UserSnapshotService.clear()
+
+        with self.assertNumQueries(0):
+            UserSnapshotService.get_user(self.user.id)
+
+    @override_settings(AUTH_USER_CACHE_TIMEOUT_SECONDS=0)
+    def test_disabled_cache_queries_every_time(self):
+        for _ in range(2):
+            with self.assertNumQueries(1):
+                UserSnapshotService.get_user(self.user.id)
+
+
+class FirebaseLoginCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        UserSnapshotService.clear()
+        self.addCleanup(cache.clear)
+        self.addCleanup(UserSnapshotService.clear)
+        patcher = mock.patch(
+            "api.user.services.auth_service.FirebaseUtils.verify_id_token",
+            side_effect=self.verify_id_token,
+        )
+        self.verify = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.expires_in = 3600
+
+    def verify_id_token(self, id_token, **kwargs):
+        return {
+            "uid": f"uid-{id_token}",
+            "email": "student@example.com",
+            "exp": time.time() + self.expires_in,
+        }
+
+    def login(self, id_token="token"):
+        return FirebaseAuthService().get_or_create_user(id_token)
+
+    def test_retried_login_reuses_verification_and_user(self):
+        user = self.login()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.login().id, user.id)
+        self.assertEqual(self.verify.call_count, 1)
+
+    def test_different_tokens_are_verified_separately(self):
+        self.login("first")
+        self.login("second")
+
+        self.assertEqual(self.verify.call_count, 2)
+
+    def test_expired_verification_is_not_cached(self):
+        self.expires_in = -1
+        self.login()
+        self.login()
+
+        self.assertEqual(self.verify.call_count, 2)
+
+    def test_login_after_withdraw_creates_new_user(self):
+        user = self.login()
+        with self.captureOnCommitCallbacks(execute=True):
+            user.delete()
+
+        new_user = self.login()
+
+        self.assertNotEqual(new_user.id, user.id)
+        self.assertTrue(User.objects.filter(id=new_user.id).exists())
@@ -6,7 +6,10 @@ from rest_framework_simplejwt.exceptions import (
     InvalidToken,
     TokenError,
 )
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
 
+from api.user.services.user_snapshot_service import UserSnapshotService
 from common.authentication.exceptions import AuthCustomExceptions
 from common.exceptions.custom_exceptions import CustomException
 
@@ -79,14 +82,41 @@ class CustomJWTAuthentication(JWTAuthentication):
     def get_user(self, validated_token):
         """
         검증된 토큰에서 사용자를 가져오는 메서드 오버라이드
+        요청마다 DB를 조회하지 않도록 사용자 조회만 캐시된 스냅샷으로 대체하고,
+        활성 여부/토큰 폐기(비밀번호 변경) 검사는 simplejwt의 get_user와 같게 수행합니다.
         """
+        # 스냅샷은 pk 기준이므로 다른 필드로 사용자를 식별하면 기본 조회 사용
+        if api_settings.USER_ID_FIELD not in ("id", "pk"):
+            return self._check_user(super().get_user(validated_token))
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
         try:
-            user = super().get_user(validated_token)
-            if not user.is_active:
-                raise CustomException(AuthCustomExceptions.JWT_USER_INACTIVE)
-            return user
+            user = UserSnapshotService.get_user(user_id)
         except User.DoesNotExist:
             raise CustomException(AuthCustomExceptions.JWT_USER_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error getting user from token: {e}")
             raise CustomException(AuthCustomExceptions.JWT_USER_NOT_FOUND)
+
+        self._check_user(user)
+
+        # 비밀번호는 스냅샷에 없으므로 폐기 검사를 켜면 이 필드만 지연 로딩됨
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                "The user's password has been changed.", code="password_changed"
+            )
+
+        return user
+
+    @staticmethod
+    def _check_user(user):
+        """비활성 사용자 거부"""
+        if not user.is_active:
+            raise CustomException(AuthCustomExceptions.JWT_USER_INACTIVE)
+        return user
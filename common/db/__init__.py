@@ -0,0 +1,13 @@
+from .routing import (
+    PrimaryReplicaRouter,
+    ReplicaReadMiddleware,
+    pin_to_primary,
+    replica_reads,
+)
+
+__all__ = [
+    "PrimaryReplicaRouter",
+    "ReplicaReadMiddleware",
+    "pin_to_primary",
+    "replica_reads",
+]
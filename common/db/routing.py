@@ -0,0 +1,78 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+# 현재 요청(컨텍스트)의 조회를 복제 DB로 보낼 수 있는지 여부
+# 백그라운드 스레드/관리 명령 등 요청 밖에서는 항상 기본 DB를 사용
+_replica_reads_allowed: ContextVar[bool] = ContextVar(
+    "replica_reads_allowed", default=False
+)
+
+
+@contextmanager
+def replica_reads() -> Iterator[None]:
+    """블록 안의 조회를 복제 DB로 보냄 (쓰기가 발생하면 이후 조회는 기본 DB로 고정)"""
+    token = _replica_reads_allowed.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads_allowed.reset(token)
+
+
+def pin_to_primary() -> None:
+    """현재 컨텍스트의 남은 조회를 기본 DB로 고정 (쓴 데이터를 바로 다시 읽기 위함)"""
+    _replica_reads_allowed.set(False)
+
+
+def replica_alias() -> Optional[str]:
+    """
+    지금 조회를 보낼 복제 DB 별칭
+
+    복제 DB가 설정되지 않았거나, 요청 밖이거나, 같은 요청에서 이미 쓰기가 있었거나,
+    기본 DB 트랜잭션 안이면 None (기본 DB 사용)
+    """
+    alias = settings.DATABASE_REPLICA_ALIAS
+    if not alias or not _replica_reads_allowed.get():
+        return None
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return None
+    return alias
+
+
+class PrimaryReplicaRouter:
+    """
+    기본(쓰기) DB / 읽기 전용 복제 DB 라우터
+
+    쓰기는 항상 기본 DB로 보내고, 조회는 ReplicaReadMiddleware가 허용한 읽기 요청
+    (목록 조회, 퀴즈 조회, 상태 polling 등 GET)에서만 복제 DB로 보냅니다.
+    요청 중 쓰기(save/update/delete/select_for_update)가 한 번이라도 있으면 남은 조회는
+    기본 DB로 고정되어 방금 쓴 데이터를 복제 지연 없이 읽습니다.
+    """
+
+    def db_for_read(self, model, **hints):
+        return replica_alias() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        pin_to_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제 DB는 기본 DB와 같은 데이터이므로 DB가 달라도 관계 허용
+        return True
+
+
+class ReplicaReadMiddleware:
+    """읽기 전용 HTTP 메서드(GET/HEAD/OPTIONS) 요청의 조회를 복제 DB로 보냄"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.method not in SAFE_METHODS:
+            return self.get_response(request)
+        with replica_reads():
+            return self.get_response(request)
@@ -0,0 +1,11 @@
+from .cursor_pagination import (
+    CreatedAtCursorPagination,
+    LastActivityCursorPagination,
+    cursor_page_serializer,
+)
+
+__all__ = [
+    "CreatedAtCursorPagination",
+    "LastActivityCursorPagination",
+    "cursor_page_serializer",
+]
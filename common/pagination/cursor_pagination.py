@@ -0,0 +1,58 @@
+from rest_framework import serializers
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    생성일 기준 커서 페이지네이션
+
+    (created_at, id) 역순으로 정렬하고 마지막 행의 created_at을 커서 위치로 사용하므로,
+    큰 OFFSET 없이 created_at 범위 조회로 다음 페이지를 가져옵니다.
+    커서 위치는 created_at 하나뿐이라, created_at이 같은 행은 id 순서로 고정한 뒤
+    커서에 담긴 건너뛸 개수(offset)로 이어서 가져옵니다 (keyset이 아님).
+    모델에 (..., -created_at, -id) 인덱스가 있는 목록(퀴즈, 자료)만 정렬 없이 인덱스 순서로
+    읽고, 그렇지 않은 목록(오답 노트 등)은 조회 결과를 정렬합니다.
+
+    응답 형식: {"next": "...", "previous": "...", "results": [...]}
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class LastActivityCursorPagination(CreatedAtCursorPagination):
+    """
+    마지막 활동 시각 기준 커서 페이지네이션
+
+    (last_activity_at, id) 역순으로 정렬하고 last_activity_at을 커서 위치로 사용합니다.
+    모델에 같은 순서의 인덱스가 있어야 정렬 없이 인덱스 범위 조회로 처리됩니다.
+    """
+
+    ordering = ("-last_activity_at", "-id")
+
+
+def cursor_page_serializer(serializer_class):
+    """
+    커서 페이지 응답 Serializer 생성 (swagger 문서용)
+
+    Args:
+        serializer_class: 목록 항목 Serializer 클래스
+
+    Returns:
+        {"next", "previous", "results"} 형태의 Serializer 클래스
+    """
+    return type(
+        f"{serializer_class.__name__}Page",
+        (serializers.Serializer,),
+        {
+            "next": serializers.URLField(
+                allow_null=True, help_text="다음 페이지 URL (마지막 페이지면 null)"
+            ),
+            "previous": serializers.URLField(
+                allow_null=True, help_text="이전 페이지 URL (첫 페이지면 null)"
+            ),
+            "results": serializer_class(many=True),
+        },
+    )
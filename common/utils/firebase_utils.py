@@ -0,0 +1,43 @@
+import threading
+
+from django.conf import settings
+
+
+class FirebaseUtils:
+    """Firebase Admin SDK 유틸리티 (처음 사용할 때 import/초기화)"""
+
+    _app = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_app(cls):
+        """
+        기본 Firebase 앱 반환 (없으면 settings.FIREBASE_CREDENTIAL_DIR로 초기화)
+
+        여러 스레드가 동시에 처음 호출해도 한 번만 초기화합니다.
+        """
+        if cls._app is None:
+            with cls._lock:
+                if cls._app is None:
+                    import firebase_admin
+                    from firebase_admin import credentials
+
+                    try:
+                        cls._app = firebase_admin.get_app()
+                    except ValueError:
+                        cls._app = firebase_admin.initialize_app(
+                            credentials.Certificate(settings.FIREBASE_CREDENTIAL_DIR)
+                        )
+        return cls._app
+
+    @classmethod
+    def verify_id_token(cls, id_token: str, **kwargs) -> dict:
+        """
+        Firebase ID 토큰 검증 (firebase_admin.auth.verify_id_token)
+
+        Raises:
+            firebase_admin.auth.InvalidIdTokenError 등: 검증 실패
+        """
+        from firebase_admin import auth
+
+        return auth.verify_id_token(id_token, app=cls.get_app(), **kwargs)
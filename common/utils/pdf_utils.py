@@ -1,10 +1,10 @@
 import io
 import os
+import re
 from typing import List, Optional, Tuple
 
-import fitz  # PyMuPDF
-import requests
-from PIL import Image
+# extract_text_from_bytes가 페이지 사이에 넣는 구분자 ("=====N=====")
+PAGE_DELIMITER_PATTERN = re.compile(r"^=====(\d+)=====$", re.MULTILINE)
 
 
 class PDFUtils:
@@ -25,6 +25,9 @@ class PDFUtils:
             io.BytesIO: 썸네일 이미지 데이터 (PNG 형식). 실패 시 None
         """
         try:
+            import fitz  # PyMuPDF
+            from PIL import Image
+
             # PDF 문서 열기
             pdf_document = fitz.open(stream=file_data, filetype="pdf")
 
@@ -75,6 +78,8 @@ class PDFUtils:
             int: 페이지 수. 실패 시 0
         """
         try:
+            import fitz  # PyMuPDF
+
             pdf_document = fitz.open(stream=file_data, filetype="pdf")
             page_count = pdf_document.page_count
             pdf_document.close()
@@ -109,6 +114,8 @@ class PDFUtils:
             str: 추출된 텍스트. 실패 시 빈 문자열
         """
         try:
+            import fitz  # PyMuPDF
+
             pdf_document = fitz.open(stream=file_data, filetype="pdf")
             text = ""
 
@@ -124,6 +131,30 @@ class PDFUtils:
             print(f"Failed to extract text from PDF: {str(e)}")
             return ""
 
+    @staticmethod
+    def split_pages(text: str) -> List[Tuple[int, str]]:
+        """
+        extract_text_from_bytes가 만든 페이지 구분 텍스트를 페이지 단위로 나눕니다.
+
+        Args:
+            text: "=====N=====" 구분자가 포함된 텍스트
+
+        Returns:
+            List[Tuple[int, str]]: [(페이지 번호, 페이지 텍스트), ...] 리스트.
+            구분자가 없으면 전체 텍스트를 1페이지로 취급
+        """
+        parts = PAGE_DELIMITER_PATTERN.split(text)
+        if len(parts) == 1:
+            return [(1, text.strip())] if text.strip() else []
+
+        pages = []
+        # split 결과: [구분자 앞 텍스트, 번호, 텍스트, 번호, 텍스트, ...]
+        for index in range(1, len(parts), 2):
+            page_text = parts[index + 1].strip()
+            if page_text:
+                pages.append((int(parts[index]), page_text))
+        return pages
+
     @staticmethod
     def extract_text_from_url(url: str, timeout: int = 30) -> str:
         """
@@ -137,6 +168,8 @@ class PDFUtils:
             str: 추출된 텍스트. 실패 시 빈 문자열
         """
         try:
+            import requests
+
             response = requests.get(url, timeout=timeout)
             response.raise_for_status()
 
@@ -164,6 +197,8 @@ class PDFUtils:
             # 출력 디렉토리 생성
             os.makedirs(output_dir, exist_ok=True)
 
+            import fitz  # PyMuPDF
+
             pdf_document = fitz.open(stream=file_data, filetype="pdf")
             extracted_images = []
 
@@ -214,6 +249,8 @@ class PDFUtils:
             List[Tuple[int, str]]: [(페이지 번호, 이미지 파일 경로), ...] 리스트. 실패 시 빈 리스트
         """
         try:
+            import requests
+
             response = requests.get(url, timeout=timeout)
             response.raise_for_status()
 
@@ -1,8 +1,6 @@
 import uuid
 from enum import Enum
 
-import boto3
-from botocore.exceptions import ClientError
 from django.conf import settings
 from django.core.files.uploadedfile import UploadedFile
 
@@ -49,6 +47,9 @@ class S3UploadUtil:
         Returns:
             bool: 파일 존재 여부
         """
+        import boto3
+        from botocore.exceptions import ClientError
+
         s3_bucket_name = AWSConfig.get_bucket_name()
 
         if settings.ENV == "local":
@@ -97,6 +98,8 @@ class S3UploadUtil:
             str 또는 dict: 업로드된 파일의 URL 또는 URLs 딕셔너리
         """
 
+        import boto3
+
         session = boto3.Session()
 
         s3_client = session.client("s3")
@@ -149,6 +152,8 @@ class S3UploadUtil:
         s3_key = f"{prefix.value}/{file_id}/{file_name}"
 
         # S3에 직접 업로드
+        import boto3
+
         session = boto3.Session()
         s3_client = session.client("s3")
 
@@ -2,10 +2,6 @@ import io
 import tempfile
 from typing import Optional, Tuple
 
-import requests
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
-
 
 class WebUtils:
     """웹 관련 유틸리티"""
@@ -22,6 +18,9 @@ class WebUtils:
             str: 웹페이지 제목. 실패 시 URL을 반환
         """
         try:
+            import requests
+            from bs4 import BeautifulSoup
+
             response = requests.get(url, timeout=10)
             response.raise_for_status()
 
@@ -36,6 +35,34 @@ class WebUtils:
             print(f"Failed to get page title from {url}: {str(e)}")
             return url
 
+    @staticmethod
+    def extract_text(url: str, timeout: int = 10) -> str:
+        """
+        웹페이지 본문 텍스트를 추출합니다.
+
+        Args:
+            url: 웹페이지 URL
+            timeout: 요청 타임아웃 (초)
+
+        Returns:
+            str: 본문 텍스트. 실패 시 빈 문자열
+        """
+        try:
+            import requests
+            from bs4 import BeautifulSoup
+
+            response = requests.get(url, timeout=timeout)
+            response.raise_for_status()
+
+            soup = BeautifulSoup(response.text, "html.parser")
+            for tag in soup(["script", "style", "noscript"]):
+                tag.decompose()
+
+            return soup.get_text(separator="\n", strip=True)
+        except Exception as e:
+            print(f"Failed to extract text from {url}: {str(e)}")
+            return ""
+
     @staticmethod
     def capture_screenshot(url: str) -> Optional[io.BytesIO]:
         """
@@ -48,6 +75,8 @@ class WebUtils:
             io.BytesIO: 스크린샷 이미지 데이터 (PNG 형식). 실패 시 None
         """
         try:
+            from playwright.sync_api import sync_playwright
+
             with sync_playwright() as p:
                 # Chromium 브라우저 실행 (headless 모드)
                 browser = p.chromium.launch(headless=True)
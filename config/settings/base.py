@@ -47,6 +47,7 @@ MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "common.db.routing.ReplicaReadMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -84,6 +85,10 @@ DATABASES = {
     }
 }
 
+# 읽기 요청의 조회를 보낼 복제 DB 별칭 (None이면 모두 기본 DB 사용)
+DATABASE_REPLICA_ALIAS = None
+DATABASE_ROUTERS = ["common.db.routing.PrimaryReplicaRouter"]
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -156,10 +161,65 @@ SWAGGER_SETTINGS = {
     # "DEFAULT_AUTO_SCHEMA_CLASS": "common.swagger.inspectors.WrappedResponseAutoSchema",
 }
 
+# CACHE
+# 기본은 프로세스 로컬 메모리 캐시 (CACHE_BACKEND/CACHE_LOCATION으로 공유 캐시 지정 가능)
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", "talktor"),
+    }
+}
+
 # Media files (User uploaded files)
 MEDIA_URL = os.getenv("FILE_SERVER_URL")
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+## QUIZ
+# 퀴즈 생성 결과 캐시 (LRU, 개수/용량 기준 제거)
+QUIZ_GENERATION_CACHE_MAX_ENTRIES = int(
+    os.getenv("QUIZ_GENERATION_CACHE_MAX_ENTRIES", 1000)
+)
+QUIZ_GENERATION_CACHE_MAX_BYTES = int(
+    os.getenv("QUIZ_GENERATION_CACHE_MAX_BYTES", 50 * 1024 * 1024)
+)
+# 같은 퀴즈 생성 요청을 하나로 합치는 시간 범위 (초)
+QUIZ_REQUEST_COALESCE_WINDOW_SECONDS = int(
+    os.getenv("QUIZ_REQUEST_COALESCE_WINDOW_SECONDS", 30)
+)
+# 서술형 답안 채점 (조사/띄어쓰기를 무시한 비교 키의 글자 bigram 유사도 기준)
+## 이 값 이상이면 정답
+QUIZ_GRADING_ACCEPT_SIMILARITY = float(
+    os.getenv("QUIZ_GRADING_ACCEPT_SIMILARITY", 0.85)
+)
+## 이 값 미만이면 오답 (사이 값은 LLM으로 일괄 채점)
+QUIZ_GRADING_REJECT_SIMILARITY = float(os.getenv("QUIZ_GRADING_REJECT_SIMILARITY", 0.4))
+## 애매한 답안 LLM 채점 사용 여부 (false면 두 기준의 중간값으로 판단)
+QUIZ_GRADING_USE_LLM = os.getenv("QUIZ_GRADING_USE_LLM", "true").lower() == "true"
+# 완료된 퀴즈 상세 응답 캐시 유지 시간 (초, 버전 키로 무효화되므로 길게 유지)
+QUIZ_PAYLOAD_CACHE_TIMEOUT_SECONDS = int(
+    os.getenv("QUIZ_PAYLOAD_CACHE_TIMEOUT_SECONDS", 24 * 60 * 60)
+)
+
+## AUTH
+# JWT 인증 사용자 스냅샷 캐시 유지 시간 (초, 0이면 요청마다 DB 조회)
+AUTH_USER_CACHE_TIMEOUT_SECONDS = int(os.getenv("AUTH_USER_CACHE_TIMEOUT_SECONDS", 30))
+# 프로세스별 최대 스냅샷 수 (LRU)
+AUTH_USER_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_USER_CACHE_MAX_ENTRIES", 10000))
+# 공유 캐시(CACHES["default"])에도 저장할지 여부
+AUTH_USER_CACHE_USE_SHARED = (
+    os.getenv("AUTH_USER_CACHE_USE_SHARED", "false").lower() == "true"
+)
+# 로그인 identifier → user_id 매핑 캐시 유지 시간 (초, 탈퇴 시 무효화)
+AUTH_IDENTIFIER_CACHE_TIMEOUT_SECONDS = int(
+    os.getenv("AUTH_IDENTIFIER_CACHE_TIMEOUT_SECONDS", 24 * 60 * 60)
+)
+# 검증된 Firebase ID 토큰 결과를 토큰 만료까지 캐시할지 여부
+AUTH_FIREBASE_TOKEN_CACHE_ENABLED = (
+    os.getenv("AUTH_FIREBASE_TOKEN_CACHE_ENABLED", "true").lower() == "true"
+)
+
 from .third_party.firebase_settings import *  # noqa
 from .third_party.jwt_settings import *  # noqa
 from .third_party.aws_settings import *  # noqa
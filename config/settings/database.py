@@ -0,0 +1,53 @@
+import os
+
+# 읽기 전용 복제 DB 별칭 (DB_REPLICA_HOST가 있을 때만 설정)
+REPLICA_DATABASE_ALIAS = "replica"
+
+
+def postgres_database(prefix: str = "DB") -> dict:
+    """
+    환경 변수로 PostgreSQL 연결 설정 생성
+
+    요청마다 새 연결을 맺지 않도록 psycopg 커넥션 풀을 사용하고,
+    풀에서 연결을 꺼낼 때마다 상태를 확인하여 끊어진 연결은 새로 맺습니다.
+
+    Args:
+        prefix: 환경 변수 접두사 (예: "DB_REPLICA" → DB_REPLICA_HOST),
+            값이 없는 항목은 기본 DB(DB_*) 값을 사용
+
+    Returns:
+        dict: settings.DATABASES 항목
+    """
+
+    def env(key: str, default=None):
+        return os.getenv(f"{prefix}_{key}", os.getenv(f"DB_{key}", default))
+
+    return {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": env("NAME"),
+        "USER": env("USER"),
+        "PASSWORD": env("PASSWORD"),
+        "HOST": env("HOST"),
+        "PORT": env("PORT"),
+        # 풀에서 꺼낸 연결 상태 확인 (ConnectionPool.check_connection)
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "pool": {
+                "min_size": int(env("POOL_MIN_SIZE", 2)),
+                "max_size": int(env("POOL_MAX_SIZE", 10)),
+                # 풀이 가득 찼을 때 연결을 기다리는 최대 시간 (초)
+                "timeout": float(env("POOL_TIMEOUT", 10)),
+                # 오래된/유휴 연결 교체 주기 (초)
+                "max_lifetime": float(env("POOL_MAX_LIFETIME", 1800)),
+                "max_idle": float(env("POOL_MAX_IDLE", 300)),
+            },
+        },
+    }
+
+
+def postgres_databases() -> dict:
+    """기본 DB와 (DB_REPLICA_HOST가 있으면) 읽기 전용 복제 DB 설정"""
+    databases = {"default": postgres_database()}
+    if os.getenv("DB_REPLICA_HOST"):
+        databases[REPLICA_DATABASE_ALIAS] = postgres_database("DB_REPLICA")
+    return databases
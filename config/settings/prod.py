@@ -1,16 +1,10 @@
-import os
-
 from config.settings.base import *  # noqa
+from config.settings.database import REPLICA_DATABASE_ALIAS, postgres_databases
 
 DEBUG = False
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": os.getenv("DB_NAME"),
-        "USER": os.getenv("DB_USER"),
-        "PASSWORD": os.getenv("DB_PASSWORD"),
-        "HOST": os.getenv("DB_HOST"),
-        "PORT": os.getenv("DB_PORT"),
-    }
-}
+DATABASES = postgres_databases()
+# 복제 DB가 있으면 GET 등 읽기 요청의 조회를 복제 DB로 보냄 (common.db.routing)
+DATABASE_REPLICA_ALIAS = (
+    REPLICA_DATABASE_ALIAS if REPLICA_DATABASE_ALIAS in DATABASES else None
+)
@@ -1,9 +1,5 @@
 import os
 
-import firebase_admin
-from firebase_admin import credentials
-
-# Firebase Admin SDK 초기화
-print(os.getenv("FIREBASE_CREDENTIAL_DIR"))
-FIREBASE_CRED = credentials.Certificate(os.getenv("FIREBASE_CREDENTIAL_DIR"))
-firebase_admin.initialize_app(FIREBASE_CRED)
+# Firebase 서비스 계정 파일 경로
+# Admin SDK는 import/초기화 비용이 커서 처음 사용할 때 초기화 (common.utils.firebase_utils)
+FIREBASE_CREDENTIAL_DIR = os.getenv("FIREBASE_CREDENTIAL_DIR")
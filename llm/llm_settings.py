@@ -0,0 +1,80 @@
+from pathlib import Path
+
+LLM_BASE_DIR = Path(__file__).resolve().parent
+PROMPT_DIR = LLM_BASE_DIR / "prompts"
+
+# 퀴즈 생성 모델 (기본 모델, 라우팅 설정이 없을 때 사용)
+QUIZ_GENERATION_MODEL = "openai:gpt-5-mini"
+QUIZ_GENERATION_TEMPERATURE = 0
+
+# 모델 라우팅
+## 작은 모델부터 큰 모델 순서
+QUIZ_MODEL_TIERS = ["openai:gpt-5-nano", "openai:gpt-5-mini", "openai:gpt-5"]
+## 난이도별 기본 모델
+QUIZ_MODEL_ROUTES = {
+    "easy": "openai:gpt-5-nano",
+    "medium": "openai:gpt-5-mini",
+    "hard": "openai:gpt-5",
+}
+## 문제 수 또는 컨텍스트 토큰 수가 기준 이상이면 한 단계 큰 모델 사용
+QUIZ_MODEL_UPGRADE_QUESTION_COUNT = 30
+QUIZ_MODEL_UPGRADE_CONTEXT_TOKENS = 40000
+## 지연/오류 시 대체 모델
+QUIZ_MODEL_FALLBACKS = {
+    "openai:gpt-5": "openai:gpt-5-mini",
+    "openai:gpt-5-mini": "openai:gpt-5-nano",
+    "openai:gpt-5-nano": "openai:gpt-5-mini",
+}
+## 첫 토큰 응답 지연 SLO (초) - 넘으면 대체 모델로 재시도
+QUIZ_FIRST_TOKEN_SLO_SECONDS = 20
+## 청크 호출 전체 지연 SLO (초) - 넘으면 전달한 문제가 없을 때는 대체 모델로 재시도,
+## 이미 전달한 문제가 있으면 스트림을 끊고 그때까지의 문제만 사용
+QUIZ_TOTAL_LATENCY_SLO_SECONDS = 90
+## 모델별 100만 토큰당 가격 (USD, 입력/출력) - 비용 통계용
+LLM_MODEL_PRICES = {
+    "openai:gpt-5": {"input": 1.25, "output": 10.0},
+    "openai:gpt-5-mini": {"input": 0.25, "output": 2.0},
+    "openai:gpt-5-nano": {"input": 0.05, "output": 0.4},
+}
+
+# 퀴즈 생성 시스템 프롬프트 (지침 + 출력 형식, 자료/요청 파라미터는 QuizPromptBuilder가 뒤에 붙임)
+QUIZ_GENERATION_SYSTEM_PROMPT_PATH = PROMPT_DIR / "create_quizzes.system.prompt.txt"
+
+# 청크 분할 및 병렬 호출 설정
+## 청크 하나에 담을 최대 글자 수
+QUIZ_CHUNK_MAX_CHARS = 12000
+## 동시에 실행할 청크 LLM 호출 수
+QUIZ_CHUNK_MAX_CONCURRENCY = 8
+
+# 자료별 사전 생성 문제 풀 (선택 사항)
+## 난이도/문제 유형별 미사용 문제 목표 개수 (0이면 사용 안 함)
+## 자료를 등록할 때마다 (목표 개수 x 난이도 3 x 문제 유형 2)개를 LLM으로 생성하므로,
+## 퀴즈를 만들지 않는 자료에도 비용이 들어 기본값은 꺼 둠 (켤 때는 2~3개 권장)
+QUIZ_POOL_SIZE_PER_DIFFICULTY = 0
+## 문제 풀 채우기 작업의 LLM 동시 호출 수 (사용자 요청보다 낮은 우선순위)
+QUIZ_POOL_MAX_CONCURRENCY = 2
+
+# 컨텍스트 토큰 예산 (퀴즈 하나에 사용할 자료 입력 토큰 상한)
+QUIZ_CONTEXT_TOKEN_BUDGET = 60000
+
+# LLM 호출 제어 (프로세스 전체, 모델별)
+## 모델별 분당 요청 수 / 분당 토큰 수 한도
+LLM_RATE_LIMITS = {
+    "openai:gpt-5": {"requests_per_minute": 500, "tokens_per_minute": 500000},
+    "openai:gpt-5-mini": {"requests_per_minute": 500, "tokens_per_minute": 500000},
+    "openai:gpt-5-nano": {"requests_per_minute": 500, "tokens_per_minute": 500000},
+}
+## LLM_RATE_LIMITS에 없는 모델의 기본 한도
+LLM_DEFAULT_RATE_LIMIT = {"requests_per_minute": 60, "tokens_per_minute": 100000}
+## 동시에 진행 중인 LLM 호출 수 상한 (모델별)
+LLM_MAX_IN_FLIGHT = 16
+## 호출 슬롯 대기 최대 시간 (초)
+LLM_QUEUE_TIMEOUT_SECONDS = 120
+## 문제 하나당 예상 출력 토큰 수 (TPM 사전 차감용)
+LLM_OUTPUT_TOKENS_PER_QUESTION = 300
+
+# 서술형 답안 채점 (유사도만으로 판단하기 애매한 답안을 한 번의 호출로 일괄 채점)
+ANSWER_GRADING_MODEL = "openai:gpt-5-nano"
+ANSWER_GRADING_SYSTEM_PROMPT_PATH = PROMPT_DIR / "grade_answers.system.prompt.txt"
+## 답안 하나당 예상 출력 토큰 수 (TPM 사전 차감용)
+LLM_OUTPUT_TOKENS_PER_ANSWER = 10
@@ -0,0 +1,138 @@
+import asyncio
+import json
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional
+
+from llm.llm_settings import (
+    ANSWER_GRADING_MODEL,
+    ANSWER_GRADING_SYSTEM_PROMPT_PATH,
+    LLM_OUTPUT_TOKENS_PER_ANSWER,
+)
+from llm.services.llm_core import LLMCore
+from llm.services.llm_governor import LLMGovernor, estimate_tokens
+from llm.services.prompt_builder import load_prompt_template
+from llm.services.quiz_generator import message_text
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from langchain_core.messages import BaseMessage
+
+
+@dataclass
+class GradingItem:
+    """LLM 채점 대상 답안"""
+
+    question: str
+    expected: str
+    answer: str
+
+
+class AnswerGrader:
+    """
+    LLM 기반 서술형 답안 일괄 채점기
+
+    여러 답안을 한 번의 호출로 채점합니다. 시스템 지침은 항상 같으므로
+    provider 프롬프트 캐시가 재사용되고, 답안 목록만 사용자 메시지로 전달됩니다.
+    """
+
+    def __init__(
+        self,
+        model: Optional["BaseChatModel"] = None,
+        governor: Optional[LLMGovernor] = None,
+        system_prompt: Optional[str] = None,
+    ):
+        """
+        Args:
+            model: 채팅 모델 (None이면 ANSWER_GRADING_MODEL, 테스트에서는 fake 모델 주입)
+            governor: 호출 제어기 (None이면 모델별 공유 governor, fake 모델 주입 시 사용 안 함)
+            system_prompt: 채점 지침 (None이면 ANSWER_GRADING_SYSTEM_PROMPT_PATH 파일 사용)
+        """
+        self.model = model
+        self.governor = governor
+        self.system_prompt = system_prompt or load_prompt_template(
+            ANSWER_GRADING_SYSTEM_PROMPT_PATH
+        )
+
+    def build_messages(self, items: List[GradingItem]) -> List["BaseMessage"]:
+        """LLM 입력 메시지 조립"""
+        answers = [
+            {
+                "id": index,
+                "question": item.question,
+                "expected": item.expected,
+                "answer": item.answer,
+            }
+            for index, item in enumerate(items, start=1)
+        ]
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        return [
+            SystemMessage(content=self.system_prompt),
+            HumanMessage(
+                content="## ANSWERS\n" + json.dumps(answers, ensure_ascii=False)
+            ),
+        ]
+
+    def grade(self, items: List[GradingItem]) -> List[bool]:
+        """
+        답안 일괄 채점 (동기 호출용)
+
+        Args:
+            items: 채점 대상 답안 목록
+
+        Returns:
+            List[bool]: 입력 순서대로 정답 여부
+
+        Raises:
+            ValueError: LLM 출력 형식이 올바르지 않음
+        """
+        if not items:
+            return []
+        return asyncio.run(self.agrade(items))
+
+    async def agrade(self, items: List[GradingItem]) -> List[bool]:
+        """답안 일괄 채점 (비동기)"""
+        messages = self.build_messages(items)
+        async with self._limit(messages, len(items)):
+            response = await self._get_model().ainvoke(messages)
+        return self.parse(message_text(response), len(items))
+
+    @staticmethod
+    def parse(text: str, count: int) -> List[bool]:
+        """
+        LLM 출력에서 정답 여부 목록 추출
+
+        Raises:
+            ValueError: JSON 배열이 아니거나 일부 답안의 결과가 없음
+        """
+        start, end = text.find("["), text.rfind("]")
+        if start == -1 or end < start:
+            raise ValueError("채점 결과 JSON 배열을 찾을 수 없습니다.")
+
+        results = {}
+        for result in json.loads(text[start : end + 1]):
+            if isinstance(result, dict) and isinstance(result.get("isCorrect"), bool):
+                results[result.get("id")] = result["isCorrect"]
+
+        if any(index not in results for index in range(1, count + 1)):
+            raise ValueError("일부 답안의 채점 결과가 없습니다.")
+        return [results[index] for index in range(1, count + 1)]
+
+    def _get_model(self) -> "BaseChatModel":
+        if self.model is not None:
+            return self.model
+        return LLMCore().get_model(ANSWER_GRADING_MODEL)
+
+    def _limit(self, messages: List["BaseMessage"], answer_count: int):
+        """governor가 있으면 예상 토큰으로 호출 슬롯을 얻는 컨텍스트 매니저 반환"""
+        governor = self.governor
+        if governor is None and self.model is None:
+            governor = LLMCore.get_governor(ANSWER_GRADING_MODEL)
+        if governor is None:
+            return nullcontext()
+        estimated = (
+            sum(estimate_tokens(message.content) for message in messages)
+            + answer_count * LLM_OUTPUT_TOKENS_PER_ANSWER
+        )
+        return governor.limit(estimated)
@@ -0,0 +1,116 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, List
+
+from llm.llm_settings import QUIZ_CONTEXT_TOKEN_BUDGET
+from llm.services.llm_governor import estimate_tokens
+from llm.services.quiz_generator import MaterialPage
+
+# 관련도 점수 계산용 단어 패턴 (한글/영문/숫자 2글자 이상)
+TERM_PATTERN = re.compile(r"[0-9A-Za-z가-힣]{2,}")
+
+
+class ContextPacker:
+    """
+    토큰 예산 기반 퀴즈 컨텍스트 선택기
+
+    전체 페이지가 예산을 넘으면 문서를 연속 구간(stratum)으로 나누어 구간마다
+    관련도가 가장 높은 페이지를 먼저 고르고 (전체 범위 커버), 남은 예산은 관련도 순으로 채웁니다.
+    선택된 페이지는 원래 순서대로 반환됩니다.
+    """
+
+    def __init__(self, token_budget: int = QUIZ_CONTEXT_TOKEN_BUDGET):
+        self.token_budget = token_budget
+
+    def pack(self, pages: List[MaterialPage]) -> List[MaterialPage]:
+        """
+        토큰 예산 안에서 페이지 선택
+
+        Args:
+            pages: 자료 페이지 목록 (문서 순서)
+
+        Returns:
+            List[MaterialPage]: 선택된 페이지 목록 (문서 순서 유지)
+        """
+        tokens = [estimate_tokens(page.text) for page in pages]
+        if sum(tokens) <= self.token_budget:
+            return list(pages)
+
+        scores = self.score_pages(pages, tokens)
+        selected = set()
+        remaining = self.token_budget
+
+        # 1. 구간별 대표 페이지 선택 (문서 전체 범위 커버)
+        average_tokens = sum(tokens) / len(pages)
+        strata_count = max(1, min(len(pages), int(self.token_budget // average_tokens)))
+        for stratum in self._strata(len(pages), strata_count):
+            candidates = [index for index in stratum if tokens[index] <= remaining]
+            if not candidates:
+                continue
+            best = max(candidates, key=lambda index: scores[index])
+            selected.add(best)
+            remaining -= tokens[best]
+
+        # 2. 남은 예산을 관련도 순으로 채움
+        for index in sorted(range(len(pages)), key=lambda i: scores[i], reverse=True):
+            if index not in selected and tokens[index] <= remaining:
+                selected.add(index)
+                remaining -= tokens[index]
+
+        if not selected:
+            # 모든 페이지가 예산보다 크면 가장 관련도 높은 페이지를 예산만큼 자름
+            best = pages[max(range(len(pages)), key=lambda index: scores[index])]
+            return [
+                MaterialPage(
+                    material_id=best.material_id,
+                    page_number=best.page_number,
+                    text=best.text[: self.token_budget],
+                    material_title=best.material_title,
+                )
+            ]
+
+        return [pages[index] for index in sorted(selected)]
+
+    @staticmethod
+    def score_pages(pages: List[MaterialPage], tokens: List[int]) -> List[float]:
+        """
+        페이지 관련도 점수 계산
+
+        다른 페이지에 잘 나오지 않는 단어(IDF가 높은 단어)를 많이 담은 페이지일수록,
+        같은 분량에서 더 많은 개념을 다루는 것으로 보고 높은 점수를 줍니다.
+        목차/표지처럼 내용이 거의 없는 페이지는 낮은 점수를 받습니다.
+        """
+        page_terms = [set(TERM_PATTERN.findall(page.text.lower())) for page in pages]
+        document_frequency = Counter(term for terms in page_terms for term in terms)
+        page_total = len(pages)
+
+        scores = []
+        for terms, token_count in zip(page_terms, tokens):
+            weight = sum(
+                math.log((page_total + 1) / (document_frequency[term] + 0.5))
+                for term in terms
+            )
+            scores.append(weight / math.sqrt(token_count + 1))
+        return scores
+
+    @staticmethod
+    def _strata(page_count: int, strata_count: int) -> List[range]:
+        """페이지 인덱스를 strata_count개의 연속 구간으로 분할"""
+        bounds = [
+            round(page_count * index / strata_count)
+            for index in range(strata_count + 1)
+        ]
+        return [
+            range(start, end) for start, end in zip(bounds, bounds[1:]) if end > start
+        ]
+
+    @staticmethod
+    def used_pages(pages: List[MaterialPage]) -> Dict[str, List[int]]:
+        """선택된 페이지를 {material_id: [페이지 번호, ...]} 형태로 변환"""
+        used: Dict[str, List[int]] = {}
+        for page in pages:
+            numbers = used.setdefault(page.material_id, [])
+            if page.page_number not in numbers:
+                numbers.append(page.page_number)
+        return used
@@ -0,0 +1,83 @@
+import json
+from typing import List
+
+
+class JSONArrayStreamParser:
+    """
+    스트리밍 JSON 배열 파서
+
+    LLM 출력 토큰을 조각 단위로 받아, 최상위 배열의 객체 원소가 닫히는 즉시 파싱하여 반환합니다.
+    배열 시작('[') 이전의 텍스트(코드 펜스, 서문 등)는 무시합니다.
+
+    Example:
+        parser = JSONArrayStreamParser()
+        for token in stream:
+            for item in parser.feed(token):
+                ...
+    """
+
+    def __init__(self):
+        self.started = False
+        self.finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._buffer: List[str] = []
+
+    def feed(self, text: str) -> List[dict]:
+        """
+        텍스트 조각 입력
+
+        Args:
+            text: LLM 출력 조각
+
+        Returns:
+            List[dict]: 이번 조각에서 완성된 최상위 객체 목록
+        """
+        completed = []
+
+        for char in text:
+            if self.finished:
+                break
+
+            if not self.started:
+                if char == "[":
+                    self.started = True
+                    self._depth = 1
+                continue
+
+            # 최상위 객체 내부 문자 수집
+            if self._depth >= 2:
+                self._buffer.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if self._depth == 1:
+                    # 최상위 원소 시작
+                    self._buffer = [char]
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1:
+                    try:
+                        item = json.loads("".join(self._buffer))
+                    except json.JSONDecodeError:
+                        # 깨진 원소는 건너뛰고 다음 원소를 계속 파싱
+                        item = None
+                    self._buffer = []
+                    if isinstance(item, dict):
+                        completed.append(item)
+                elif self._depth == 0:
+                    self.finished = True
+
+        return completed
@@ -1,14 +1,49 @@
-from langchain.chat_models import init_chat_model
+import threading
+from typing import TYPE_CHECKING, Dict
+
+from llm.llm_settings import QUIZ_GENERATION_MODEL, QUIZ_GENERATION_TEMPERATURE
+from llm.services.llm_governor import LLMGovernor
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
 
 
 class LLMCore:
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls):
+        # 여러 생성 스레드가 동시에 처음 접근해도 모델은 한 번만 초기화
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialize()
+                    cls._instance = instance
         return cls._instance
 
-    def __init__(self):
-        if not hasattr(self, "model"):
-            self.model = init_chat_model("openai:gpt-5-mini", temperature=0)
+    def _initialize(self):
+        self._models: Dict[str, "BaseChatModel"] = {}
+        self._models_lock = threading.Lock()
+        self.model_name = QUIZ_GENERATION_MODEL
+        self.model = self.get_model(QUIZ_GENERATION_MODEL)
+        self.governor = self.get_governor(QUIZ_GENERATION_MODEL)
+
+    def get_model(self, model_name: str) -> "BaseChatModel":
+        """모델 이름별로 한 번만 생성하여 재사용"""
+        with self._models_lock:
+            if model_name not in self._models:
+                from langchain.chat_models import init_chat_model
+
+                # stream_usage: 스트리밍 응답에도 토큰 사용량(프롬프트 캐시 적중 포함)을 받음
+                self._models[model_name] = init_chat_model(
+                    model_name,
+                    temperature=QUIZ_GENERATION_TEMPERATURE,
+                    stream_usage=True,
+                )
+            return self._models[model_name]
+
+    @staticmethod
+    def get_governor(model_name: str) -> LLMGovernor:
+        """모델별 호출 제어기"""
+        return LLMGovernor.for_model(model_name)
@@ -0,0 +1,254 @@
+import asyncio
+import math
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+
+from llm.llm_settings import (
+    LLM_DEFAULT_RATE_LIMIT,
+    LLM_MAX_IN_FLIGHT,
+    LLM_QUEUE_TIMEOUT_SECONDS,
+    LLM_RATE_LIMITS,
+)
+
+# 슬롯 대기 시 재확인 간격 (초)
+POLL_INTERVAL_SECONDS = 0.05
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트 토큰 수 추정
+
+    영문/숫자 등 ASCII는 약 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 1토큰으로 계산합니다.
+    """
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    ascii_count = len(text) - non_ascii
+    return non_ascii + math.ceil(ascii_count / 4)
+
+
+class LLMRateLimitTimeout(TimeoutError):
+    """대기 시간 안에 LLM 호출 슬롯을 얻지 못함"""
+
+
+class TokenBucket:
+    """
+    토큰 버킷
+
+    분당 한도(capacity)만큼 채워져 있고, 시간에 비례해 다시 채워집니다.
+    호출 시점의 clock 값으로 채우므로 가짜 시계로 테스트할 수 있습니다.
+    """
+
+    def __init__(self, per_minute: int, clock: Callable[[], float]):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.tokens = float(per_minute)
+        self.clock = clock
+        self.updated_at = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount만큼 꺼내려면 기다려야 하는 시간 (초, 0이면 즉시 가능)"""
+        self._refill()
+        # 한도보다 큰 요청은 버킷이 가득 찼을 때 통과시킴 (영원히 막히지 않도록)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        """토큰 차감 (음수면 반환, 사용량 정산용)"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+@dataclass
+class LLMPermit:
+    """LLM 호출 허가 (호출 후 실제 사용 토큰을 기록하면 버킷에 정산됨)"""
+
+    estimated_tokens: int
+    used_tokens: Optional[int] = None
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+
+    def record_usage(self, usage: dict) -> None:
+        """
+        응답의 usage_metadata 기록
+
+        input_token_details.cache_read는 provider 프롬프트 캐시에서 읽은 입력 토큰 수입니다.
+        """
+        self.used_tokens = usage.get("total_tokens", self.used_tokens)
+        self.input_tokens = usage.get("input_tokens", 0)
+        self.cached_input_tokens = (usage.get("input_token_details") or {}).get(
+            "cache_read", 0
+        ) or 0
+
+
+class LLMGovernor:
+    """
+    모델별 LLM 호출 제어기
+
+    분당 요청 수(RPM)와 분당 토큰 수(TPM) 토큰 버킷, 동시 호출 수 상한으로
+    프로세스 전체의 호출량을 제한합니다. 한도를 넘으면 호출자는 대기하며,
+    timeout 안에 슬롯을 얻지 못하면 LLMRateLimitTimeout이 발생합니다.
+    여러 스레드의 이벤트 루프에서 함께 사용하므로 상태는 threading.Lock으로 보호합니다.
+
+    Example:
+        async with LLMGovernor.for_model(model_name).limit(estimated_tokens) as permit:
+            response = await model.ainvoke(prompt)
+            permit.used_tokens = response.usage_metadata["total_tokens"]
+    """
+
+    _registry: Dict[str, "LLMGovernor"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_in_flight: int = LLM_MAX_IN_FLIGHT,
+        timeout: float = LLM_QUEUE_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.clock = clock
+        self.sleep = sleep
+        self.requests = TokenBucket(requests_per_minute, clock)
+        self.tokens = TokenBucket(tokens_per_minute, clock)
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._metrics = {
+            "requests": 0,
+            "tokens": 0,
+            "input_tokens": 0,
+            "cached_input_tokens": 0,
+            "throttled": 0,
+            "wait_seconds": 0.0,
+            "timeouts": 0,
+            "max_in_flight": 0,
+        }
+
+    @classmethod
+    def for_model(cls, model_name: str) -> "LLMGovernor":
+        """모델별 공유 인스턴스 반환 (한도는 LLM_RATE_LIMITS 설정)"""
+        with cls._registry_lock:
+            if model_name not in cls._registry:
+                limits = LLM_RATE_LIMITS.get(model_name, LLM_DEFAULT_RATE_LIMIT)
+                cls._registry[model_name] = cls(**limits)
+            return cls._registry[model_name]
+
+    @classmethod
+    def get_all_metrics(cls) -> Dict[str, dict]:
+        """모든 모델의 카운터 반환 {model_name: metrics}"""
+        with cls._registry_lock:
+            governors = dict(cls._registry)
+        return {name: governor.get_metrics() for name, governor in governors.items()}
+
+    def _try_acquire(self, estimated_tokens: int) -> float:
+        """슬롯 획득 시도. 성공하면 0, 실패하면 다시 시도할 때까지의 대기 시간 반환"""
+        with self._lock:
+            if self.in_flight >= self.max_in_flight:
+                return POLL_INTERVAL_SECONDS
+
+            wait = max(
+                self.requests.wait_time(1), self.tokens.wait_time(estimated_tokens)
+            )
+            if wait > 0:
+                return wait
+
+            self.requests.consume(1)
+            self.tokens.consume(estimated_tokens)
+            self.in_flight += 1
+            self._metrics["requests"] += 1
+            self._metrics["max_in_flight"] = max(
+                self._metrics["max_in_flight"], self.in_flight
+            )
+            return 0.0
+
+    async def acquire(self, estimated_tokens: int) -> LLMPermit:
+        """
+        호출 슬롯 획득 (한도 초과 시 대기)
+
+        Args:
+            estimated_tokens: 예상 사용 토큰 수 (입력 + 출력)
+
+        Returns:
+            LLMPermit: 호출 허가
+
+        Raises:
+            LLMRateLimitTimeout: timeout 안에 슬롯을 얻지 못함
+        """
+        started = self.clock()
+        deadline = started + self.timeout
+        throttled = False
+
+        while True:
+            wait = self._try_acquire(estimated_tokens)
+            if wait == 0:
+                break
+
+            throttled = True
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                with self._lock:
+                    self._metrics["timeouts"] += 1
+                raise LLMRateLimitTimeout(f"LLM 호출 대기 시간 초과 ({self.timeout}초)")
+            await self.sleep(min(wait, remaining))
+
+        if throttled:
+            with self._lock:
+                self._metrics["throttled"] += 1
+                self._metrics["wait_seconds"] += self.clock() - started
+
+        return LLMPermit(estimated_tokens=estimated_tokens)
+
+    def release(self, permit: LLMPermit) -> None:
+        """
+        호출 슬롯 반환
+
+        실제 사용 토큰이 기록되어 있으면 예상치와의 차이를 TPM 버킷에 정산합니다.
+        """
+        used = (
+            permit.estimated_tokens
+            if permit.used_tokens is None
+            else permit.used_tokens
+        )
+        with self._lock:
+            self.in_flight -= 1
+            self.tokens.consume(used - permit.estimated_tokens)
+            self._metrics["tokens"] += used
+            self._metrics["input_tokens"] += permit.input_tokens
+            self._metrics["cached_input_tokens"] += permit.cached_input_tokens
+
+    @asynccontextmanager
+    async def limit(self, estimated_tokens: int):
+        """acquire/release를 묶은 async 컨텍스트 매니저"""
+        permit = await self.acquire(estimated_tokens)
+        try:
+            yield permit
+        finally:
+            self.release(permit)
+
+    def get_metrics(self) -> dict:
+        """카운터 조회 (prompt_cache_hit_rate: 입력 토큰 중 프롬프트 캐시 적중 비율)"""
+        with self._lock:
+            input_tokens = self._metrics["input_tokens"]
+            hit_rate = (
+                self._metrics["cached_input_tokens"] / input_tokens
+                if input_tokens
+                else 0.0
+            )
+            return {
+                **self._metrics,
+                "in_flight": self.in_flight,
+                "prompt_cache_hit_rate": round(hit_rate, 4),
+            }
@@ -0,0 +1,206 @@
+import hashlib
+import json
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from llm.llm_settings import (
+    LLM_MODEL_PRICES,
+    QUIZ_MODEL_FALLBACKS,
+    QUIZ_MODEL_ROUTES,
+    QUIZ_MODEL_TIERS,
+    QUIZ_MODEL_UPGRADE_CONTEXT_TOKENS,
+    QUIZ_MODEL_UPGRADE_QUESTION_COUNT,
+)
+from llm.services.llm_core import LLMCore
+from llm.services.llm_governor import LLMGovernor
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+
+class ModelRouter:
+    """
+    퀴즈 생성 모델 라우터
+
+    난이도로 기본 모델을 고르고 (쉬움은 작고 빠른 모델, 어려움은 큰 모델),
+    문제 수나 컨텍스트가 크면 한 단계 큰 모델로 올립니다.
+    호출이 지연 SLO를 넘기거나 실패하면 사용할 대체 모델을 알려주고,
+    모델별 지연 시간/비용 통계를 모아 라우팅 설정을 조정할 수 있게 합니다.
+    """
+
+    _stats: Dict[str, dict] = {}
+    _stats_lock = threading.Lock()
+
+    def __init__(
+        self,
+        routes: Optional[Dict[str, str]] = None,
+        tiers: Optional[List[str]] = None,
+        fallbacks: Optional[Dict[str, str]] = None,
+        models: Optional[Dict[str, "BaseChatModel"]] = None,
+        upgrade_question_count: int = QUIZ_MODEL_UPGRADE_QUESTION_COUNT,
+        upgrade_context_tokens: int = QUIZ_MODEL_UPGRADE_CONTEXT_TOKENS,
+    ):
+        """
+        Args:
+            routes: 난이도별 기본 모델 {difficulty: model_name}
+            tiers: 작은 모델부터 큰 모델 순서의 목록
+            fallbacks: 대체 모델 {model_name: fallback_model_name}
+            models: 모델 이름별 모델 객체 (None이면 LLMCore에서 생성, 테스트에서는 fake 모델 주입)
+            upgrade_question_count: 한 단계 큰 모델을 쓰는 문제 수 기준
+            upgrade_context_tokens: 한 단계 큰 모델을 쓰는 컨텍스트 토큰 수 기준
+        """
+        self.routes = routes if routes is not None else QUIZ_MODEL_ROUTES
+        self.tiers = tiers if tiers is not None else QUIZ_MODEL_TIERS
+        self.fallbacks = fallbacks if fallbacks is not None else QUIZ_MODEL_FALLBACKS
+        self.models = models
+        self.upgrade_question_count = upgrade_question_count
+        self.upgrade_context_tokens = upgrade_context_tokens
+
+    @property
+    def signature(self) -> str:
+        """라우팅 설정 식별자 (설정이 바뀌면 생성 결과 캐시 키도 바뀌도록 사용)"""
+        payload = json.dumps(
+            {
+                "routes": self.routes,
+                "tiers": self.tiers,
+                "upgrade": [self.upgrade_question_count, self.upgrade_context_tokens],
+            },
+            sort_keys=True,
+        )
+        return "router:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def route(self, difficulty: str, question_count: int, context_tokens: int) -> str:
+        """
+        요청에 맞는 모델 선택
+
+        Args:
+            difficulty: 난이도
+            question_count: 문제 수
+            context_tokens: 컨텍스트 토큰 수
+
+        Returns:
+            str: 모델 이름
+        """
+        model_name = self.routes.get(difficulty, self.routes.get("medium"))
+
+        if model_name in self.tiers and (
+            question_count >= self.upgrade_question_count
+            or context_tokens >= self.upgrade_context_tokens
+        ):
+            index = min(self.tiers.index(model_name) + 1, len(self.tiers) - 1)
+            model_name = self.tiers[index]
+
+        return model_name
+
+    def candidates(self, model_name: str) -> List[str]:
+        """시도할 모델 순서 [선택된 모델, 대체 모델]"""
+        fallback = self.fallbacks.get(model_name)
+        if fallback and fallback != model_name:
+            return [model_name, fallback]
+        return [model_name]
+
+    def get_model(self, model_name: str) -> "BaseChatModel":
+        """모델 이름으로 모델 객체 조회"""
+        if self.models is not None:
+            return self.models[model_name]
+        return LLMCore().get_model(model_name)
+
+    def get_governor(self, model_name: str) -> Optional[LLMGovernor]:
+        """모델별 호출 제어기 (fake 모델 주입 시 None)"""
+        if self.models is not None:
+            return None
+        return LLMCore.get_governor(model_name)
+
+    @classmethod
+    def record(
+        cls,
+        model_name: str,
+        latency: float,
+        first_token_latency: Optional[float] = None,
+        usage: Optional[dict] = None,
+        error: bool = False,
+    ) -> None:
+        """
+        모델 호출 결과 기록
+
+        Args:
+            model_name: 모델 이름
+            latency: 전체 소요 시간 (초)
+            first_token_latency: 첫 토큰까지 걸린 시간 (초)
+            usage: 응답 usage_metadata
+            error: 오류 또는 SLO 초과로 실패했는지 여부
+        """
+        usage = usage or {}
+        input_tokens = usage.get("input_tokens", 0)
+        output_tokens = usage.get("output_tokens", 0)
+        price = LLM_MODEL_PRICES.get(model_name, {})
+        cost = (
+            input_tokens * price.get("input", 0)
+            + output_tokens * price.get("output", 0)
+        ) / 1_000_000
+
+        with cls._stats_lock:
+            stats = cls._get_entry(model_name)
+            stats["calls"] += 1
+            stats["errors"] += int(error)
+            stats["latency_total"] += latency
+            stats["latency_max"] = max(stats["latency_max"], latency)
+            if first_token_latency is not None:
+                stats["first_token_latency_total"] += first_token_latency
+                stats["first_token_count"] += 1
+            stats["input_tokens"] += input_tokens
+            stats["output_tokens"] += output_tokens
+            stats["cost_usd"] += cost
+
+    @classmethod
+    def record_fallback(cls, model_name: str) -> None:
+        """
+        실패한 호출 뒤 대체 모델로 넘어갔음을 기록
+
+        실패한 호출 자체는 record()로 이미 기록되므로 호출 수/지연 시간은 건드리지 않습니다.
+
+        Args:
+            model_name: 실패한 모델 이름
+        """
+        with cls._stats_lock:
+            cls._get_entry(model_name)["fallbacks"] += 1
+
+    @classmethod
+    def _get_entry(cls, model_name: str) -> dict:
+        """모델 통계 항목 조회 (없으면 생성, _stats_lock 안에서 호출)"""
+        return cls._stats.setdefault(
+            model_name,
+            {
+                "calls": 0,
+                "errors": 0,
+                "fallbacks": 0,
+                "latency_total": 0.0,
+                "latency_max": 0.0,
+                "first_token_latency_total": 0.0,
+                "first_token_count": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "cost_usd": 0.0,
+            },
+        )
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, dict]:
+        """모델별 통계 조회 (평균 지연 시간 포함)"""
+        with cls._stats_lock:
+            result = {}
+            for model_name, stats in cls._stats.items():
+                result[model_name] = {
+                    **stats,
+                    "latency_avg": (
+                        stats["latency_total"] / stats["calls"]
+                        if stats["calls"]
+                        else None
+                    ),
+                    "first_token_latency_avg": (
+                        stats["first_token_latency_total"] / stats["first_token_count"]
+                        if stats["first_token_count"]
+                        else None
+                    ),
+                }
+            return result
@@ -0,0 +1,91 @@
+from itertools import groupby
+from typing import TYPE_CHECKING, List, Optional
+
+from llm.llm_settings import QUIZ_GENERATION_SYSTEM_PROMPT_PATH
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+
+    from llm.services.quiz_generator import MaterialPage
+
+
+def load_prompt_template(path=QUIZ_GENERATION_SYSTEM_PROMPT_PATH) -> str:
+    """퀴즈 생성 프롬프트 로드"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class QuizPromptBuilder:
+    """
+    프롬프트 캐시 친화적인 퀴즈 생성 프롬프트 조립기
+
+    provider의 프롬프트 캐시는 앞부분(prefix)이 같은 요청끼리만 재사용되므로,
+    바뀌지 않는 부분부터 순서대로 배치합니다.
+
+    1. 시스템 지침과 JSON 출력 형식 (항상 동일)
+    2. 자료 컨텍스트 (Material ID, 페이지 번호 순으로 정렬하여 같은 자료면 항상 동일)
+    3. 요청 파라미터 (문제 수, 유형, 난이도 - 요청마다 다름)
+    """
+
+    def __init__(self, system_prompt: Optional[str] = None):
+        """
+        Args:
+            system_prompt: 시스템 지침 (None이면 QUIZ_GENERATION_SYSTEM_PROMPT_PATH 파일 사용)
+        """
+        self.system_prompt = system_prompt or load_prompt_template()
+
+    def build(
+        self,
+        pages: List["MaterialPage"],
+        question_count: int,
+        question_type: str,
+        difficulty: str,
+    ) -> List["BaseMessage"]:
+        """
+        LLM 입력 메시지 조립
+
+        Args:
+            pages: 자료 페이지 목록
+            question_count: 생성할 문제 수
+            question_type: 문제 유형
+            difficulty: 난이도
+
+        Returns:
+            List[BaseMessage]: [시스템 메시지, 사용자 메시지(컨텍스트 + 요청)]
+        """
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        return [
+            SystemMessage(content=self.system_prompt),
+            HumanMessage(
+                content=self.render_context(pages)
+                + "\n\n"
+                + self.render_request(question_count, question_type, difficulty)
+            ),
+        ]
+
+    @staticmethod
+    def render_context(pages: List["MaterialPage"]) -> str:
+        """자료별 컨텍스트 블록 생성 (입력 순서와 무관하게 항상 같은 순서)"""
+        ordered = sorted(pages, key=lambda page: (page.material_id, page.page_number))
+        blocks = []
+        for material_id, material_pages in groupby(
+            ordered, key=lambda page: page.material_id
+        ):
+            material_pages = list(material_pages)
+            title = material_pages[0].material_title
+            body = "\n\n".join(page.render() for page in material_pages)
+            blocks.append(
+                f'<material id="{material_id}" title="{title}">\n{body}\n</material>'
+            )
+        return "## CONTEXT\n\n" + "\n\n".join(blocks)
+
+    @staticmethod
+    def render_request(question_count: int, question_type: str, difficulty: str) -> str:
+        """요청 파라미터 블록 생성"""
+        return (
+            "## REQUEST\n"
+            f"- NUM_QUESTIONS: {question_count}\n"
+            f"- QUESTION_TYPE: {question_type}\n"
+            f"- DIFFICULTY: {difficulty}"
+        )
@@ -0,0 +1,497 @@
+import asyncio
+import queue
+import threading
+import time
+from contextlib import nullcontext, suppress
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
+
+from llm.llm_settings import (
+    LLM_OUTPUT_TOKENS_PER_QUESTION,
+    QUIZ_CHUNK_MAX_CHARS,
+    QUIZ_CHUNK_MAX_CONCURRENCY,
+    QUIZ_FIRST_TOKEN_SLO_SECONDS,
+    QUIZ_TOTAL_LATENCY_SLO_SECONDS,
+)
+from llm.services.json_stream import JSONArrayStreamParser
+from llm.services.llm_governor import LLMGovernor, estimate_tokens
+from llm.services.model_router import ModelRouter
+from llm.services.prompt_builder import QuizPromptBuilder
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from langchain_core.messages import BaseMessage
+
+# 기본 문제 유형 / 난이도 (api.quiz.models.QuizQuestionType, QuizDifficulty 값)
+DEFAULT_QUESTION_TYPE = "multiple_choice"
+DEFAULT_DIFFICULTY = "medium"
+
+# 취소 여부 확인 간격 (초)
+CANCEL_POLL_SECONDS = 0.1
+
+
+class GenerationCancelled(Exception):
+    """퀴즈 생성이 취소됨"""
+
+
+def message_text(message) -> str:
+    """AIMessage(또는 chunk)의 content를 문자열로 변환"""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    # content block 리스트 형태 ([{"type": "text", "text": "..."}, ...])
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+    )
+
+
+def validate_question(question: dict) -> bool:
+    """
+    생성된 문제 형식 검증
+
+    객관식은 선지 2개 이상과 정답 정확히 1개, 서술형은 정답 텍스트가 있어야 합니다.
+    """
+    if not isinstance(question.get("question"), str) or not question["question"]:
+        return False
+
+    options = question.get("answerOptions")
+    if options is not None:
+        if not isinstance(options, list) or len(options) < 2:
+            return False
+        if not all(isinstance(option, dict) for option in options):
+            return False
+        return sum(1 for option in options if option.get("isCorrect") is True) == 1
+
+    return bool(question.get("answer"))
+
+
+@dataclass
+class MaterialPage:
+    """퀴즈 생성에 사용할 자료의 한 페이지"""
+
+    material_id: str
+    page_number: int
+    text: str
+    material_title: str = ""
+
+    def render(self) -> str:
+        """프롬프트 CONTEXT의 자료 블록에 들어갈 형태로 변환"""
+        return f"===== p.{self.page_number} =====\n{self.text}"
+
+
+@dataclass
+class QuizChunk:
+    """LLM 호출 한 번에 들어가는 페이지 묶음과 배정된 문제 수"""
+
+    pages: List[MaterialPage] = field(default_factory=list)
+    question_count: int = 0
+
+    @property
+    def size(self) -> int:
+        return sum(len(page.text) for page in self.pages)
+
+
+class QuizGenerator:
+    """
+    LLMCore 기반 퀴즈 생성 엔진
+
+    요청마다 ModelRouter로 모델을 고르고 (난이도, 문제 수, 컨텍스트 크기 기준),
+    자료 페이지를 청크로 나누고 청크별로 문제 수를 배분한 뒤,
+    청크 단위 스트리밍 LLM 호출(astream)을 동시 실행 수 제한 하에 병렬로 실행합니다.
+    각 청크의 출력은 점진 파싱되어 문제가 완성되는 즉시 전달됩니다.
+    """
+
+    def __init__(
+        self,
+        model: Optional["BaseChatModel"] = None,
+        prompt_builder: Optional[QuizPromptBuilder] = None,
+        max_chunk_chars: int = QUIZ_CHUNK_MAX_CHARS,
+        max_concurrency: int = QUIZ_CHUNK_MAX_CONCURRENCY,
+        governor: Optional[LLMGovernor] = None,
+        router: Optional[ModelRouter] = None,
+        first_token_timeout: Optional[float] = QUIZ_FIRST_TOKEN_SLO_SECONDS,
+        total_timeout: Optional[float] = QUIZ_TOTAL_LATENCY_SLO_SECONDS,
+    ):
+        """
+        Args:
+            model: 고정으로 사용할 채팅 모델 (None이면 router로 요청마다 선택, 테스트에서는 fake 모델 주입)
+            prompt_builder: 프롬프트 조립기 (None이면 기본 시스템 프롬프트 사용)
+            max_chunk_chars: 청크 하나의 최대 글자 수
+            max_concurrency: 동시에 실행할 LLM 호출 수
+            governor: 호출 제어기 (None이면 router가 모델별 governor 제공)
+            router: 모델 라우터 (None이면 기본 라우팅 설정 사용)
+            first_token_timeout: 첫 토큰 대기 시간 (초, 넘으면 대체 모델로 재시도)
+            total_timeout: 청크 호출 하나의 전체 시간 제한 (초, 넘으면 대체 모델로 재시도하거나
+                이미 전달한 문제가 있으면 스트림을 끊음)
+        """
+        self.model = model
+        self.governor = governor
+        self.router = router or ModelRouter()
+        self.prompt_builder = prompt_builder or QuizPromptBuilder()
+        self.max_chunk_chars = max_chunk_chars
+        self.max_concurrency = max_concurrency
+        self.first_token_timeout = first_token_timeout
+        self.total_timeout = total_timeout
+
+    def select_model(
+        self, pages: List[MaterialPage], question_count: int, difficulty: str
+    ) -> str:
+        """요청에 사용할 모델 이름 선택 (고정 모델이 있으면 그 모델)"""
+        if self.model is not None:
+            return getattr(self.model, "model_name", None) or type(self.model).__name__
+        context_tokens = sum(estimate_tokens(page.text) for page in pages)
+        return self.router.route(difficulty, question_count, context_tokens)
+
+    def _get_model(self, model_name: str) -> "BaseChatModel":
+        return (
+            self.model if self.model is not None else self.router.get_model(model_name)
+        )
+
+    def _get_governor(self, model_name: str) -> Optional[LLMGovernor]:
+        if self.governor is not None or self.model is not None:
+            return self.governor
+        return self.router.get_governor(model_name)
+
+    def generate(
+        self,
+        pages: List[MaterialPage],
+        question_count: int,
+        question_type: str = DEFAULT_QUESTION_TYPE,
+        difficulty: str = DEFAULT_DIFFICULTY,
+    ) -> List[dict]:
+        """
+        퀴즈 문제 생성 (동기 호출용)
+
+        Args:
+            pages: 자료 페이지 목록
+            question_count: 생성할 전체 문제 수
+            question_type: 문제 유형 (multiple_choice, short_answer, mixed)
+            difficulty: 난이도 (easy, medium, hard)
+
+        Returns:
+            List[dict]: 프롬프트 JSON 형식의 문제 목록 (questionNumber는 완성 순서대로 1부터 부여)
+        """
+        return asyncio.run(
+            self.agenerate(pages, question_count, question_type, difficulty)
+        )
+
+    def iter_questions(
+        self,
+        pages: List[MaterialPage],
+        question_count: int,
+        question_type: str = DEFAULT_QUESTION_TYPE,
+        difficulty: str = DEFAULT_DIFFICULTY,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Iterator[dict]:
+        """
+        퀴즈 문제를 완성되는 즉시 하나씩 반환 (동기 제너레이터)
+
+        이벤트 루프는 별도 스레드에서 실행되며, 호출 스레드는 문제가 완성될 때마다 받아
+        바로 저장할 수 있습니다 (Django ORM을 이벤트 루프 밖에서 사용하기 위함).
+        호출자가 반복을 중단하면 진행 중인 LLM 호출도 취소됩니다.
+
+        Args:
+            pages: 자료 페이지 목록
+            question_count: 생성할 전체 문제 수
+            question_type: 문제 유형
+            difficulty: 난이도
+            cancel_event: 설정되면 진행 중인 LLM 호출을 취소
+
+        Yields:
+            dict: 검증된 문제 (questionNumber 포함)
+
+        Raises:
+            GenerationCancelled: cancel_event로 취소됨
+        """
+        results: queue.Queue = queue.Queue()
+        done = object()
+        stop_event = cancel_event or threading.Event()
+
+        def run():
+            try:
+                asyncio.run(
+                    self.agenerate(
+                        pages,
+                        question_count,
+                        question_type,
+                        difficulty,
+                        on_question=results.put,
+                        cancel_event=stop_event,
+                    )
+                )
+            except Exception as e:
+                results.put(e)
+            finally:
+                results.put(done)
+
+        threading.Thread(target=run, daemon=True).start()
+
+        finished = False
+        try:
+            while True:
+                item = results.get()
+                if item is done:
+                    finished = True
+                    return
+                if isinstance(item, Exception):
+                    finished = True
+                    raise item
+                yield item
+        finally:
+            if not finished:
+                # 호출자가 반복을 중단함 - 남은 LLM 호출 취소
+                stop_event.set()
+
+    async def agenerate(
+        self,
+        pages: List[MaterialPage],
+        question_count: int,
+        question_type: str = DEFAULT_QUESTION_TYPE,
+        difficulty: str = DEFAULT_DIFFICULTY,
+        on_question: Optional[Callable[[dict], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> List[dict]:
+        """
+        퀴즈 문제 생성 (비동기)
+
+        Args:
+            pages: 자료 페이지 목록
+            question_count: 생성할 전체 문제 수
+            question_type: 문제 유형
+            difficulty: 난이도
+            on_question: 문제가 하나 완성될 때마다 호출되는 콜백
+            cancel_event: 설정되면 진행 중인 청크 호출을 모두 취소
+
+        Returns:
+            List[dict]: 생성된 문제 목록 (완성 순서)
+
+        Raises:
+            GenerationCancelled: cancel_event로 취소됨
+        """
+        model_name = self.select_model(pages, question_count, difficulty)
+        chunks = self.allocate_questions(self.split_chunks(pages), question_count)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        questions: List[dict] = []
+
+        def emit(question: dict) -> None:
+            if len(questions) >= question_count:
+                return
+            question["questionNumber"] = len(questions) + 1
+            questions.append(question)
+            if on_question:
+                on_question(question)
+
+        gathered = asyncio.gather(
+            *(
+                self._generate_chunk(
+                    chunk, model_name, question_type, difficulty, semaphore, emit
+                )
+                for chunk in chunks
+                if chunk.question_count > 0
+            )
+        )
+
+        # 청크 호출 사이사이 취소 여부 확인 (다른 스레드에서 설정되므로 polling)
+        while cancel_event is not None and not gathered.done():
+            if cancel_event.is_set():
+                gathered.cancel()
+                with suppress(asyncio.CancelledError):
+                    await gathered
+                raise GenerationCancelled()
+            await asyncio.wait({gathered}, timeout=CANCEL_POLL_SECONDS)
+
+        await gathered
+        return questions
+
+    async def _generate_chunk(
+        self,
+        chunk: QuizChunk,
+        model_name: str,
+        question_type: str,
+        difficulty: str,
+        semaphore: asyncio.Semaphore,
+        emit: Callable[[dict], None],
+    ) -> None:
+        """
+        청크 하나에 대한 스트리밍 LLM 호출
+
+        선택된 모델이 첫 토큰/전체 지연 SLO를 넘기거나 실패하면, 아직 전달한 문제가 없는 경우에
+        한해 대체 모델로 다시 호출합니다 (이미 전달한 문제가 중복되지 않도록).
+        """
+        messages = self.prompt_builder.build(
+            chunk.pages, chunk.question_count, question_type, difficulty
+        )
+        candidates = (
+            [model_name]
+            if self.model is not None
+            else self.router.candidates(model_name)
+        )
+        emitted = []
+
+        def emit_chunk(question: dict) -> None:
+            emitted.append(question)
+            emit(question)
+
+        async with semaphore:
+            for index, candidate in enumerate(candidates):
+                try:
+                    await self._stream_chunk(
+                        candidate, messages, chunk.question_count, emit_chunk
+                    )
+                    return
+                except Exception:
+                    if emitted or index == len(candidates) - 1:
+                        raise
+                    self.router.record_fallback(candidate)
+
+    async def _stream_chunk(
+        self,
+        model_name: str,
+        messages: List["BaseMessage"],
+        question_count: int,
+        emit: Callable[[dict], None],
+    ) -> None:
+        """
+        모델 하나로 스트리밍 호출
+
+        출력 토큰을 JSONArrayStreamParser로 점진 파싱하여, 문제 객체가 닫히는 즉시 검증 후
+        emit으로 전달합니다. 배정된 문제 수를 채우면 스트림을 닫습니다.
+        전체 시간이 total_timeout을 넘으면 (중간에 멈춘 스트림 포함) 스트림을 닫고,
+        이미 전달한 문제가 있으면 그때까지의 문제만 남기고 정상 종료합니다.
+
+        Raises:
+            asyncio.TimeoutError: 첫 토큰이 first_token_timeout 안에 오지 않거나,
+                문제를 하나도 전달하기 전에 total_timeout을 넘음
+        """
+        parser = JSONArrayStreamParser()
+        emitted = 0
+        usage = None
+        first_token_latency = None
+        error = False
+        started = time.monotonic()
+
+        async with self._limit(model_name, messages, question_count) as permit:
+            stream = self._get_model(model_name).astream(messages)
+            try:
+                async with asyncio.timeout(self.total_timeout):
+                    while emitted < question_count and not parser.finished:
+                        if first_token_latency is None and self.first_token_timeout:
+                            next_piece = asyncio.wait_for(
+                                stream.__anext__(), self.first_token_timeout
+                            )
+                        else:
+                            next_piece = stream.__anext__()
+                        try:
+                            piece = await next_piece
+                        except StopAsyncIteration:
+                            break
+                        if first_token_latency is None:
+                            first_token_latency = time.monotonic() - started
+
+                        usage = getattr(piece, "usage_metadata", None) or usage
+                        for question in parser.feed(message_text(piece)):
+                            if not validate_question(question):
+                                continue
+                            emit(question)
+                            emitted += 1
+                            if emitted >= question_count:
+                                break
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                error = True
+                if not emitted:
+                    raise
+                # 대체 모델로 넘어가면 전달한 문제가 중복되므로 그때까지의 문제만 남기고 끊음
+            except BaseException:
+                error = True
+                raise
+            finally:
+                await stream.aclose()
+                if permit is not None and usage:
+                    permit.record_usage(usage)
+                self.router.record(
+                    model_name,
+                    latency=time.monotonic() - started,
+                    first_token_latency=first_token_latency,
+                    usage=usage,
+                    error=error,
+                )
+
+    def _limit(
+        self, model_name: str, messages: List["BaseMessage"], question_count: int
+    ):
+        """governor가 있으면 예상 토큰으로 호출 슬롯을 얻는 컨텍스트 매니저 반환"""
+        governor = self._get_governor(model_name)
+        if governor is None:
+            return nullcontext()
+        estimated = (
+            sum(estimate_tokens(message.content) for message in messages)
+            + question_count * LLM_OUTPUT_TOKENS_PER_QUESTION
+        )
+        return governor.limit(estimated)
+
+    def split_chunks(self, pages: List[MaterialPage]) -> List[QuizChunk]:
+        """
+        페이지 순서를 유지하면서 max_chunk_chars 이하의 청크로 묶습니다.
+        한 페이지가 max_chunk_chars보다 길면 여러 조각으로 나눕니다.
+        """
+        chunks: List[QuizChunk] = []
+        current = QuizChunk()
+
+        for page in pages:
+            for piece in self._split_page(page):
+                if (
+                    current.pages
+                    and current.size + len(piece.text) > self.max_chunk_chars
+                ):
+                    chunks.append(current)
+                    current = QuizChunk()
+                current.pages.append(piece)
+
+        if current.pages:
+            chunks.append(current)
+        return chunks
+
+    def _split_page(self, page: MaterialPage) -> List[MaterialPage]:
+        if len(page.text) <= self.max_chunk_chars:
+            return [page]
+        return [
+            MaterialPage(
+                material_id=page.material_id,
+                page_number=page.page_number,
+                text=page.text[start : start + self.max_chunk_chars],
+                material_title=page.material_title,
+            )
+            for start in range(0, len(page.text), self.max_chunk_chars)
+        ]
+
+    @staticmethod
+    def allocate_questions(
+        chunks: List[QuizChunk], question_count: int
+    ) -> List[QuizChunk]:
+        """
+        청크 분량에 비례하여 문제 수를 배분합니다 (최대 잔여 방식).
+
+        배정 합계는 항상 question_count와 같으며, 문제 수가 청크 수보다 적으면
+        분량이 큰 청크부터 1문제씩 배정됩니다.
+        """
+        total_size = sum(chunk.size for chunk in chunks)
+        if not chunks or total_size == 0:
+            return chunks
+
+        quotas = [question_count * chunk.size / total_size for chunk in chunks]
+        for chunk, quota in zip(chunks, quotas):
+            chunk.question_count = int(quota)
+
+        remaining = question_count - sum(chunk.question_count for chunk in chunks)
+        by_remainder = sorted(
+            range(len(chunks)),
+            key=lambda index: (quotas[index] - int(quotas[index]), chunks[index].size),
+            reverse=True,
+        )
+        for index in by_remainder[:remaining]:
+            chunks[index].question_count += 1
+
+        return chunks
@@ -0,0 +1,37 @@
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from llm.services.answer_grader import AnswerGrader, GradingItem
+
+ITEMS = [
+    GradingItem(question="문제 1", expected="광합성", answer="광합성 작용"),
+    GradingItem(question="문제 2", expected="미토콘드리아", answer="엽록체"),
+]
+
+
+def test_grade_batch_in_one_call():
+    model = FakeListChatModel(
+        responses=[
+            '[{"id": 2, "isCorrect": false}, {"id": 1, "isCorrect": true}]',
+            "두 번째 호출",
+        ]
+    )
+    grader = AnswerGrader(model=model, system_prompt="채점")
+
+    assert grader.grade(ITEMS) == [True, False]
+    assert model.i == 1
+
+
+def test_build_messages_lists_every_answer():
+    messages = AnswerGrader(system_prompt="채점").build_messages(ITEMS)
+
+    assert messages[0].content == "채점"
+    assert '"id": 1' in messages[1].content
+    assert "엽록체" in messages[1].content
+
+
+def test_parse_rejects_missing_results():
+    with pytest.raises(ValueError):
+        AnswerGrader.parse('[{"id": 1, "isCorrect": true}]', 2)
+    with pytest.raises(ValueError):
+        AnswerGrader.parse("채점할 수 없습니다", 1)
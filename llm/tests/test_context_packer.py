@@ -0,0 +1,48 @@
+from llm.services.context_packer import ContextPacker, estimate_tokens
+from llm.services.quiz_generator import MaterialPage
+
+
+def make_page(number: int, text: str, material_id: str = "m1") -> MaterialPage:
+    return MaterialPage(material_id=material_id, page_number=number, text=text)
+
+
+class TestContextPacker:
+    def test_estimate_tokens(self):
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("가나다") == 3
+
+    def test_pack_returns_all_pages_within_budget(self):
+        pages = [make_page(number, "내용 " * 10) for number in range(1, 4)]
+
+        assert ContextPacker(token_budget=1000).pack(pages) == pages
+
+    def test_pack_respects_budget_and_covers_document(self):
+        pages = [
+            make_page(number, f"주제{number} 개념{number} 설명 " * 20)
+            for number in range(1, 31)
+        ]
+        budget = sum(estimate_tokens(page.text) for page in pages) // 3
+
+        packed = ContextPacker(token_budget=budget).pack(pages)
+        numbers = [page.page_number for page in packed]
+
+        assert sum(estimate_tokens(page.text) for page in packed) <= budget
+        assert numbers == sorted(numbers)
+        # 앞/중간/뒤 구간에서 모두 선택됨
+        assert min(numbers) <= 10 and max(numbers) > 20
+        assert any(10 < number <= 20 for number in numbers)
+
+    def test_pack_prefers_dense_pages(self):
+        pages = [
+            make_page(1, "목차 " * 200),
+            make_page(2, " ".join(f"개념{index}" for index in range(200))),
+        ]
+
+        packed = ContextPacker(token_budget=600).pack(pages)
+
+        assert [page.page_number for page in packed] == [2]
+
+    def test_used_pages(self):
+        pages = [make_page(1, "a"), make_page(3, "b"), make_page(2, "c", "m2")]
+
+        assert ContextPacker.used_pages(pages) == {"m1": [1, 3], "m2": [2]}
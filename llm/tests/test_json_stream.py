@@ -0,0 +1,33 @@
+import json
+
+from llm.services.json_stream import JSONArrayStreamParser
+
+
+def feed_all(parser: JSONArrayStreamParser, text: str, size: int):
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start : start + size]))
+    return items
+
+
+class TestJSONArrayStreamParser:
+    def test_emits_objects_as_they_close(self):
+        parser = JSONArrayStreamParser()
+
+        assert parser.feed('```json\n[{"a": 1}, {"b"') == [{"a": 1}]
+        assert parser.feed(': [1, {"c": "}"}]}') == [{"b": [1, {"c": "}"}]}]
+        assert not parser.finished
+        assert parser.feed("]\n```") == []
+        assert parser.finished
+
+    def test_handles_escapes_and_small_chunks(self):
+        items = [{"q": 'say \\"hi\\" [x] {y}'}, {"q": "한글", "n": [1, 2]}]
+        text = "서문 " + json.dumps(items, ensure_ascii=False)
+
+        assert feed_all(JSONArrayStreamParser(), text, 1) == items
+        assert feed_all(JSONArrayStreamParser(), text, 7) == items
+
+    def test_skips_malformed_elements(self):
+        parser = JSONArrayStreamParser()
+
+        assert parser.feed('[{"a": 1,}, {"b": 2}]') == [{"b": 2}]
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from llm.services.llm_governor import LLMGovernor, LLMRateLimitTimeout
+from llm.services.prompt_builder import QuizPromptBuilder
+from llm.services.quiz_generator import MaterialPage, QuizGenerator
+
+
+class FakeClock:
+    """sleep 호출 시 실제로 기다리지 않고 시간만 앞당기는 가짜 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+def make_governor(clock: FakeClock, **overrides) -> LLMGovernor:
+    params = {
+        "requests_per_minute": 60,
+        "tokens_per_minute": 10000,
+        "max_in_flight": 4,
+        "timeout": 120,
+        "clock": clock,
+        "sleep": clock.sleep,
+    }
+    params.update(overrides)
+    return LLMGovernor(**params)
+
+
+async def call(governor: LLMGovernor, tokens: int = 10, used: int = None):
+    async with governor.limit(tokens) as permit:
+        permit.used_tokens = used
+
+
+class TestLLMGovernor:
+    def test_requests_per_minute_waits(self):
+        clock = FakeClock()
+        governor = make_governor(clock, requests_per_minute=2)
+
+        async def run():
+            for _ in range(3):
+                await call(governor)
+
+        asyncio.run(run())
+
+        assert clock.now == pytest.approx(30)
+        metrics = governor.get_metrics()
+        assert metrics["requests"] == 3
+        assert metrics["throttled"] == 1
+        assert metrics["in_flight"] == 0
+
+    def test_timeout_raises(self):
+        clock = FakeClock()
+        governor = make_governor(clock, requests_per_minute=1, timeout=10)
+
+        async def run():
+            await call(governor)
+            await call(governor)
+
+        with pytest.raises(LLMRateLimitTimeout):
+            asyncio.run(run())
+        assert governor.get_metrics()["timeouts"] == 1
+
+    def test_used_tokens_are_reconciled(self):
+        clock = FakeClock()
+        governor = make_governor(clock, tokens_per_minute=1000)
+
+        async def run():
+            await call(governor, tokens=100, used=600)
+            await call(governor, tokens=500)
+
+        asyncio.run(run())
+
+        # 실제 사용량 600이 차감되어 남은 400으로는 500을 바로 쓸 수 없음
+        assert clock.now == pytest.approx(6)
+        assert governor.get_metrics()["tokens"] == 1100
+
+    def test_max_in_flight(self):
+        clock = FakeClock()
+        governor = make_governor(clock, max_in_flight=2)
+
+        async def slow_call():
+            async with governor.limit(10):
+                await clock.sleep(1)
+
+        async def run():
+            await asyncio.gather(*(slow_call() for _ in range(5)))
+
+        asyncio.run(run())
+
+        assert governor.get_metrics()["max_in_flight"] == 2
+
+    def test_quiz_generator_uses_governor(self):
+        clock = FakeClock()
+        governor = make_governor(clock, max_in_flight=1)
+        response = '[{"question": "문제", "answer": "정답"}]'
+        generator = QuizGenerator(
+            model=FakeListChatModel(responses=[response]),
+            prompt_builder=QuizPromptBuilder(system_prompt="SYSTEM"),
+            max_chunk_chars=100,
+            governor=governor,
+        )
+        pages = [
+            MaterialPage(material_id="m1", page_number=number, text="가" * 100)
+            for number in range(1, 4)
+        ]
+
+        questions = generator.generate(pages, 3)
+
+        assert len(questions) == 3
+        metrics = governor.get_metrics()
+        assert metrics["requests"] == 3
+        assert metrics["max_in_flight"] == 1
+
+    def test_records_prompt_cache_usage(self):
+        clock = FakeClock()
+        governor = make_governor(clock)
+
+        async def run():
+            async with governor.limit(100) as permit:
+                permit.record_usage(
+                    {
+                        "input_tokens": 80,
+                        "output_tokens": 20,
+                        "total_tokens": 100,
+                        "input_token_details": {"cache_read": 60},
+                    }
+                )
+
+        asyncio.run(run())
+
+        metrics = governor.get_metrics()
+        assert metrics["cached_input_tokens"] == 60
+        assert metrics["prompt_cache_hit_rate"] == 0.75
@@ -0,0 +1,170 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from llm.services.model_router import ModelRouter
+from llm.services.prompt_builder import QuizPromptBuilder
+from llm.services.quiz_generator import MaterialPage, QuizGenerator
+
+RESPONSE = '[{"question": "문제", "answer": "정답"}]'
+
+
+class SlowFakeChatModel(FakeListChatModel):
+    """첫 토큰 전에 지연이 있는 fake 모델"""
+
+    delay: float = 1.0
+
+    async def _astream(self, *args, **kwargs):
+        await asyncio.sleep(self.delay)
+        async for chunk in super()._astream(*args, **kwargs):
+            yield chunk
+
+
+class StallingFakeChatModel(FakeListChatModel):
+    """첫 토큰은 바로 보내고 stall_after 글자 뒤에 멈추는 fake 모델"""
+
+    stall_after: int = 1
+    delay: float = 1.0
+
+    async def _astream(self, *args, **kwargs):
+        sent = 0
+        async for chunk in super()._astream(*args, **kwargs):
+            if sent == self.stall_after:
+                await asyncio.sleep(self.delay)
+            sent += 1
+            yield chunk
+
+
+class FailingFakeChatModel(FakeListChatModel):
+    async def _astream(self, *args, **kwargs):
+        raise RuntimeError("provider error")
+        yield
+
+
+def make_router(models):
+    return ModelRouter(
+        routes={"easy": "small", "medium": "medium", "hard": "large"},
+        tiers=["small", "medium", "large"],
+        fallbacks={"large": "medium", "medium": "small"},
+        models=models,
+        upgrade_question_count=30,
+        upgrade_context_tokens=1000,
+    )
+
+
+def make_generator(router, total_timeout=None):
+    return QuizGenerator(
+        prompt_builder=QuizPromptBuilder(system_prompt="SYSTEM"),
+        router=router,
+        first_token_timeout=0.2,
+        total_timeout=total_timeout,
+    )
+
+
+def make_pages(length: int = 100):
+    return [MaterialPage(material_id="m1", page_number=1, text="가" * length)]
+
+
+class TestModelRouter:
+    def test_route_by_difficulty_and_size(self):
+        router = make_router(models={})
+
+        assert router.route("easy", 5, 100) == "small"
+        assert router.route("hard", 5, 100) == "large"
+        assert router.route("easy", 30, 100) == "medium"
+        assert router.route("medium", 5, 5000) == "large"
+        assert router.route("hard", 50, 5000) == "large"
+
+    def test_signature_changes_with_routes(self):
+        router = make_router(models={})
+        changed = make_router(models={})
+        changed.routes = {**changed.routes, "easy": "medium"}
+
+        assert router.signature == make_router(models={}).signature
+        assert router.signature != changed.signature
+
+    def test_falls_back_when_first_token_is_slow(self):
+        router = make_router(
+            models={
+                "large": SlowFakeChatModel(responses=[RESPONSE], delay=1.0),
+                "medium": FakeListChatModel(responses=[RESPONSE]),
+            }
+        )
+        before = ModelRouter.get_stats().get("large", {}).get("fallbacks", 0)
+
+        questions = make_generator(router).generate(make_pages(), 1, difficulty="hard")
+
+        assert len(questions) == 1
+        stats = ModelRouter.get_stats()
+        assert stats["large"]["fallbacks"] == before + 1
+        assert stats["medium"]["calls"] >= 1
+
+    def test_falls_back_on_error(self):
+        router = make_router(
+            models={
+                "medium": FailingFakeChatModel(responses=[RESPONSE]),
+                "small": FakeListChatModel(responses=[RESPONSE]),
+            }
+        )
+        before = ModelRouter.get_stats().get("medium", {})
+
+        questions = make_generator(router).generate(make_pages(), 1)
+
+        assert len(questions) == 1
+        stats = ModelRouter.get_stats()["medium"]
+        # 실패한 호출은 한 번만 기록되고, 대체는 호출 수/지연 시간 없이 표시만 됨
+        assert stats["calls"] - before.get("calls", 0) == 1
+        assert stats["errors"] - before.get("errors", 0) == 1
+        assert stats["fallbacks"] - before.get("fallbacks", 0) == 1
+        assert stats["latency_total"] > before.get("latency_total", 0.0)
+
+    def test_falls_back_when_stream_stalls_past_total_timeout(self):
+        router = make_router(
+            models={
+                "medium": StallingFakeChatModel(
+                    responses=[RESPONSE], stall_after=2, delay=1.0
+                ),
+                "small": FakeListChatModel(responses=[RESPONSE]),
+            }
+        )
+        before = ModelRouter.get_stats().get("medium", {}).get("fallbacks", 0)
+
+        started = time.monotonic()
+        questions = make_generator(router, total_timeout=0.3).generate(make_pages(), 1)
+
+        assert len(questions) == 1
+        assert time.monotonic() - started < 1.0
+        assert ModelRouter.get_stats()["medium"]["fallbacks"] == before + 1
+
+    def test_cuts_off_stalled_stream_after_emitting_questions(self):
+        response = '[{"question": "문제1", "answer": "정답"}, {"question": "문제2"'
+        router = make_router(
+            models={
+                "medium": StallingFakeChatModel(
+                    responses=[response],
+                    stall_after=response.index("},") + 1,
+                    delay=1.0,
+                ),
+                "small": FakeListChatModel(responses=[RESPONSE]),
+            }
+        )
+
+        started = time.monotonic()
+        questions = make_generator(router, total_timeout=0.3).generate(make_pages(), 2)
+
+        # 이미 전달한 문제가 중복되지 않도록 대체 모델로 넘어가지 않고 끊음
+        assert [question["question"] for question in questions] == ["문제1"]
+        assert time.monotonic() - started < 1.0
+
+    def test_raises_when_all_candidates_fail(self):
+        router = make_router(
+            models={
+                "small": FailingFakeChatModel(responses=[RESPONSE]),
+            }
+        )
+        router.fallbacks = {}
+
+        with pytest.raises(RuntimeError):
+            make_generator(router).generate(make_pages(), 1, difficulty="easy")
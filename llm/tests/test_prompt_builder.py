@@ -0,0 +1,47 @@
+from llm.services.prompt_builder import QuizPromptBuilder
+from llm.services.quiz_generator import MaterialPage
+
+
+def make_pages():
+    return [
+        MaterialPage(
+            material_id="m2", page_number=1, text="둘째 자료", material_title="B"
+        ),
+        MaterialPage(
+            material_id="m1", page_number=2, text="첫째 자료 2", material_title="A"
+        ),
+        MaterialPage(
+            material_id="m1", page_number=1, text="첫째 자료 1", material_title="A"
+        ),
+    ]
+
+
+class TestQuizPromptBuilder:
+    def test_static_prefix_and_parameters_last(self):
+        builder = QuizPromptBuilder(system_prompt="SYSTEM")
+
+        easy = builder.build(make_pages(), 3, "multiple_choice", "easy")
+        hard = builder.build(make_pages(), 7, "short_answer", "hard")
+
+        assert easy[0].content == hard[0].content == "SYSTEM"
+        easy_context, easy_request = easy[1].content.split("## REQUEST")
+        hard_context, hard_request = hard[1].content.split("## REQUEST")
+        # 요청 파라미터만 다르고 자료 컨텍스트는 동일
+        assert easy_context == hard_context
+        assert "NUM_QUESTIONS: 3" in easy_request and "DIFFICULTY: easy" in easy_request
+        assert "QUESTION_TYPE: short_answer" in hard_request
+
+    def test_context_order_is_deterministic(self):
+        pages = make_pages()
+
+        context = QuizPromptBuilder.render_context(pages)
+
+        assert context == QuizPromptBuilder.render_context(list(reversed(pages)))
+        assert context.index("첫째 자료 1") < context.index("첫째 자료 2")
+        assert context.index("첫째 자료 2") < context.index("둘째 자료")
+
+    def test_default_system_prompt_has_no_placeholders(self):
+        system_prompt = QuizPromptBuilder().system_prompt
+
+        assert "REQUEST" in system_prompt
+        assert "{data}" not in system_prompt
@@ -0,0 +1,146 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from llm.services.prompt_builder import QuizPromptBuilder
+from llm.services.quiz_generator import (
+    GenerationCancelled,
+    MaterialPage,
+    QuizChunk,
+    QuizGenerator,
+)
+
+PROMPT_BUILDER = QuizPromptBuilder(system_prompt="SYSTEM")
+
+
+def make_questions(count: int) -> str:
+    questions = [
+        {
+            "questionNumber": number,
+            "question": f"문제 {number}",
+            "answerOptions": [
+                {"text": "정답", "isCorrect": True, "rationale": "해설"},
+                {"text": "오답", "isCorrect": False, "rationale": "해설"},
+            ],
+        }
+        for number in range(1, count + 1)
+    ]
+    return f"```json\n{json.dumps(questions, ensure_ascii=False)}\n```"
+
+
+def make_pages(count: int, length: int = 100):
+    return [
+        MaterialPage(material_id="m1", page_number=number, text="가" * length)
+        for number in range(1, count + 1)
+    ]
+
+
+class SlowFakeChatModel(FakeListChatModel):
+    """호출마다 고정 지연이 있는 fake 모델"""
+
+    delay: float = 0.2
+
+    async def _astream(self, *args, **kwargs):
+        await asyncio.sleep(self.delay)
+        async for chunk in super()._astream(*args, **kwargs):
+            yield chunk
+
+
+class TestQuizGenerator:
+    def test_split_chunks_respects_max_chars(self):
+        generator = QuizGenerator(prompt_builder=PROMPT_BUILDER, max_chunk_chars=250)
+        chunks = generator.split_chunks(make_pages(5) + make_pages(1, length=600))
+
+        assert all(chunk.size <= 250 for chunk in chunks)
+        assert sum(chunk.size for chunk in chunks) == 5 * 100 + 600
+
+    def test_allocate_questions_matches_total(self):
+        chunks = [
+            QuizChunk(pages=make_pages(1, length=length))
+            for length in (300, 100, 100, 50)
+        ]
+        QuizGenerator.allocate_questions(chunks, 7)
+
+        assert sum(chunk.question_count for chunk in chunks) == 7
+        assert chunks[0].question_count >= chunks[1].question_count
+
+    def test_generate_merges_and_renumbers(self):
+        model = FakeListChatModel(responses=[make_questions(2)])
+        generator = QuizGenerator(
+            model=model, prompt_builder=PROMPT_BUILDER, max_chunk_chars=100
+        )
+
+        questions = generator.generate(make_pages(3), 6)
+
+        assert len(questions) == 6
+        assert [q["questionNumber"] for q in questions] == [1, 2, 3, 4, 5, 6]
+
+    def test_generate_runs_chunks_concurrently(self):
+        model = SlowFakeChatModel(responses=[make_questions(5)], delay=0.2)
+        generator = QuizGenerator(
+            model=model,
+            prompt_builder=PROMPT_BUILDER,
+            max_chunk_chars=100,
+            max_concurrency=10,
+        )
+
+        started = time.perf_counter()
+        questions = generator.generate(make_pages(10), 50)
+        elapsed = time.perf_counter() - started
+
+        assert len(questions) == 50
+        # 10개 청크가 순차 실행되면 2초 이상 걸림
+        assert elapsed < 1.0
+
+    def test_generate_skips_invalid_questions(self):
+        invalid = json.loads(make_questions(1).strip("`json\n"))[0]
+        invalid["answerOptions"][1]["isCorrect"] = True
+        response = json.dumps(
+            [invalid] + json.loads(make_questions(2).strip("`json\n"))
+        )
+        model = FakeListChatModel(responses=[response])
+        generator = QuizGenerator(model=model, prompt_builder=PROMPT_BUILDER)
+
+        questions = generator.generate(make_pages(1), 3)
+
+        assert [q["question"] for q in questions] == ["문제 1", "문제 2"]
+
+    def test_iter_questions_yields_before_completion(self):
+        model = SlowFakeChatModel(
+            responses=[make_questions(1), make_questions(1)], delay=0.3
+        )
+        generator = QuizGenerator(
+            model=model,
+            prompt_builder=PROMPT_BUILDER,
+            max_chunk_chars=100,
+            max_concurrency=1,
+        )
+
+        started = time.perf_counter()
+        iterator = generator.iter_questions(make_pages(2), 2)
+        first = next(iterator)
+        first_elapsed = time.perf_counter() - started
+
+        assert first["questionNumber"] == 1
+        # 두 번째 청크를 기다리지 않고 첫 문제를 받음
+        assert first_elapsed < 0.55
+        assert [q["questionNumber"] for q in iterator] == [2]
+
+    def test_cancel_event_aborts_outstanding_calls(self):
+        model = SlowFakeChatModel(responses=[make_questions(1)], delay=2.0)
+        generator = QuizGenerator(
+            model=model, prompt_builder=PROMPT_BUILDER, max_chunk_chars=100
+        )
+        cancel_event = threading.Event()
+        threading.Timer(0.1, cancel_event.set).start()
+
+        started = time.perf_counter()
+        with pytest.raises(GenerationCancelled):
+            list(generator.iter_questions(make_pages(3), 3, cancel_event=cancel_event))
+
+        assert time.perf_counter() - started < 1.0
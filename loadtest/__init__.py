@@ -0,0 +1,6 @@
+"""
+오프라인 부하 테스트 도구
+
+S3, Playwright, Firebase, LLM 대신 fake 백엔드를 사용하여 앱 전체 경로(미들웨어, 인증, DB)의
+처리량과 응답 시간을 측정합니다. 실행 방법은 loadtest/__main__.py 참고.
+"""
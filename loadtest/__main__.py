@@ -0,0 +1,177 @@
+"""
+오프라인 부하 테스트 실행
+
+    python -m loadtest --concurrency 16 --duration 60
+
+외부 서비스 없이 앱을 띄우고 (loadtest.fakes), 테스트 DB를 새로 만들어
+가상 사용자 트래픽(loadtest.scenario)을 발생시킨 뒤 엔드포인트별 처리량과
+p50/p95/p99 응답 시간을 출력합니다. DB는 DJANGO_SETTINGS_MODULE 설정을 따르며,
+동시 쓰기가 많으므로 PostgreSQL 설정(config.settings.dev 등)에서 실행하는 것을 권장합니다.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest", description="오프라인 부하 테스트"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="동시 가상 사용자 수"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=30.0, help="트래픽 발생 시간 (초)"
+    )
+    parser.add_argument(
+        "--question-count", type=int, default=5, help="퀴즈 생성 요청당 문제 수"
+    )
+    parser.add_argument(
+        "--llm-latency",
+        type=float,
+        default=0.5,
+        help="fake LLM 첫 토큰 지연 (초)",
+    )
+    parser.add_argument(
+        "--llm-chunk-latency",
+        type=float,
+        default=0.02,
+        help="fake LLM 스트리밍 chunk 간격 (초)",
+    )
+    parser.add_argument(
+        "--page-latency",
+        type=float,
+        default=0.0,
+        help="fake 웹페이지 캡처/본문 추출 지연 (초)",
+    )
+    parser.add_argument(
+        "--poll-interval", type=float, default=0.5, help="퀴즈 상태 polling 간격 (초)"
+    )
+    parser.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=30.0,
+        help="종료 전 진행 중인 퀴즈 생성을 기다리는 최대 시간 (초)",
+    )
+    parser.add_argument("--json", dest="json_path", help="요약 결과를 저장할 JSON 경로")
+    return parser.parse_args(argv)
+
+
+def drain(timeout: float) -> None:
+    """
+    테스트 DB 삭제 전 백그라운드 작업 정리
+
+    진행 중인 퀴즈 생성이 끝나기를 timeout까지 기다린 뒤, PostgreSQL이면
+    문제 풀 워커 등 남아 있는 다른 DB 세션을 종료합니다 (세션이 있으면 DB를 지울 수 없음).
+    """
+    from django.db import connection
+
+    from api.quiz.models import Quiz, QuizStatus
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not Quiz.objects.filter(
+            status__in=[QuizStatus.PENDING, QuizStatus.PROCESSING]
+        ).exists():
+            break
+        time.sleep(0.5)
+
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                "WHERE datname = current_database() AND pid <> pg_backend_pid()"
+            )
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    from loadtest.fakes import FakeFirebase
+
+    # 첫 로그인 때 settings.FIREBASE_CREDENTIAL_DIR로 Firebase Admin SDK를 초기화하므로,
+    # settings를 읽기 전(django.setup() 전)에 fake 서비스 계정 파일을 만들어 둠
+    # (ID 토큰도 같은 키로 발급/검증)
+    firebase = FakeFirebase()
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".json", delete=False
+    ) as credential_file:
+        json.dump(firebase.service_account(), credential_file)
+    os.environ["FIREBASE_CREDENTIAL_DIR"] = credential_file.name
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+
+    import django
+
+    django.setup()
+
+    from django.conf import settings
+    from django.test.utils import (
+        setup_databases,
+        setup_test_environment,
+        teardown_databases,
+        teardown_test_environment,
+    )
+
+    from loadtest.fakes import fake_backends
+    from loadtest.report import LatencyRecorder, format_report
+    from loadtest.scenario import TrafficConfig, VirtualUser, build_sample_pdf
+
+    # 복제 DB가 설정되어 있으면 같은 테스트 DB를 읽도록 기본 DB의 mirror로 설정
+    # (따로 만들면 복제가 없어 읽기 요청이 빈 DB를 조회함)
+    if settings.DATABASE_REPLICA_ALIAS:
+        settings.DATABASES[settings.DATABASE_REPLICA_ALIAS].setdefault("TEST", {})[
+            "MIRROR"
+        ] = "default"
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=1, interactive=False)
+    try:
+        with fake_backends(
+            firebase,
+            llm_first_token_latency=args.llm_latency,
+            llm_chunk_latency=args.llm_chunk_latency,
+            page_latency=args.page_latency,
+        ):
+            recorder = LatencyRecorder()
+            config = TrafficConfig(
+                question_count=args.question_count, poll_interval=args.poll_interval
+            )
+            sample_pdf = build_sample_pdf()
+            users = [
+                VirtualUser(index, firebase, recorder, config, sample_pdf)
+                for index in range(args.concurrency)
+            ]
+
+            started = time.monotonic()
+            deadline = started + args.duration
+            threads = [
+                threading.Thread(target=user.run, args=(deadline,), daemon=True)
+                for user in users
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.monotonic() - started
+
+            rows = recorder.summarize(elapsed)
+            print(format_report(rows, elapsed))
+            if args.json_path:
+                with open(args.json_path, "w") as output:
+                    json.dump({"elapsed": elapsed, "endpoints": rows}, output, indent=2)
+
+            drain(args.drain_timeout)
+    finally:
+        teardown_databases(old_config, verbosity=1)
+        teardown_test_environment()
+        os.unlink(credential_file.name)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
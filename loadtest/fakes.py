@@ -0,0 +1,279 @@
+import asyncio
+import io
+import json
+import re
+import threading
+import time
+import uuid
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+from unittest import mock
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessageChunk
+from langchain_core.outputs import ChatGenerationChunk
+
+# 가짜 저장소 URL 도메인 (실제 S3 대신 메모리에 저장)
+FAKE_STORAGE_DOMAIN = "https://fake-storage.loadtest"
+# 가짜 Firebase 프로젝트 ID (ID 토큰 aud/iss 검증용)
+FAKE_FIREBASE_PROJECT_ID = "talkter-loadtest"
+
+_REQUEST_COUNT_RE = re.compile(r"NUM_QUESTIONS:\s*(\d+)")
+_REQUEST_TYPE_RE = re.compile(r"QUESTION_TYPE:\s*(\w+)")
+
+
+class InMemoryStorage:
+    """S3 대신 사용하는 메모리 저장소 (URL → 바이트)"""
+
+    def __init__(self):
+        self._objects: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def put(self, key: str, data: bytes) -> str:
+        url = f"{FAKE_STORAGE_DOMAIN}/{key}"
+        with self._lock:
+            self._objects[url] = data
+        return url
+
+    def get(self, url: str) -> Optional[bytes]:
+        with self._lock:
+            return self._objects.get(url)
+
+    def upload(self, file_id, file, prefix, file_name) -> Tuple[str, str]:
+        """S3UploadUtil.upload 대체"""
+        key = f"{prefix.value}/{file_id}/{file_name.replace(' ', '_')}"
+        file.seek(0)
+        return key, self.put(key, file.read())
+
+    def upload_bytes(
+        self, file_id, file_data, prefix, file_name, content_type=None
+    ) -> Tuple[str, str]:
+        """S3UploadUtil.upload_bytes 대체"""
+        key = f"{prefix.value}/{file_id}/{file_name.replace(' ', '_')}"
+        return key, self.put(key, file_data)
+
+
+@dataclass
+class FakePageCapturer:
+    """Playwright 스크린샷과 웹페이지 요청 대신 고정된 제목/본문/이미지를 반환"""
+
+    latency: float = 0.0
+    text: str = (
+        "머신러닝은 데이터에서 규칙을 학습하는 방법입니다.\n"
+        "지도 학습은 정답이 있는 데이터로 모델을 학습합니다.\n"
+        "비지도 학습은 정답 없이 데이터의 구조를 찾습니다."
+    )
+    # 업로드만 하고 읽지 않으므로 PNG 시그니처만 있는 더미 이미지
+    screenshot: bytes = b"\x89PNG\r\n\x1a\n"
+
+    def get_page_info(self, url: str) -> Tuple[str, Optional[io.BytesIO]]:
+        time.sleep(self.latency)
+        return f"페이지 {url.rsplit('/', 1)[-1] or url}", io.BytesIO(self.screenshot)
+
+    def extract_text(self, url: str, timeout: int = 10) -> str:
+        time.sleep(self.latency)
+        return self.text
+
+
+def canned_questions(question_count: int, question_type: str) -> List[dict]:
+    """요청한 수/유형만큼 create_quizzes 프롬프트 형식의 문제 생성"""
+    questions = []
+    for number in range(1, question_count + 1):
+        multiple_choice = question_type == "multiple_choice" or (
+            question_type == "mixed" and number % 2
+        )
+        question = {"questionNumber": number, "question": f"부하 테스트 문제 {number}"}
+        if multiple_choice:
+            question["answerOptions"] = [
+                {"text": f"선택지 {option}", "isCorrect": option == 1, "rationale": ""}
+                for option in range(1, 5)
+            ]
+        else:
+            question["answer"] = "정답"
+        questions.append(question)
+    return questions
+
+
+class CannedLatencyChatModel(FakeListChatModel):
+    """
+    지연 시간을 흉내 내는 fake 채팅 모델
+
+    첫 토큰까지 first_token_latency만큼 기다린 뒤 chunk_size 글자씩 chunk_latency 간격으로
+    스트리밍합니다. 퀴즈 생성 요청("## REQUEST")에는 요청한 수/유형의 문제를,
+    채점 요청("## ANSWERS")에는 모든 답안을 정답으로 응답합니다.
+    """
+
+    responses: List[str] = ["[]"]
+    first_token_latency: float = 0.5
+    chunk_latency: float = 0.02
+    chunk_size: int = 64
+
+    @property
+    def _llm_type(self) -> str:
+        return "canned-latency-fake-chat-model"
+
+    @staticmethod
+    def render(messages) -> str:
+        """마지막 메시지 내용으로 응답 생성"""
+        prompt = str(messages[-1].content) if messages else ""
+        if "## ANSWERS" in prompt:
+            answers = json.loads(prompt.split("## ANSWERS", 1)[1])
+            return json.dumps(
+                [{"id": answer["id"], "isCorrect": True} for answer in answers]
+            )
+
+        count = _REQUEST_COUNT_RE.search(prompt)
+        question_type = _REQUEST_TYPE_RE.search(prompt)
+        return json.dumps(
+            canned_questions(
+                int(count.group(1)) if count else 5,
+                question_type.group(1) if question_type else "multiple_choice",
+            ),
+            ensure_ascii=False,
+        )
+
+    def _call(self, messages, stop=None, run_manager=None, **kwargs) -> str:
+        time.sleep(self.first_token_latency)
+        return self.render(messages)
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.first_token_latency)
+        text = self.render(messages)
+        for start in range(0, len(text), self.chunk_size):
+            if start:
+                time.sleep(self.chunk_latency)
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(content=text[start : start + self.chunk_size])
+            )
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.first_token_latency)
+        text = self.render(messages)
+        for start in range(0, len(text), self.chunk_size):
+            if start:
+                await asyncio.sleep(self.chunk_latency)
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(content=text[start : start + self.chunk_size])
+            )
+
+
+class FakeFirebase:
+    """
+    Firebase 대체 (로컬에서 만든 RSA 키로 ID 토큰 발급/검증)
+
+    Firebase Admin SDK를 초기화할 때 필요한 서비스 계정 파일도 같은 키로 만듭니다.
+    """
+
+    def __init__(self, project_id: str = FAKE_FIREBASE_PROJECT_ID):
+        self.project_id = project_id
+        self._private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+        self._public_key = self._private_key.public_key()
+
+    def service_account(self) -> dict:
+        """firebase_admin.credentials.Certificate로 읽을 수 있는 서비스 계정 정보"""
+        private_key = self._private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        ).decode()
+        return {
+            "type": "service_account",
+            "project_id": self.project_id,
+            "private_key_id": uuid.uuid4().hex,
+            "private_key": private_key,
+            "client_email": f"loadtest@{self.project_id}.iam.gserviceaccount.com",
+            "client_id": "0",
+            "token_uri": "https://oauth2.googleapis.com/token",
+        }
+
+    def mint_id_token(self, uid: str, email: str = "", name: str = "") -> str:
+        """Firebase ID 토큰 형식의 JWT 발급"""
+        now = int(time.time())
+        return jwt.encode(
+            {
+                "iss": f"https://securetoken.google.com/{self.project_id}",
+                "aud": self.project_id,
+                "sub": uid,
+                "uid": uid,
+                "email": email,
+                "name": name,
+                "iat": now,
+                "exp": now + 3600,
+                "firebase": {"sign_in_provider": "loadtest"},
+            },
+            self._private_key,
+            algorithm="RS256",
+        )
+
+    def verify_id_token(self, id_token: str, check_revoked=False, **kwargs) -> dict:
+        """firebase_admin.auth.verify_id_token 대체"""
+        return jwt.decode(
+            id_token,
+            self._public_key,
+            algorithms=["RS256"],
+            audience=self.project_id,
+            leeway=kwargs.get("clock_skew_seconds", 0),
+        )
+
+
+@dataclass
+class FakeBackends:
+    """부하 테스트 중 외부 서비스 대신 사용하는 fake 객체 모음"""
+
+    storage: InMemoryStorage
+    page_capturer: FakePageCapturer
+    chat_model: CannedLatencyChatModel
+    firebase: FakeFirebase
+
+
+@contextmanager
+def fake_backends(
+    firebase: FakeFirebase,
+    llm_first_token_latency: float = 0.5,
+    llm_chunk_latency: float = 0.02,
+    page_latency: float = 0.0,
+) -> Iterator[FakeBackends]:
+    """
+    S3, Playwright/웹 요청, LLM, Firebase 호출을 fake로 바꾸는 컨텍스트
+
+    django.setup() 이후에 사용해야 합니다 (앱 모듈의 클래스를 직접 교체).
+    """
+    from common.utils.pdf_utils import PDFUtils
+    from common.utils.s3_utils import S3UploadUtil
+    from common.utils.web_utils import WebUtils
+    from llm.services.llm_core import LLMCore
+
+    backends = FakeBackends(
+        storage=InMemoryStorage(),
+        page_capturer=FakePageCapturer(latency=page_latency),
+        chat_model=CannedLatencyChatModel(
+            first_token_latency=llm_first_token_latency,
+            chunk_latency=llm_chunk_latency,
+        ),
+        firebase=firebase,
+    )
+
+    def extract_pdf_text_from_url(url: str, timeout: int = 30) -> str:
+        data = backends.storage.get(url)
+        return PDFUtils.extract_text_from_bytes(data) if data else ""
+
+    with ExitStack() as stack:
+        for target, attribute, replacement in [
+            (S3UploadUtil, "upload", backends.storage.upload),
+            (S3UploadUtil, "upload_bytes", backends.storage.upload_bytes),
+            (WebUtils, "get_page_info", backends.page_capturer.get_page_info),
+            (WebUtils, "extract_text", backends.page_capturer.extract_text),
+            (PDFUtils, "extract_text_from_url", extract_pdf_text_from_url),
+            (LLMCore, "get_model", lambda self, model_name: backends.chat_model),
+        ]:
+            stack.enter_context(mock.patch.object(target, attribute, replacement))
+        stack.enter_context(
+            mock.patch("firebase_admin.auth.verify_id_token", firebase.verify_id_token)
+        )
+        yield backends
@@ -0,0 +1,81 @@
+import math
+import threading
+from collections import defaultdict
+from typing import Dict, List
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """정렬된 값 목록의 백분위수 (nearest-rank, 값이 없으면 0)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class LatencyRecorder:
+    """엔드포인트별 응답 시간과 실패 수 기록 (여러 스레드에서 호출)"""
+
+    def __init__(self):
+        self._latencies: Dict[str, List[float]] = defaultdict(list)
+        self._errors: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float, ok: bool = True) -> None:
+        with self._lock:
+            self._latencies[endpoint].append(seconds)
+            if not ok:
+                self._errors[endpoint] += 1
+
+    def summarize(self, elapsed: float) -> List[dict]:
+        """
+        엔드포인트별 요약
+
+        Args:
+            elapsed: 부하 테스트 전체 실행 시간 (초, 처리량 계산용)
+
+        Returns:
+            [{"endpoint", "requests", "errors", "throughput", "p50", "p95", "p99"}, ...]
+            (지연 시간은 ms, 요청 수가 많은 순)
+        """
+        with self._lock:
+            latencies = {key: sorted(values) for key, values in self._latencies.items()}
+            errors = dict(self._errors)
+
+        rows = []
+        for endpoint, values in latencies.items():
+            rows.append(
+                {
+                    "endpoint": endpoint,
+                    "requests": len(values),
+                    "errors": errors.get(endpoint, 0),
+                    "throughput": len(values) / elapsed if elapsed else 0.0,
+                    "p50": percentile(values, 50) * 1000,
+                    "p95": percentile(values, 95) * 1000,
+                    "p99": percentile(values, 99) * 1000,
+                }
+            )
+        return sorted(rows, key=lambda row: (-row["requests"], row["endpoint"]))
+
+
+def format_report(rows: List[dict], elapsed: float) -> str:
+    """요약 결과를 표 형태 문자열로 변환"""
+    header = (
+        f"{'endpoint':<40} {'requests':>9} {'errors':>7} {'req/s':>8} "
+        f"{'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['endpoint']:<40} {row['requests']:>9} {row['errors']:>7} "
+            f"{row['throughput']:>8.2f} {row['p50']:>9.1f} {row['p95']:>9.1f} "
+            f"{row['p99']:>9.1f}"
+        )
+
+    total = sum(row["requests"] for row in rows)
+    errors = sum(row["errors"] for row in rows)
+    lines.append("-" * len(header))
+    lines.append(
+        f"total {total} requests, {errors} errors in {elapsed:.1f}s "
+        f"({total / elapsed if elapsed else 0:.2f} req/s)"
+    )
+    return "\n".join(lines)
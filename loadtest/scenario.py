@@ -0,0 +1,221 @@
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import fitz
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import Client
+
+from loadtest.fakes import FakeFirebase
+from loadtest.report import LatencyRecorder
+
+# 가상 사용자가 매 반복마다 고르는 행동의 가중치
+ACTION_WEIGHTS = {
+    "list_projects": 4,
+    "list_materials": 4,
+    "upload_material": 1,
+    "generate_quiz": 1,
+    "submit_answers": 2,
+}
+
+# 퀴즈 생성 완료/실패/취소 상태
+FINISHED_QUIZ_STATUSES = {"completed", "failed", "cancelled"}
+
+
+def build_sample_pdf(page_count: int = 3) -> bytes:
+    """업로드용 샘플 PDF (페이지마다 짧은 본문)"""
+    document = fitz.open()
+    for number in range(1, page_count + 1):
+        page = document.new_page()
+        page.insert_text(
+            (72, 72), f"Load test page {number}: supervised and unsupervised learning."
+        )
+    data = document.tobytes()
+    document.close()
+    return data
+
+
+@dataclass
+class TrafficConfig:
+    """가상 사용자 트래픽 설정"""
+
+    question_count: int = 5
+    poll_interval: float = 0.5
+    max_polls: int = 60
+    weights: Dict[str, int] = field(default_factory=lambda: dict(ACTION_WEIGHTS))
+
+
+class VirtualUser:
+    """
+    가상 사용자 한 명의 트래픽 (in-process Django 테스트 클라이언트 사용)
+
+    로그인(로컬에서 발급한 Firebase ID 토큰) → 프로젝트 생성 후, 마감 시각까지
+    가중치에 따라 목록 조회, 자료 업로드, 퀴즈 생성(상태 polling 포함), 답안 제출을 반복합니다.
+    각 요청은 URL 패턴 이름(예: "GET /projects/{id}/materials")으로 기록합니다.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        firebase: FakeFirebase,
+        recorder: LatencyRecorder,
+        config: TrafficConfig,
+        sample_pdf: bytes,
+    ):
+        self.index = index
+        self.firebase = firebase
+        self.recorder = recorder
+        self.config = config
+        self.sample_pdf = sample_pdf
+        # 서버 오류도 예외 대신 500 응답으로 기록
+        self.client = Client(raise_request_exception=False)
+        self.random = random.Random(index)
+        self.project_id: Optional[int] = None
+        self.material_ids: List[str] = []
+        self.quiz_ids: List[str] = []
+
+    def request(self, method: str, endpoint: str, path: str, **kwargs):
+        """요청 실행 및 응답 시간 기록 (endpoint: 기록용 이름)"""
+        started = time.perf_counter()
+        response = getattr(self.client, method)(path, **kwargs)
+        self.recorder.record(
+            f"{method.upper()} {endpoint}",
+            time.perf_counter() - started,
+            ok=response.status_code < 400,
+        )
+        return response
+
+    def run(self, deadline: float) -> None:
+        """마감 시각(time.monotonic 기준)까지 트래픽 발생"""
+        try:
+            self.login()
+            response = self.request(
+                "post",
+                "/projects",
+                "/projects",
+                data={"name": f"부하 테스트 {self.index}"},
+                content_type="application/json",
+            )
+            self.project_id = response.json()["id"]
+            self.upload_material()
+
+            actions = list(self.config.weights)
+            weights = [self.config.weights[action] for action in actions]
+            while time.monotonic() < deadline:
+                action = self.random.choices(actions, weights)[0]
+                getattr(self, action)()
+        finally:
+            # 스레드마다 열린 DB 연결 정리
+            connection.close()
+
+    def login(self) -> None:
+        id_token = self.firebase.mint_id_token(
+            uid=f"loadtest-{self.index}", email=f"loadtest-{self.index}@example.com"
+        )
+        response = self.request(
+            "post",
+            "/users/{provider}/login",
+            "/users/google/login",
+            data={"id_token": id_token},
+            content_type="application/json",
+        )
+        access_token = response.json()["access_token"]
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {access_token}"
+
+    def list_projects(self) -> None:
+        self.request("get", "/projects", "/projects")
+
+    def list_materials(self) -> None:
+        self.request(
+            "get",
+            "/projects/{id}/materials",
+            f"/projects/{self.project_id}/materials",
+        )
+
+    def upload_material(self) -> None:
+        # 파일(PDF)과 URL 자료를 번갈아 업로드
+        if len(self.material_ids) % 2 == 0:
+            data = {
+                "material_type": "file",
+                "file": SimpleUploadedFile(
+                    f"notes-{len(self.material_ids)}.pdf",
+                    self.sample_pdf,
+                    content_type="application/pdf",
+                ),
+            }
+            kwargs = {"data": data}
+        else:
+            data = {"material_type": "url", "url": "https://example.com/article"}
+            kwargs = {"data": data, "content_type": "application/json"}
+
+        response = self.request(
+            "post",
+            "/projects/{id}/materials",
+            f"/projects/{self.project_id}/materials",
+            **kwargs,
+        )
+        if response.status_code < 400:
+            self.material_ids.append(response.json()["id"])
+
+    def generate_quiz(self) -> None:
+        if not self.material_ids:
+            self.upload_material()
+            return
+
+        material_ids = self.random.sample(
+            self.material_ids, min(2, len(self.material_ids))
+        )
+        response = self.request(
+            "post",
+            "/quizzes",
+            f"/quizzes?project_id={self.project_id}",
+            data={
+                "material_ids": material_ids,
+                "question_count": self.config.question_count,
+                "difficulty": self.random.choice(["easy", "medium", "hard"]),
+            },
+            content_type="application/json",
+        )
+        if response.status_code >= 400:
+            return
+
+        quiz_id = response.json()["id"]
+        quiz_status = response.json()["status"]
+        for _ in range(self.config.max_polls):
+            if quiz_status in FINISHED_QUIZ_STATUSES:
+                break
+            time.sleep(self.config.poll_interval)
+            quiz_status = self.request(
+                "get", "/quizzes/{id}/status", f"/quizzes/{quiz_id}/status"
+            ).json()["status"]
+
+        if quiz_status == "completed":
+            self.quiz_ids.append(quiz_id)
+
+    def submit_answers(self) -> None:
+        if not self.quiz_ids:
+            self.generate_quiz()
+            return
+
+        quiz_id = self.random.choice(self.quiz_ids)
+        questions = self.request("get", "/quizzes/{id}", f"/quizzes/{quiz_id}").json()[
+            "questions"
+        ]
+        self.request(
+            "post",
+            "/quizzes/{id}/submit-answers",
+            f"/quizzes/{quiz_id}/submit-answers",
+            data={
+                "answers": [
+                    {
+                        "question_id": question["id"],
+                        "answer": str(self.random.randint(1, 4)),
+                        "time_spent_seconds": self.random.randint(5, 60),
+                    }
+                    for question in questions
+                ]
+            },
+            content_type="application/json",
+        )
@@ -0,0 +1,64 @@
+from llm.services.answer_grader import AnswerGrader, GradingItem
+from llm.services.model_router import ModelRouter
+from llm.services.prompt_builder import QuizPromptBuilder
+from llm.services.quiz_generator import MaterialPage, QuizGenerator
+from loadtest.fakes import CannedLatencyChatModel, FakeFirebase
+from loadtest.report import LatencyRecorder, percentile
+
+
+def make_model():
+    return CannedLatencyChatModel(first_token_latency=0.0, chunk_latency=0.0)
+
+
+def test_canned_model_streams_requested_questions():
+    generator = QuizGenerator(
+        prompt_builder=QuizPromptBuilder(system_prompt="SYSTEM"),
+        router=ModelRouter(
+            models={"m": make_model()},
+            routes={"easy": "m", "medium": "m", "hard": "m"},
+            tiers=["m"],
+            fallbacks={},
+        ),
+    )
+    pages = [MaterialPage(material_id="m1", page_number=1, text="본문")]
+
+    questions = generator.generate(pages, 3, question_type="mixed")
+
+    assert len(questions) == 3
+    assert "answerOptions" in questions[0]
+    assert "answer" in questions[1]
+
+
+def test_canned_model_grades_every_answer():
+    items = [GradingItem(question="문제", expected="정답", answer="답")] * 2
+    grader = AnswerGrader(model=make_model(), system_prompt="채점")
+
+    assert grader.grade(items) == [True, True]
+
+
+def test_fake_firebase_token_round_trip():
+    firebase = FakeFirebase()
+    token = firebase.mint_id_token(uid="user-1", email="a@example.com")
+
+    decoded = firebase.verify_id_token(token, check_revoked=False)
+
+    assert decoded["uid"] == "user-1"
+    assert decoded["email"] == "a@example.com"
+
+
+def test_percentiles_and_summary():
+    assert percentile([], 50) == 0.0
+    assert percentile([1, 2, 3, 4], 50) == 2
+    assert percentile([1, 2, 3, 4], 99) == 4
+
+    recorder = LatencyRecorder()
+    for seconds in [0.1, 0.2, 0.3]:
+        recorder.record("GET /projects", seconds)
+    recorder.record("POST /quizzes", 0.5, ok=False)
+
+    rows = recorder.summarize(elapsed=2.0)
+
+    assert rows[0]["endpoint"] == "GET /projects"
+    assert rows[0]["throughput"] == 1.5
+    assert rows[0]["p50"] == 200.0
+    assert rows[1]["errors"] == 1